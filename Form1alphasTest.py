@@ -1,9 +1,7 @@
 import numpy as np
-import pandas as pd
-import gurobipy as gp
-from gurobipy import GRB
-import seaborn as sns
-import matplotlib.pyplot as plt
+
+from model_builder import FORM1
+from parametric import ParametricModel
 
 
 # ===========================================================
@@ -77,142 +75,31 @@ def run_simulation(scenario_considered, p_RE : dict[float]):
     excess_matrix = np.zeros((len(lambda_vec), len(alpha_vec)))  # total excess production
     startup_counts_matrix = np.full((len(lambda_vec), len(alpha_vec)), None, dtype=object)
 
+    # -------------------------------
+    # MODEL INITIALIZATION (Form1 formulation), built once per scenario:
+    # only the RHS of Demand_t/Excess_t (through a * p_RE[t]) and the
+    # objective coefficient of s[t] (lam) change between sweep points.
+    # -------------------------------
+    params = {"q": q, "Q": Q, "L": L, "l": l, "c_SU": c_SU, "c_NL": c_NL,
+              "c_var": c_var, "U1": U1, "U0": U0}
+    model = ParametricModel(FORM1, params, d, p_RE)
+
     for a in alpha_vec:
+        model.set_alpha(a)
         for lam in lambda_vec:
             i_lambda = lambda_vec.index(lam)
             i_alpha = alpha_vec.index(a)
-            # -------------------------------
-            # MODEL INITIALIZATION (Form1 formulation)
-            # -------------------------------
-            model = gp.Model("PlantScheduling_Form1")
-            model.setParam('MIPGap', 0.0)
-            model.setParam('MIPGapAbs', 0.0)
-            model.setParam('OutputFlag', 0)  # Suppress output
-            
-            # -------------------------------
-            # DECISION VARIABLES
-            # -------------------------------
-            # u[t,i]: Binary variable, 1 if plant i is on at time t.
-            u = model.addVars(time_periods, plants, vtype=GRB.BINARY, name="u")
-            # o[t,i]: Binary variable, 1 if plant i is started up at time t.
-            o = model.addVars(time_periods, plants, vtype=GRB.BINARY, name="o")
-            # x[t,i]: Continuous production level of plant i at time t.
-            x = model.addVars(time_periods, plants, vtype=GRB.CONTINUOUS, lb=0, name="x")
-            # s[t]: Continuous excess production at time t.
-            s = model.addVars(time_periods, vtype=GRB.CONTINUOUS, lb=0, name="s")
-            
-            # -------------------------------
-            # OBJECTIVE FUNCTION
-            # -------------------------------
-            # Minimize total cost = production cost + fixed operating cost + startup cost + lambda*excess
-            model.setObjective(
-                gp.quicksum(x[t,i]*c_var[i] + u[t,i]*c_NL[i] + o[t,i]*c_SU[i] 
-                            for t in time_periods for i in plants)
-                + gp.quicksum(lam * s[t] for t in time_periods),
-                GRB.MINIMIZE
-            )
-            
-            # -------------------------------
-            # CONSTRAINTS
-            # -------------------------------
-            # (1) Demand Constraint with renewable adjustment:
-            # Production from plants plus renewable production (α·p_RE[t]) must meet demand.
-            for t in time_periods:
-                model.addConstr(gp.quicksum(x[t,i] for i in plants) + a * p_RE[t] >= d[t],
-                                name=f"Demand_t{t}")
-            
-            # (2) Production Lower Bound: if plant i is on, x[t,i] ≥ q[i]
-            for t in time_periods:
-                for i in plants:
-                    model.addConstr(x[t,i] >= q[i] * u[t,i],
-                                    name=f"MinProd_t{t}_Plant{i}")
-                    # (3) Production Upper Bound: if plant is on, x[t,i] ≤ Q[i]
-                    model.addConstr(x[t,i] <= Q[i] * u[t,i],
-                                    name=f"MaxProd_t{t}_Plant{i}")
-            
-           
-            # (4) Minimum Up Time (Initial Condition):
-            #    For each plant i, if it was already on at t=0 (u0), then it must remain on for at least max{L_i - U1[i],0} periods.
-            for i in plants:
-                max_tau = max(L[i] - U1[i], 0)
-                # Here, we enforce the condition for time periods 1 up to max_tau.
-                for tau in range(1, max_tau+1):
-                    # u0[i] is given (parameter) so: if u0[i]==1 then u[tau,i] must be 1.
-                    model.addConstr(u0[i] <= u[tau,i],
-                                    name=f"MinUpInit_p{i}_tau{tau}")
-
-            # (5) Minimum Up Time after startup:
-            #    For t from max{l_i - U0[i],0}+1 to T, if plant i is turned on at t (i.e., u[t]-u[t-1] = 1),
-            #    then it must remain on for L_i consecutive periods.
-            for i in plants:
-                start_t = max(l[i] - U0[i], 0) + 1
-                for t in range(start_t, T+1):
-                    # Loop over the next periods tau from t+1 to min{t - 1 + L_i, T}.
-                    end_tau = min(t - 1 + L[i], T)
-                    for tau in range(t+1, end_tau+1):
-                        # If a startup occurs at time t, then u[tau,i] must be 1.
-                        model.addConstr(u[t,i] - (u[t-1,i] if t > 1 else u0[i]) <= u[tau,i],
-                                        name=f"MinUp_p{i}_t{t}_tau{tau}")
-
-            # (6) Minimum Down Time (Initial Condition):
-            #    For each plant i, if it was off at t=0 then it must remain off for at least max{l_i - U0[i],0} periods.
-            for i in plants:
-                max_tau = max(l[i] - U0[i], 0)
-                for tau in range(1, max_tau+1):
-                    model.addConstr(1 - u0[i] <= 1 - u[tau,i],
-                                    name=f"MinDownInit_p{i}_tau{tau}")
-
-            # (7) Minimum Down Time after shutdown:
-            #    For t from max{L_i - U1[i],0}+1 to T, if plant i shuts down (i.e., u[t-1]-u[t] = 1),
-            #    then it must remain off for l_i consecutive periods.
-            for i in plants:
-                start_t = max(L[i] - U1[i], 0) + 1
-                for t in range(start_t, T+1):
-                    end_tau = min(t - 1 + l[i], T)
-                    for tau in range(t+1, end_tau+1):
-                        model.addConstr((u[t-1,i] if t > 1 else u0[i]) - u[t,i] <= 1 - u[tau,i],
-                                        name=f"MinDown_p{i}_t{t}_tau{tau}")
-
-            # (9) Logical Constraints for Startup Decision:
-            #     a. -o[t,i] <= u[t-1,i] - u[t,i]: Ensures o[t,i] captures the startup (transition from off to on)
-            for t in time_periods:
-                for i in plants:
-                    # For t=1, use the initial state u0[i].
-                    prev_u = u0[i] if t == 1 else u[t-1,i]
-                    model.addConstr(-o[t,i] <= prev_u - u[t,i],
-                                    name=f"StartupLogic1_t{t}_p{i}")
-
-            # (10) o[t,i] <= u[t,i]: A plant can only be started if it is on.
-            for t in time_periods:
-                for i in plants:
-                    model.addConstr(o[t,i] <= u[t,i],
-                                    name=f"StartupLogic2_t{t}_p{i}")
-
-            # (11) o[t,i] <= 1 - u[t-1,i]: A plant can only be started if it was off in the previous period.
-            for t in time_periods:
-                for i in plants:
-                    prev_u = u0[i] if t == 1 else u[t-1,i]
-                    model.addConstr(o[t,i] <= 1 - prev_u,
-                                    name=f"StartupLogic3_t{t}_p{i}")
-            
-            # (8) Excess Production Balance: s[t] = (total plant production + α·p_RE[t]) - demand
-            for t in time_periods:
-                model.addConstr(s[t] == gp.quicksum(x[t,i] for i in plants) + a * p_RE[t] - d[t],
-                                name=f"Excess_t{t}")
-            
+            model.set_lambda(lam)
+
             # -------------------------------
             # SOLVE THE MODEL
             # -------------------------------
-            model.optimize()
-            
-            # Collect objective value if optimal; else assign NaN.
-            if model.status == GRB.OPTIMAL:
-                obj_val = model.objVal
-            else:
-                obj_val = float('nan')
-            obj_values_matrix[i_lambda, i_alpha] = obj_val
-            
+            # Objective value if optimal; else NaN.
+            obj_values_matrix[i_lambda, i_alpha] = model.solve()
+    model.dispose()
+
     # Convert results to DataFrames for inspection/export if desired
+    import pandas as pd
     obj_values_df = pd.DataFrame(obj_values_matrix, index=lambda_vec, columns=alpha_vec)
     # Note: production_matrix and startup_counts_matrix contain lists.
     print("Objective Values:\n", obj_values_df)	
@@ -1,13 +1,5 @@
-import gurobipy as gp
+from solver_env import licence_status
 
-# Print the Gurobi version
-print("Gurobi version:", gp.gurobi.version())
-
-# Try loading the environment to see if the license is valid
-try:
-    env = gp.Env()
-    print("License is valid")
-except gp.GurobiError as e:
-    print("License issue",e)
-
-    
\ No newline at end of file
+# Check the Gurobi installation and licence through the shared environment
+ok, message = licence_status()
+print(message)
@@ -1,9 +1,10 @@
 import numpy as np
-import pandas as pd
-import gurobipy as gp
-from gurobipy import GRB
-import seaborn as sns
-import matplotlib.pyplot as plt
+
+from backends import default_backend
+from model_builder import FORM2
+from result_cache import CachedModel, solve_settings, sweep_key
+from result_store import ResultStore
+from solution import Solution
 
 
 # ===========================================================
@@ -61,11 +62,17 @@ lambda_vec = [1, 10, 100]
 # for HEATMAP ADDITION
 #-------------------------------
 
-# Initialize empty lists to store production values for each scenario (columns) and alpha (rows)
+# Solutions of every (scenario, alpha, lambda) point are kept in a typed result
+# store on disk; the heatmap below slices gas 1 production out of it. The store
+# directory is named after the hash of all model inputs, so changed data,
+# formulation or solver settings start a new store instead of reusing old results.
 num_scenarios = len(scenario_dict)
-gas_1_prodcution_lamda_1 = np.empty((num_alphas, num_scenarios), dtype=object)
-gas_1_prodcution_lamda_10 = np.empty((num_alphas, num_scenarios), dtype=object)
-gas_1_prodcution_lamda_100 = np.empty((num_alphas, num_scenarios), dtype=object)
+params = {"q": q, "Q": Q, "L": L, "l": l, "c_SU": c_SU, "c_NL": c_NL,
+          "c_var": c_var, "U1": U1, "U0": U0}
+settings = {"backend": default_backend()}
+key = sweep_key(FORM2, params, {name: (d, p_RE) for name, d in scenario_dict.items()},
+                solve_settings(settings))
+store = ResultStore.open_or_create(f"visq4_results/{key[:16]}", alpha_vec, lambda_vec, n, T, key=key)
 # ---------------------------------------------------------------------------------------------
 
 # u0: initial on/off state based on U1: if U1 > 0, plant is initially on.
@@ -81,155 +88,48 @@ def run_simulation(scenario_considered, d : dict[float]):
     # 2. SIMULATION LOOP: Run model for each (α, λ) combination using the NEW FORMULATION
     # ===========================================================
 
-    # Initialize matrices to store results
-    obj_values_matrix = np.zeros((len(lambda_vec), len(alpha_vec)))
-    production_matrix = np.full((len(lambda_vec), len(alpha_vec)), None, dtype=object)
-    periods_on_matrix = np.full((len(lambda_vec), len(alpha_vec)), None, dtype=object)
-    excess_matrix = np.zeros((len(lambda_vec), len(alpha_vec)))  # total excess production
-    startup_counts_matrix = np.full((len(lambda_vec), len(alpha_vec)), None, dtype=object)
-
-    for a in alpha_vec:
-        for lam in lambda_vec:
-            i_lambda = lambda_vec.index(lam)
-            i_alpha = alpha_vec.index(a)
-            i_scenario = list(scenario_dict.keys()).index(scenario_considered)
-            # -------------------------------
-            # MODEL INITIALIZATION (NEW FORMULATION)
-            # -------------------------------
-            model = gp.Model("PlantScheduling_NewFormulation")
-            model.setParam('MIPGap', 0.0)
-            model.setParam('MIPGapAbs', 0.0)
-            model.setParam('OutputFlag', 0)  # Suppress solver output
-            
-            # -------------------------------
-            # DECISION VARIABLES
-            # -------------------------------
-            u = model.addVars(time_periods, plants, vtype=GRB.BINARY, name="u")
-            v_var = model.addVars(time_periods, plants, vtype=GRB.BINARY, name="v")  # startup indicator
-            w = model.addVars(time_periods, plants, vtype=GRB.BINARY, name="w")      # shutdown indicator
-            x = model.addVars(time_periods, plants, vtype=GRB.CONTINUOUS, lb=0, name="x")
-            s = model.addVars(time_periods, vtype=GRB.CONTINUOUS, lb=0, name="s")
-            
-            # -------------------------------
-            # OBJECTIVE FUNCTION
-            # -------------------------------
-            model.setObjective(
-                gp.quicksum(x[t,i]*c_var[i] + u[t,i]*c_NL[i] + v_var[t,i]*c_SU[i] 
-                            for t in time_periods for i in plants) +
-                gp.quicksum(lam * s[t] for t in time_periods),
-                GRB.MINIMIZE
-            )
-            
-            # -------------------------------
-            # CONSTRAINTS
-            # -------------------------------
-            
-            # (1) Demand Constraint with renewable adjustment:
-            # Traditional production + a * p_RE[t] must meet demand.
-            for t in time_periods:
-                model.addConstr(gp.quicksum(x[t,i] for i in plants) + a * p_RE[t] >= d[t],
-                                name=f"Demand_t{t}")
-            
-            # (2) Production Lower Bound: if plant is on, x[t,i] >= q[i]
-            for t in time_periods:
-                for i in plants:
-                    model.addConstr(x[t,i] >= q[i] * u[t,i],
-                                    name=f"MinProd_t{t}_Plant{i}")
-            
-            # (3) Production Upper Bound: if plant is on, x[t,i] <= Q[i]
-            for t in time_periods:
-                for i in plants:
-                    model.addConstr(x[t,i] <= Q[i] * u[t,i],
-                                    name=f"MaxProd_t{t}_Plant{i}")
-            
-            # (4) Dynamic Relationship for On/Off Status:
-            # For t=1: u[1,i] - u0[i] = v[1,i] - w[1,i]
-            for i in plants:
-                t = 1
-                model.addConstr(u[t,i] - u0[i] == v_var[t,i] - w[t,i],
-                                name=f"Dynamic_t{t}_Plant{i}")
-                # For t >=2:
-                for t in range(2, T+1):
-                    model.addConstr(u[t,i] - u[t-1,i] == v_var[t,i] - w[t,i],
-                                    name=f"Dynamic_t{t}_Plant{i}")
-            
-            # (5) Initial Period Consistency:
-            # For t = 1,..., T_init[i], enforce u[t,i] = u0[i]
-            for i in plants:
-                for t in time_periods:
-                    if t <= T_init[i]:
-                        model.addConstr(u[t,i] == u0[i],
-                                        name=f"InitStatus_t{t}_Plant{i}")
-            
-            # (6) Up-Time Constraint:
-            # For each plant and time t, the sum of startups over the past L[i] periods <= u[t,i]
-            for i in plants:
-                for t in time_periods:
-                    start = max(1, t - L[i] + 1)
-                    model.addConstr(gp.quicksum(v_var[j,i] for j in range(start, t+1)) <= u[t,i],
-                                    name=f"UpTime_t{t}_Plant{i}")
-            
-            # (7) Down-Time Constraint:
-            # For each plant and time t, the sum of shutdowns over the past l[i] periods <= 1 - u[t,i]
-            for i in plants:
-                for t in time_periods:
-                    start = max(1, t - l[i] + 1)
-                    model.addConstr(gp.quicksum(w[j,i] for j in range(start, t+1)) <= 1 - u[t,i],
-                                    name=f"DownTime_t{t}_Plant{i}")
-            
-            # (8) Excess Production Balance:
-            # Excess s[t] = (traditional production + a * p_RE[t]) - d[t]
-            for t in time_periods:
-                model.addConstr(s[t] == gp.quicksum(x[t,i] for i in plants) + a * p_RE[t] - d[t],
-                                name=f"Excess_t{t}")
-            
+    if scenario_considered not in store.scenarios:
+        store.add_scenario(scenario_considered)
+
+    # -------------------------------
+    # MODEL INITIALIZATION (NEW FORMULATION), built once per scenario:
+    # only the RHS of Demand_t/Excess_t (through a * p_RE[t]) and the
+    # objective coefficient of s[t] (lam) change between sweep points.
+    # -------------------------------
+    model = CachedModel(FORM2, params, d, p_RE, **settings)
+
+    for i_alpha, a in enumerate(alpha_vec):
+        model.set_alpha(a)
+        for i_lambda, lam in enumerate(lambda_vec):
+            if store.is_solved(scenario_considered, i_alpha, i_lambda):
+                continue
+            model.set_lambda(lam)
+
             # -------------------------------
             # SOLVE THE MODEL
             # -------------------------------
-            model.optimize()
-            
-            # -------------------------------
-            # KPI COLLECTION
-            # -------------------------------
-            total_excess = 0.0
-            plants_on = [0] * n          # count of periods on per plant
-            plants_production = [0] * n    # total production per plant
-            startup_counts = [0] * n       # total startup count per plant
-
-            if model.status == GRB.OPTIMAL:
-                for t in time_periods:
-                    total_excess += s[t].x
-                    for i in plants:
-                        if u[t,i].x >= 0.5:
-                            plants_on[i] += 1
-                            plants_production[i] += x[t,i].x
-                        startup_counts[i] += v_var[t,i].x  # count startup events
-                obj_val = model.objVal
-            else:
-                obj_val = np.nan
-            
-            # Store results in matrices
-            obj_values_matrix[i_lambda, i_alpha] = obj_val
-            production_matrix[i_lambda, i_alpha] = plants_production
-            periods_on_matrix[i_lambda, i_alpha] = plants_on
-            excess_matrix[i_lambda, i_alpha] = total_excess
-            startup_counts_matrix[i_lambda, i_alpha] = startup_counts
-
-           # gas_1_prodcution_lamda_1[i_alpha, i_scenario] = list(x[t,4].x for t in time_periods if u[t,4].x >= 0.5)
-            if lam == 1:
-                gas_1_prodcution_lamda_1[i_alpha, i_scenario] = [x[t, 4].x if not np.isnan(x[t, 4].x) else 0 for t in time_periods]
-            elif lam == 10:
-                gas_1_prodcution_lamda_10[i_alpha, i_scenario] = [x[t, 4].x if not np.isnan(x[t, 4].x) else 0 for t in time_periods]
-            elif lam == 100:
-                gas_1_prodcution_lamda_100[i_alpha, i_scenario] = [x[t, 4].x if not np.isnan(x[t, 4].x) else 0 for t in time_periods]
-            else:
-                raise ValueError("Invalid lambda value.") 
-
+            obj_val = model.solve()
+
+            # values[...] holds (T, n) arrays (s: (T,)), row t-1 is time period t
+            store.write(scenario_considered, i_alpha, i_lambda, obj_val, model.values(), model.stats)
+    model.dispose()
+    store.flush()
+
+    # -------------------------------
+    # KPI COLLECTION for all (alpha, lambda) points at once from the store;
+    # the matrices below are indexed (lambda, alpha[, plant]).
+    # -------------------------------
+    solution = Solution.from_store(store, scenario_considered)
+    obj_values_matrix = solution.objective.T
+    production_matrix = solution.production().transpose(1, 0, 2)          # production per plant
+    periods_on_matrix = solution.periods_on().transpose(1, 0, 2)          # periods on per plant
+    excess_matrix = solution.total_excess().T                             # total excess production
+    startup_counts_matrix = solution.startup_counts().transpose(1, 0, 2)  # startups per plant
 
     # Convert results to DataFrames for inspection/export if desired
+    import pandas as pd
     obj_values_df = pd.DataFrame(obj_values_matrix, index=lambda_vec, columns=alpha_vec)
     excess_df = pd.DataFrame(excess_matrix, index=lambda_vec, columns=alpha_vec)
-    # Note: production_matrix and startup_counts_matrix contain lists.
     print("Objective Values:\n", obj_values_df)	
 
     # ===========================================================
@@ -295,6 +195,7 @@ for scenario_name, data in scenario_dict.items():
 # -------------------------------------
 
 # -----------PLAYING AROUND WITH THE DATA------------------
+import pandas as pd
 data_df = pd.read_excel(r"C:\Users\leoro\OneDrive\Desktop\EUR\YEAR 3\BLOCK 4\Case 1 Operations Research\CODING\POST JEHUM\Realistic Data Demand.xlsx", index_col=0)
 print(data_df.head())
 
@@ -310,27 +211,16 @@ def calculate_rolling_volatility(data, window):
 rolling_volatility_dict = {i : calculate_rolling_volatility(data_df[i], rolling_horizon) for i in scenario_dict.keys()}  # List to store rolling volatility values
 rolling_volatility_array = np.array([rolling_volatility_dict[i] for i in scenario_dict.keys()])  # Convert to numpy array for easier manipulation
 
-# Initialize empty arrays to store rolling production values
-gas_1_binned_production_lambda_1 = np.empty((len(alpha_vec), num_scenarios), dtype=object)
-gas_1_binned_production_lambda_10 = np.empty((len(alpha_vec), num_scenarios), dtype=object)
-gas_1_binned_production_lambda_100 = np.empty((len(alpha_vec), num_scenarios), dtype=object)
-
-for i in range(num_alphas):
-    for j in range(num_scenarios):
-        gas_1_prodcution_lamda_1[i, j] = []
-        gas_1_prodcution_lamda_10[i, j] = []
-        gas_1_prodcution_lamda_100[i, j] = []
-
 def calculate_binned_production(data, window):
-    binned_sum = [data[i * window:(i + 1) * window].sum() for i in range(len(data) // window)]
-    return binned_sum
-
+    """Sum over consecutive bins of size 'window' along the last (time) axis."""
+    num_bins = data.shape[-1] // window
+    return data[..., :num_bins * window].reshape(*data.shape[:-1], num_bins, window).sum(axis=-1)
 
-for a in range(len(alpha_vec)):
-    for i in range(len(scenario_dict.keys())):
-        gas_1_binned_production_lambda_1[a, i] = calculate_binned_production((np.array(gas_1_prodcution_lamda_1[a, i])), rolling_horizon)
-        gas_1_binned_production_lambda_10[a, i] = calculate_binned_production((np.array(gas_1_prodcution_lamda_10[a, i])), rolling_horizon)
-        gas_1_binned_production_lambda_100[a, i] = calculate_binned_production((np.array(gas_1_prodcution_lamda_100[a, i])), rolling_horizon)
+# Gas 1 (plant 4) production per (alpha, scenario, lambda, t); unsolved points count as 0
+gas_1_production = np.stack([Solution.from_store(store, scenario).series(4) for scenario in scenario_dict], axis=1)
+gas_1_binned_production_lambda_1 = calculate_binned_production(gas_1_production[:, :, lambda_vec.index(1)], rolling_horizon)
+gas_1_binned_production_lambda_10 = calculate_binned_production(gas_1_production[:, :, lambda_vec.index(10)], rolling_horizon)
+gas_1_binned_production_lambda_100 = calculate_binned_production(gas_1_production[:, :, lambda_vec.index(100)], rolling_horizon)
 
     # now it is time for the heatmap for each of the 3 different lambdas
 
@@ -373,6 +263,8 @@ for lam, rolling_production in zip(
 
 
 # Plot heatmaps for each lambda
+import seaborn as sns
+import matplotlib.pyplot as plt
 for lam in [1, 10, 100]:
     plt.figure(figsize=(10, 8))
     sns.heatmap(
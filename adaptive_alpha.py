@@ -0,0 +1,105 @@
+import numpy as np
+
+from parametric import ParametricModel
+
+# ===========================================================
+# ADAPTIVE ALPHA REFINEMENT
+# ===========================================================
+# Instead of a fixed np.linspace grid, the sweep starts from a coarse alpha
+# grid and bisects only the intervals where one of these exceeds its tolerance:
+#   - the objective's departure from a straight line: the slope change to the
+#     neighbouring intervals times the interval width, relative to the
+#     objective (obj_rtol), so long linear stretches are not refined,
+#   - the per-plant production sum_t x[t,i] (largest change as a share of
+#     total demand, prod_tol),
+#   - the commitment pattern u (number of (t, i) entries that differ, commit_tol).
+# The end points of an interval are compared for production and commitment.
+# The interval that exceeds its tolerances by the largest factor is split
+# first, until no interval exceeds them, intervals get narrower than
+# min_width, or the solve budget is used up.
+
+
+class AlphaProfile:
+    """Solved alpha points for one lambda, kept sorted by alpha."""
+
+    def __init__(self, lam):
+        self.lam = lam
+        self.alphas = []
+        self.objectives = []
+        self.production = []   # per-plant sum_t x[t,i]
+        self.commitment = []   # (T, n) int8 arrays of u
+
+    def add(self, alpha, obj, values):
+        k = int(np.searchsorted(self.alphas, alpha))
+        self.alphas.insert(k, alpha)
+        self.objectives.insert(k, obj)
+        self.production.insert(k, values["x"].sum(axis=0))
+        self.commitment.insert(k, np.rint(values["u"]).astype(np.int8))
+        return k
+
+    @property
+    def solves(self):
+        return len(self.alphas)
+
+
+def _interval_score(profile, k, total_demand, obj_rtol, prod_tol, commit_tol):
+    """Largest tolerance ratio between points k and k+1 (> 1 means the interval needs refining)."""
+    alphas = np.array(profile.alphas)
+    objectives = np.array(profile.objectives)
+    if np.isnan(objectives[k]) or np.isnan(objectives[k+1]):
+        return np.inf if np.isnan(objectives[k]) != np.isnan(objectives[k+1]) else 0.0
+    slopes = np.diff(objectives) / np.diff(alphas)
+    kink = max([abs(slopes[k] - slopes[j]) for j in (k - 1, k + 1)
+                if 0 <= j < len(slopes) and not np.isnan(slopes[j])], default=0.0)
+    obj_change = kink * (alphas[k+1] - alphas[k]) / max(1.0, abs(objectives[k]))
+    prod_change = np.max(np.abs(profile.production[k+1] - profile.production[k])) / total_demand
+    commit_change = np.count_nonzero(profile.commitment[k+1] != profile.commitment[k])
+    ratios = [obj_change / obj_rtol, prod_change / prod_tol]
+    if commit_change > commit_tol:
+        ratios.append(commit_change / max(commit_tol, 1) + 1.0)
+    return max(ratios)
+
+
+def adaptive_alpha(pm, lam, alpha_min=0.0, alpha_max=1.0, coarse=5, budget=30,
+                   obj_rtol=1e-2, prod_tol=1e-2, commit_tol=0, min_width=1e-3):
+    """Adaptively refined AlphaProfile of a ParametricModel at a fixed lambda."""
+    if coarse < 2:
+        raise ValueError("coarse must be at least 2.")
+    profile = AlphaProfile(lam)
+    pm.set_lambda(lam)
+    total_demand = float(np.sum(pm.d))
+
+    def solve(a):
+        pm.set_alpha(a)
+        obj = pm.solve()
+        values = pm.values() if not np.isnan(obj) else {"x": np.full((pm.data.T, pm.data.n), np.nan),
+                                                         "u": np.zeros((pm.data.T, pm.data.n))}
+        profile.add(a, obj, values)
+
+    for a in np.linspace(alpha_min, alpha_max, coarse):
+        solve(float(a))
+
+    while profile.solves < budget:
+        scores = [_interval_score(profile, k, total_demand, obj_rtol, prod_tol, commit_tol)
+                  if profile.alphas[k+1] - profile.alphas[k] > 2 * min_width else 0.0
+                  for k in range(len(profile.alphas) - 1)]
+        k = int(np.argmax(scores))
+        if scores[k] <= 1.0:
+            break
+        solve(0.5 * (profile.alphas[k] + profile.alphas[k+1]))
+    return profile
+
+
+def adaptive_sweep(formulation, params, d, p_RE, lambda_vec, env=None, alpha_min=0.0, alpha_max=1.0,
+                   coarse=5, budget=30, obj_rtol=1e-2, prod_tol=1e-2, commit_tol=0, min_width=1e-3,
+                   **options):
+    """{lam: AlphaProfile} for every lambda, each refined with its own solve budget."""
+    if coarse < 2:
+        raise ValueError("coarse must be at least 2.")
+    pm = ParametricModel(formulation, params, d, p_RE, env=env, **options)
+    profiles = {lam: adaptive_alpha(pm, lam, alpha_min, alpha_max, coarse=coarse, budget=budget,
+                                    obj_rtol=obj_rtol, prod_tol=prod_tol, commit_tol=commit_tol,
+                                    min_width=min_width)
+                for lam in lambda_vec}
+    pm.dispose()
+    return profiles
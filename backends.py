@@ -0,0 +1,247 @@
+import importlib.util
+import time
+
+import numpy as np
+
+from model_builder import to_gurobi
+from solver_env import get_env
+
+# ===========================================================
+# SOLVER BACKENDS FOR A ModelData
+# ===========================================================
+# Every backend loads the same sparse ModelData and returns a handle with one
+# interface, so the parametric sweep and the scripts do not depend on a
+# particular solver:
+#
+#   handle.set_obj(cols, values)   objective coefficients of the given columns
+#   handle.set_rhs(rows, values)   right-hand sides of the given rows
+#   handle.set_obj_const(value)    objective constant
+#   handle.get_obj() / get_rhs() / get_obj_const()   current values
+#   handle.set_start(z)            MIP start, NaN = no value (ignored where not supported)
+#   handle.solve()                 objective value, or NaN if not optimal
+#   handle.x                       solution vector of the last solve
+#   handle.pool()                  all solutions kept by the last solve (best first)
+#   handle.runtime                 seconds spent in the last solve
+#   handle.node_count              branch-and-bound nodes of the last solve
+#   handle.solve_batch(variants)   [(objective, x)] for a list of (obj, rhs, obj_const) variants
+#   handle.dispose()
+#
+# GUROBI keeps one gurobipy model and updates it in place; models share the
+# process-wide environment of solver_env.py unless an env is given. HIGHS
+# passes the stored matrix to scipy.optimize.milp (HiGHS) on every solve and
+# needs no licence. default_backend() is GUROBI only with a licence that is not
+# size-limited. solver_params are passed through unchanged, so they use the
+# backend's own names (Gurobi parameters, or scipy milp options).
+#
+# Batch solves: variants of one model that differ only in objective and RHS
+# (the alpha x lambda grid of a scenario) can be solved together. For a MIP,
+# GUROBI uses its multi-scenario feature: every variant becomes a scenario
+# (ScenNObj/ScenNRHS for the entries that differ from the loaded model) and
+# a single optimize() solves all of them, sharing presolve and the search
+# tree. Otherwise (LP relaxations, HiGHS, or multi_scenario=False) the
+# variants are solved one after another in the same handle, changing only
+# the entries that differ from the previous variant, so Gurobi keeps its LP
+# basis between them. The handle is reset to its loaded obj/rhs afterwards.
+
+GUROBI = "gurobi"
+HIGHS = "highs"
+
+DEFAULT_PARAMS = {
+    GUROBI: {"OutputFlag": 0, "MIPGap": 0.0, "MIPGapAbs": 0.0},
+    HIGHS: {"disp": False, "mip_rel_gap": 0.0},
+}
+
+
+class GurobiModel:
+    """ModelData loaded into a persistent gurobipy model."""
+
+    def __init__(self, data, env=None, solver_params=None):
+        self.model, self.z, constrs = to_gurobi(data, get_env() if env is None else env)
+        for key, value in (DEFAULT_PARAMS[GUROBI] if solver_params is None else solver_params).items():
+            self.model.setParam(key, value)
+        self._vars = self.z.tolist()
+        self._constrs = constrs.tolist()
+        self.x = None
+        self.runtime = 0.0
+        self.node_count = 0
+
+    def get_obj(self):
+        self.model.update()
+        return np.array(self.model.getAttr("Obj", self._vars))
+
+    def get_rhs(self):
+        self.model.update()
+        return np.array(self.model.getAttr("RHS", self._constrs))
+
+    def get_obj_const(self):
+        return self.model.ObjCon
+
+    def set_obj(self, cols, values):
+        self.model.setAttr("Obj", [self._vars[j] for j in cols], np.asarray(values, dtype=float).tolist())
+
+    def set_rhs(self, rows, values):
+        self.model.setAttr("RHS", [self._constrs[r] for r in rows], np.asarray(values, dtype=float).tolist())
+
+    def set_obj_const(self, value):
+        self.model.ObjCon = value
+
+    def set_start(self, z):
+        from gurobipy import GRB
+
+        z = np.asarray(z, dtype=float)
+        self.model.setAttr("Start", self._vars, np.where(np.isnan(z), GRB.UNDEFINED, z).tolist())
+
+    def solve(self):
+        from gurobipy import GRB
+
+        self.model.optimize()
+        self.runtime = self.model.Runtime
+        self.node_count = int(self.model.NodeCount) if self.model.IsMIP else 0
+        self.x = self.z.X if self.model.SolCount else None
+        if self.model.status == GRB.OPTIMAL:
+            return self.model.objVal
+        return float('nan')
+
+    def solve_batch(self, variants, multi_scenario=True):
+        self.model.update()
+        if not (multi_scenario and self.model.IsMIP and len(variants) > 1):
+            return _solve_sequential(self, variants)
+        from gurobipy import GRB
+
+        base_obj, base_rhs, base_const = self.get_obj(), self.get_rhs(), self.get_obj_const()
+        self.model.NumScenarios = len(variants)
+        for k, (obj, rhs, _) in enumerate(variants):
+            self.model.Params.ScenarioNumber = k
+            cols = np.flatnonzero(obj != base_obj)
+            rows = np.flatnonzero(rhs != base_rhs)
+            self.model.setAttr("ScenNObj", [self._vars[j] for j in cols], obj[cols].tolist())
+            self.model.setAttr("ScenNRHS", [self._constrs[r] for r in rows], rhs[rows].tolist())
+        self.model.optimize()
+        self.runtime = self.model.Runtime
+        self.node_count = int(self.model.NodeCount)
+        results = []
+        for k, (_, _, obj_const) in enumerate(variants):
+            self.model.Params.ScenarioNumber = k
+            value = self.model.ScenNObjVal
+            # ObjCon has no per-scenario attribute: the constant difference is added afterwards
+            if self.model.status == GRB.OPTIMAL and value < GRB.INFINITY:
+                results.append((value + obj_const - base_const, np.array(self.z.ScenNX)))
+            else:
+                results.append((float('nan'), None))
+        self.model.NumScenarios = 0
+        self.x = None
+        return results
+
+    def pool(self):
+        solutions = []
+        for k in range(self.model.SolCount):
+            self.model.setParam("SolutionNumber", k)
+            solutions.append(np.array(self.z.Xn))
+        return solutions
+
+    def dispose(self):
+        self.model.dispose()
+
+
+class HighsModel:
+    """ModelData solved with HiGHS through scipy.optimize.milp (no persistent solver state)."""
+
+    def __init__(self, data, solver_params=None):
+        self.data = data
+        self.obj = data.obj.copy()
+        self.rhs = data.rhs.copy()
+        self.obj_const = data.obj_const
+        self.options = dict(DEFAULT_PARAMS[HIGHS] if solver_params is None else solver_params)
+        self._integrality = (data.vtype != "C").astype(int)
+        self.x = None
+        self.runtime = 0.0
+        self.node_count = 0
+
+    def get_obj(self):
+        return self.obj.copy()
+
+    def get_rhs(self):
+        return self.rhs.copy()
+
+    def get_obj_const(self):
+        return self.obj_const
+
+    def set_obj(self, cols, values):
+        self.obj[cols] = values
+
+    def set_rhs(self, rows, values):
+        self.rhs[rows] = values
+
+    def set_obj_const(self, value):
+        self.obj_const = value
+
+    def set_start(self, z):
+        # scipy's milp interface takes no MIP start
+        pass
+
+    def solve(self):
+        from scipy.optimize import milp, LinearConstraint, Bounds
+
+        lower = np.where(self.data.sense == "<", -np.inf, self.rhs)
+        upper = np.where(self.data.sense == ">", np.inf, self.rhs)
+        start = time.perf_counter()
+        result = milp(self.obj, constraints=LinearConstraint(self.data.A, lower, upper),
+                      integrality=self._integrality, bounds=Bounds(self.data.lb, self.data.ub),
+                      options=self.options)
+        self.runtime = time.perf_counter() - start
+        self.x = result.x
+        self.node_count = int(getattr(result, "mip_node_count", 0) or 0)
+        if result.status == 0:
+            return result.fun + self.obj_const
+        return float('nan')
+
+    def solve_batch(self, variants, multi_scenario=True):
+        # milp() has no multi-scenario mode
+        return _solve_sequential(self, variants)
+
+    def pool(self):
+        return [] if self.x is None else [self.x]
+
+    def dispose(self):
+        self.x = None
+
+
+def _solve_sequential(handle, variants):
+    """Solve the variants one by one in the handle, then restore its obj/rhs/constant."""
+    current = base = (handle.get_obj(), handle.get_rhs(), handle.get_obj_const())
+    results = []
+    for variant in list(variants) + [base]:
+        obj, rhs, obj_const = variant
+        cols = np.flatnonzero(obj != current[0])
+        rows = np.flatnonzero(rhs != current[1])
+        if len(cols):
+            handle.set_obj(cols, obj[cols])
+        if len(rows):
+            handle.set_rhs(rows, rhs[rows])
+        handle.set_obj_const(obj_const)
+        current = variant
+        if variant is not base:
+            value = handle.solve()
+            results.append((value, None if handle.x is None or np.isnan(value) else handle.x.copy()))
+    return results
+
+
+def default_backend():
+    """GUROBI if gurobipy is installed with an unrestricted licence, otherwise HIGHS.
+
+    gurobipy is only imported (and the licence checked, once per process) when it is installed.
+    """
+    if importlib.util.find_spec("gurobipy") is None:
+        return HIGHS
+    from solver_env import licence_status
+    return GUROBI if licence_status()[0] else HIGHS
+
+
+def load(data, backend=None, env=None, solver_params=None):
+    """Load a ModelData into the given backend (default_backend() if None); returns the handle."""
+    backend = default_backend() if backend is None else backend
+    if backend == GUROBI:
+        return GurobiModel(data, env, solver_params)
+    if backend == HIGHS:
+        return HighsModel(data, solver_params)
+    raise ValueError(f"Unknown backend: {backend}")
@@ -0,0 +1,39 @@
+import time
+
+import numpy as np
+
+import plant_data
+from backends import GUROBI, HIGHS
+from model_builder import FORM1, FORM2
+from parametric import ParametricModel
+
+# ===========================================================
+# GUROBI vs. HIGHS ON THE 8-PLANT / 168-HOUR INSTANCE
+# ===========================================================
+# Both backends solve the same ModelData for a few alpha values of every
+# scenario; the objectives should agree and the solve times are reported.
+
+alpha_vec = [0.0, 0.5, 1.0]
+lam = 10
+
+
+if __name__ == "__main__":
+    params = plant_data.plant_params()
+    print(f"{'model':6} {'scenario':11} {'alpha':>5} {'gurobi obj':>16} {'highs obj':>16} "
+          f"{'gurobi s':>9} {'highs s':>9}")
+    for form in (FORM1, FORM2):
+        for scenario_name, p_RE in plant_data.scenario_dict.items():
+            models = {backend: ParametricModel(form, params, plant_data.d, p_RE, lam=lam, backend=backend)
+                      for backend in (GUROBI, HIGHS)}
+            for a in alpha_vec:
+                obj, seconds = {}, {}
+                for backend, model in models.items():
+                    model.set_alpha(a)
+                    start = time.perf_counter()
+                    obj[backend] = model.solve()
+                    seconds[backend] = time.perf_counter() - start
+                print(f"{form:6} {scenario_name:11} {a:5.2f} {obj[GUROBI]:16.2f} {obj[HIGHS]:16.2f} "
+                      f"{seconds[GUROBI]:9.2f} {seconds[HIGHS]:9.2f}"
+                      + ("" if np.isclose(obj[GUROBI], obj[HIGHS], rtol=1e-6) else "  MISMATCH"))
+            for model in models.values():
+                model.dispose()
@@ -0,0 +1,41 @@
+import time
+
+import numpy as np
+
+import plant_data
+from model_builder import FORM1, FORM2
+from parametric import batch_sweep, sweep
+
+# ===========================================================
+# SEPARATE SOLVES vs. BATCH SOLVES OF THE 30 GRID VARIANTS
+# ===========================================================
+# Each scenario's 10 alpha x 3 lambda grid is solved three ways with the
+# same build options: one solve() per point, one sequential batch (in-place
+# re-solves in serpentine order) and one multi-scenario batch (a single
+# Gurobi optimize for all 30 variants; sequential on HiGHS).
+# Reported are the wall times and the largest objective difference.
+
+alpha_vec = np.linspace(0, 1, 10).tolist()
+lambda_vec = [1, 10, 100]
+
+
+def timed(f, *args, **kwargs):
+    start = time.perf_counter()
+    result = f(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    params = plant_data.plant_params()
+    print(f"{'model':6} {'scenario':11} {'separate s':>10} {'sequential s':>12} {'multi s':>8} "
+          f"{'max rel. diff':>14}")
+    for form in (FORM1, FORM2):
+        for scenario_name, p_RE in plant_data.scenario_dict.items():
+            separate, t_separate = timed(sweep, form, params, plant_data.d, p_RE, alpha_vec, lambda_vec)
+            sequential, t_sequential = timed(batch_sweep, form, params, plant_data.d, p_RE, alpha_vec,
+                                             lambda_vec, multi_scenario=False)
+            multi, t_multi = timed(batch_sweep, form, params, plant_data.d, p_RE, alpha_vec, lambda_vec)
+            diff = max(np.nanmax(np.abs(separate - other) / np.maximum(1.0, np.abs(separate)))
+                       for other in (sequential, multi))
+            print(f"{form:6} {scenario_name:11} {t_separate:10.2f} {t_sequential:12.2f} {t_multi:8.2f} "
+                  f"{diff:14.2e}")
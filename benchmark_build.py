@@ -0,0 +1,184 @@
+import time
+import tracemalloc
+
+import numpy as np
+import gurobipy as gp
+from gurobipy import GRB
+
+import plant_data
+from model_builder import build_form1, build_form2, to_gurobi
+
+# ===========================================================
+# BUILD-TIME BENCHMARK: loop builders vs. matrix builders
+# ===========================================================
+# The loop builders below are the constraint loops of Form1.py and Form2.py
+# (with the a*p_RE term of the sweep scripts), wrapped as functions so both
+# styles can be timed on the same data. Longer horizons are made by repeating
+# the weekly demand and renewable profiles. The matrix builders run with
+# detect_trivial=False, so both styles build the same model (with binaries for
+# every plant, as in Form1.py/Form2.py).
+#
+# Memory is the Python-side peak reported by tracemalloc while the model is
+# built and loaded (variable/constraint handles, expressions, names); memory
+# allocated inside the solver library itself is not included.
+
+
+def build_form1_loop(params, d, p_RE, a, lam):
+    q, Q, L, l = params["q"], params["Q"], params["L"], params["l"]
+    c_SU, c_NL, c_var, U1, U0 = params["c_SU"], params["c_NL"], params["c_var"], params["U1"], params["U0"]
+    T = len(d)
+    plants = range(len(q))
+    time_periods = range(1, T+1)
+    u0 = {i: 1 if U1[i] > 0 else 0 for i in plants}
+
+    model = gp.Model("PlantScheduling_Form1")
+    u = model.addVars(time_periods, plants, vtype=GRB.BINARY, name="u")
+    o = model.addVars(time_periods, plants, vtype=GRB.BINARY, name="o")
+    x = model.addVars(time_periods, plants, vtype=GRB.CONTINUOUS, lb=0, name="x")
+    s = model.addVars(time_periods, vtype=GRB.CONTINUOUS, lb=0, name="s")
+    model.setObjective(
+        gp.quicksum(x[t,i]*c_var[i] + u[t,i]*c_NL[i] + o[t,i]*c_SU[i]
+                    for t in time_periods for i in plants)
+        + gp.quicksum(lam * s[t] for t in time_periods),
+        GRB.MINIMIZE
+    )
+    for t in time_periods:
+        model.addConstr(gp.quicksum(x[t,i] for i in plants) + a * p_RE[t] >= d[t],
+                        name=f"Demand_t{t}")
+    for t in time_periods:
+        for i in plants:
+            model.addConstr(x[t,i] >= q[i] * u[t,i], name=f"MinProd_t{t}_p{i}")
+    for t in time_periods:
+        for i in plants:
+            model.addConstr(x[t,i] <= Q[i] * u[t,i], name=f"MaxProd_t{t}_p{i}")
+    for i in plants:
+        for tau in range(1, min(max(L[i] - U1[i], 0), T) + 1):
+            model.addConstr(u0[i] <= u[tau,i], name=f"MinUpInit_p{i}_tau{tau}")
+        start_t = max(l[i] - U0[i], 0) + 1
+        for t in range(start_t, T+1):
+            end_tau = min(t - 1 + L[i], T)
+            for tau in range(t+1, end_tau+1):
+                model.addConstr(u[t,i] - (u[t-1,i] if t > 1 else u0[i]) <= u[tau,i],
+                                name=f"MinUp_p{i}_t{t}_tau{tau}")
+        for tau in range(1, min(max(l[i] - U0[i], 0), T) + 1):
+            model.addConstr(1 - u0[i] <= 1 - u[tau,i], name=f"MinDownInit_p{i}_tau{tau}")
+        start_t = max(L[i] - U1[i], 0) + 1
+        for t in range(start_t, T+1):
+            end_tau = min(t - 1 + l[i], T)
+            for tau in range(t+1, end_tau+1):
+                model.addConstr((u[t-1,i] if t > 1 else u0[i]) - u[t,i] <= 1 - u[tau,i],
+                                name=f"MinDown_p{i}_t{t}_tau{tau}")
+    for t in time_periods:
+        model.addConstr(s[t] == gp.quicksum(x[t,i] for i in plants) + a * p_RE[t] - d[t],
+                        name=f"Excess_t{t}")
+    for t in time_periods:
+        for i in plants:
+            prev_u = u0[i] if t == 1 else u[t-1,i]
+            model.addConstr(-o[t,i] <= prev_u - u[t,i], name=f"StartupLogic1_t{t}_p{i}")
+    for t in time_periods:
+        for i in plants:
+            model.addConstr(o[t,i] <= u[t,i], name=f"StartupLogic2_t{t}_p{i}")
+    for t in time_periods:
+        for i in plants:
+            prev_u = u0[i] if t == 1 else u[t-1,i]
+            model.addConstr(o[t,i] <= 1 - prev_u, name=f"StartupLogic3_t{t}_p{i}")
+    model.update()
+    return model
+
+
+def build_form2_loop(params, d, p_RE, a, lam):
+    q, Q, L, l = params["q"], params["Q"], params["L"], params["l"]
+    c_SU, c_NL, c_var, U1, U0 = params["c_SU"], params["c_NL"], params["c_var"], params["U1"], params["U0"]
+    T = len(d)
+    plants = range(len(q))
+    time_periods = range(1, T+1)
+    u0 = {i: 1 if U1[i] > 0 else 0 for i in plants}
+
+    model = gp.Model("PlantScheduling_Form2")
+    u = model.addVars(time_periods, plants, vtype=GRB.BINARY, name="u")
+    v = model.addVars(time_periods, plants, vtype=GRB.BINARY, name="v")
+    w = model.addVars(time_periods, plants, vtype=GRB.BINARY, name="w")
+    x = model.addVars(time_periods, plants, vtype=GRB.CONTINUOUS, lb=0, name="x")
+    s = model.addVars(time_periods, vtype=GRB.CONTINUOUS, lb=0, name="s")
+    model.setObjective(
+        gp.quicksum(x[t,i] * c_var[i] + u[t,i] * c_NL[i] + v[t,i] * c_SU[i] for t in time_periods for i in plants)
+        + gp.quicksum(lam * s[t] for t in time_periods),
+        GRB.MINIMIZE
+    )
+    for t in time_periods:
+        model.addConstr(gp.quicksum(x[t,i] for i in plants) + a * p_RE[t] >= d[t], name=f"Demand_t{t}")
+    for t in time_periods:
+        for i in plants:
+            model.addConstr(x[t,i] >= q[i] * u[t,i], name=f"MinProd_t{t}_p{i}")
+    for t in time_periods:
+        for i in plants:
+            model.addConstr(x[t,i] <= Q[i] * u[t,i], name=f"MaxProd_t{t}_p{i}")
+    for i in plants:
+        model.addConstr(u[1,i] - u0[i] == v[1,i] - w[1,i], name=f"Dynamic_t1_Plant{i}")
+        for t in range(2, T+1):
+            model.addConstr(u[t,i] - u[t-1,i] == v[t,i] - w[t,i], name=f"Dynamic_t{t}_Plant{i}")
+    for i in plants:
+        T_init = max(u0[i]*(L[i]-U1[i]), (1 - u0[i])*(l[i]-U0[i]))
+        for t in range(1, min(T_init, T)+1):
+            model.addConstr(u[t,i] == u0[i], name=f"InitStatus_t{t}_Plant{i}")
+    for i in plants:
+        for t in range(min(T, max((L[i]-U1[i])*u0[i], 0)+1), T+1):
+            start = max(1, t - L[i] + 1)
+            model.addConstr(gp.quicksum(v[j,i] for j in range(start, t+1)) <= u[t,i],
+                            name=f"UpTime_t{t}_Plant{i}")
+    for i in plants:
+        for t in range(min(T, max((l[i]-U0[i])*(1-u0[i]), 0)+1), T+1):
+            start = max(1, t - l[i] + 1)
+            model.addConstr(gp.quicksum(w[j,i] for j in range(start, t+1)) <= 1 - u[t,i],
+                            name=f"DownTime_t{t}_Plant{i}")
+    for t in time_periods:
+        model.addConstr(s[t] == gp.quicksum(x[t,i] for i in plants) + a * p_RE[t] - d[t],
+                        name=f"Excess_t{t}")
+    model.update()
+    return model
+
+
+def build_matrix(builder, params, d, p_RE, a, lam, names):
+    data = builder(params, d, p_RE, alpha=a, lam=lam, names=names, detect_trivial=False)
+    model, _, _ = to_gurobi(data)
+    model.update()
+    return model
+
+
+def measure(fn, *args):
+    """Return (seconds, peak MiB, model) for one call of fn."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    model = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20, model
+
+
+def weeks_of_data(weeks):
+    T = plant_data.T * weeks
+    d = plant_data.as_series(plant_data.d, plant_data.T)
+    p_RE = plant_data.as_series(plant_data.scenario1, plant_data.T)
+    d = {t: val for t, val in zip(range(1, T+1), np.tile(d, weeks))}
+    p_RE = {t: val for t, val in zip(range(1, T+1), np.tile(p_RE, weeks))}
+    return d, p_RE
+
+
+if __name__ == "__main__":
+    params = plant_data.plant_params()
+    a, lam = 0.5, 10
+    print(f"{'form':6} {'T':>5} {'builder':18} {'rows':>8} {'nnz':>9} {'seconds':>8} {'peak MiB':>9}")
+    for weeks in (1, 2, 4):
+        d, p_RE = weeks_of_data(weeks)
+        T = len(d)
+        for form, loop_builder, matrix_builder in (("Form1", build_form1_loop, build_form1),
+                                                   ("Form2", build_form2_loop, build_form2)):
+            runs = (("loop", loop_builder, (params, d, p_RE, a, lam)),
+                    ("matrix", build_matrix, (matrix_builder, params, d, p_RE, a, lam, False)),
+                    ("matrix + names", build_matrix, (matrix_builder, params, d, p_RE, a, lam, True)))
+            for label, fn, args in runs:
+                elapsed, peak, model = measure(fn, *args)
+                print(f"{form:6} {T:5d} {label:18} {model.NumConstrs:8d} {model.NumNZs:9d} "
+                      f"{elapsed:8.3f} {peak:9.1f}")
+                model.dispose()
@@ -0,0 +1,41 @@
+import time
+
+import numpy as np
+
+import plant_data
+from dispatch import MeritOrder
+from model_builder import FORM2
+from parametric import ParametricModel
+
+# ===========================================================
+# MERIT-ORDER DISPATCH vs. MIP, AND BATCH THROUGHPUT
+# ===========================================================
+# For every scenario the MIP is solved once; re-dispatching its commitment in
+# merit order must give the same cost. Then a batch of random commitment
+# schedules (the MIP's u with random flips) is dispatched at once and the time
+# per schedule-hour is reported.
+
+alpha, lam = 0.5, 10
+batch = 2000
+flip_rate = 0.05
+
+
+if __name__ == "__main__":
+    params = plant_data.plant_params()
+    rng = np.random.default_rng(0)
+    print(f"{'scenario':11} {'MIP cost':>14} {'dispatch cost':>14} {'us/hour':>8} {'feasible':>9}")
+    for scenario_name, p_RE in plant_data.scenario_dict.items():
+        pm = ParametricModel(FORM2, params, plant_data.d, p_RE, alpha=alpha, lam=lam)
+        mip = pm.solve()
+        u = np.rint(pm.values()["u"])
+        merit = MeritOrder(params, pm.data.trivial)
+        net = pm.d - alpha * pm.p_RE
+        pm.dispose()
+        _, _, cost = merit.evaluate(u, net, lam)
+
+        flips = rng.random((batch,) + u.shape) < flip_rate
+        schedules = np.where(flips, 1 - u, u)
+        start = time.perf_counter()
+        _, _, costs = merit.evaluate(schedules, net, lam)
+        per_hour = (time.perf_counter() - start) / (batch * u.shape[0]) * 1e6
+        print(f"{scenario_name:11} {mip:14.2f} {cost:14.2f} {per_hour:8.3f} {np.isfinite(costs).mean():9.1%}")
@@ -0,0 +1,34 @@
+import time
+
+import plant_data
+from lagrangian import lagrangian
+from model_builder import FORM2
+from parametric import ParametricModel
+
+# ===========================================================
+# LAGRANGIAN RELAXATION vs. EXACT MIP
+# ===========================================================
+# For every scenario (alpha = 0.5, lambda = 10) the Lagrangian relaxation
+# gives a certified lower bound and a feasible schedule (upper bound); the
+# Form2 MIP gives the optimum in between. Reported are both bounds, the
+# duality gap, the upper bound's gap to the optimum and both run times.
+
+alpha, lam = 0.5, 10
+
+
+if __name__ == "__main__":
+    params = plant_data.plant_params()
+    print(f"{'scenario':11} {'lower':>12} {'optimum':>12} {'upper':>12} {'gap %':>6} {'UB gap %':>8} "
+          f"{'iter':>5} {'LR s':>6} {'MIP s':>6}")
+    for scenario_name, p_RE in plant_data.scenario_dict.items():
+        start = time.perf_counter()
+        result = lagrangian(params, plant_data.d, p_RE, alpha=alpha, lam=lam)
+        t_lr = time.perf_counter() - start
+        pm = ParametricModel(FORM2, params, plant_data.d, p_RE, alpha=alpha, lam=lam)
+        optimum = pm.solve()
+        t_mip = pm.model.runtime
+        pm.dispose()
+        assert result.lower_bound <= optimum + 1e-6 * abs(optimum) <= result.upper_bound + 2e-6 * abs(optimum)
+        print(f"{scenario_name:11} {result.lower_bound:12.0f} {optimum:12.0f} {result.upper_bound:12.0f} "
+              f"{100 * result.gap:6.2f} {100 * (result.upper_bound - optimum) / optimum:8.2f} "
+              f"{result.iterations:5d} {t_lr:6.2f} {t_mip:6.2f}")
@@ -0,0 +1,34 @@
+import time
+
+import numpy as np
+
+import plant_data
+from lambda_curve import lambda_sweep
+from model_builder import FORM1
+from parametric import sweep
+
+# ===========================================================
+# GRID SOLVES vs. EXACT LAMBDA CURVES
+# ===========================================================
+# For every scenario the objective matrix over a dense lambda grid is computed
+# by one solve per grid point and from the exact cost-versus-lambda curves,
+# and the number of MIP solves and the run times are compared.
+
+alpha_vec = np.linspace(0, 1, 10).tolist()
+lambda_vec = np.geomspace(1, 100, 15).tolist()
+
+
+if __name__ == "__main__":
+    params = plant_data.plant_params()
+    print(f"{'scenario':11} {'grid solves':>11} {'curve solves':>12} {'grid s':>8} {'curve s':>8} "
+          f"{'max rel. diff':>14}")
+    for scenario_name, p_RE in plant_data.scenario_dict.items():
+        start = time.perf_counter()
+        grid = sweep(FORM1, params, plant_data.d, p_RE, alpha_vec, lambda_vec)
+        t_grid = time.perf_counter() - start
+        start = time.perf_counter()
+        curve_matrix, curves = lambda_sweep(FORM1, params, plant_data.d, p_RE, alpha_vec, lambda_vec)
+        t_curve = time.perf_counter() - start
+        diff = np.nanmax(np.abs(grid - curve_matrix) / np.maximum(1.0, np.abs(grid)))
+        print(f"{scenario_name:11} {grid.size:11d} {sum(c.solves for c in curves):12d} "
+              f"{t_grid:8.2f} {t_curve:8.2f} {diff:14.2e}")
@@ -0,0 +1,48 @@
+import time
+
+import plant_data
+from benchmark_build import weeks_of_data
+from model_builder import build_form1, to_gurobi, PAIRWISE, AGGREGATED
+
+# ===========================================================
+# FORM1 MIN UP/DOWN: PAIRWISE vs. AGGREGATED ROWS
+# ===========================================================
+# Pairwise rows (5)/(7) grow as O(n*T*L); the aggregated mode uses one row per
+# (i, t). Both are solved to optimality for longer horizons and scaled
+# minimum up/down times, and the model sizes and solve times are reported.
+
+
+def scaled_updown(params, factor):
+    """Copy of params with the minimum up and down times L and l multiplied by factor."""
+    scaled = dict(params)
+    scaled["L"] = {i: int(round(v * factor)) for i, v in params["L"].items()}
+    scaled["l"] = {i: int(round(v * factor)) for i, v in params["l"].items()}
+    return scaled
+
+
+def solve_form1(params, d, p_RE, mode, a=0.5, lam=10):
+    data = build_form1(params, d, p_RE, alpha=a, lam=lam, min_updown=mode)
+    model, _, _ = to_gurobi(data)
+    model.setParam('OutputFlag', 0)
+    model.setParam('MIPGap', 0.0)
+    model.setParam('MIPGapAbs', 0.0)
+    start = time.perf_counter()
+    model.optimize()
+    elapsed = time.perf_counter() - start
+    obj = model.objVal if model.SolCount else float('nan')
+    stats = data.stats()
+    model.dispose()
+    return obj, stats, elapsed
+
+
+if __name__ == "__main__":
+    base = plant_data.plant_params()
+    print(f"{'T':>5} {'L,l x':>6} {'mode':11} {'rows':>8} {'nnz':>9} {'objective':>14} {'solve s':>8}")
+    for weeks in (1, 2, 4):
+        d, p_RE = weeks_of_data(weeks)
+        for factor in (1, 2, 4):
+            params = scaled_updown(base, factor)
+            for mode in (PAIRWISE, AGGREGATED):
+                obj, stats, elapsed = solve_form1(params, d, p_RE, mode)
+                print(f"{len(d):5d} {factor:6d} {mode:11} {stats['rows']:8d} {stats['nnz']:9d} "
+                      f"{obj:14.2f} {elapsed:8.2f}")
@@ -0,0 +1,54 @@
+import time
+
+import numpy as np
+
+import plant_data
+from benchmark_build import build_form1_loop, build_form2_loop
+from model_builder import FORM1, FORM2
+from parametric import sweep
+
+# ===========================================================
+# REBUILD vs. BUILD-ONCE PARAMETRIC SWEEP
+# ===========================================================
+# Solves the alpha x lambda grid of one scenario twice: once rebuilding the
+# model for every point (as run_simulation used to) and once with a single
+# ParametricModel (with and without the presolve.py reduction), and checks that
+# all of them give the same objective matrix. The ParametricModel is built with
+# detect_trivial=False, so it is the same model as the rebuilt one.
+
+alpha_vec = np.linspace(0, 1, 10).tolist()
+lambda_vec = [1, 10, 100]
+
+
+def rebuild_sweep(loop_builder, params, d, p_RE):
+    obj_values_matrix = np.zeros((len(lambda_vec), len(alpha_vec)))
+    for i_alpha, a in enumerate(alpha_vec):
+        for i_lambda, lam in enumerate(lambda_vec):
+            model = loop_builder(params, d, p_RE, a, lam)
+            model.setParam('OutputFlag', 0)
+            model.setParam('MIPGap', 0.0)
+            model.setParam('MIPGapAbs', 0.0)
+            model.optimize()
+            obj_values_matrix[i_lambda, i_alpha] = model.objVal if model.SolCount else float('nan')
+            model.dispose()
+    return obj_values_matrix
+
+
+if __name__ == "__main__":
+    params = plant_data.plant_params()
+    for form, loop_builder in ((FORM1, build_form1_loop), (FORM2, build_form2_loop)):
+        for scenario_name, p_RE in plant_data.scenario_dict.items():
+            start = time.perf_counter()
+            rebuilt = rebuild_sweep(loop_builder, params, plant_data.d, p_RE)
+            t_rebuild = time.perf_counter() - start
+            start = time.perf_counter()
+            parametric = sweep(form, params, plant_data.d, p_RE, alpha_vec, lambda_vec, detect_trivial=False)
+            t_param = time.perf_counter() - start
+            start = time.perf_counter()
+            reduced = sweep(form, params, plant_data.d, p_RE, alpha_vec, lambda_vec, presolve=True,
+                            detect_trivial=False)
+            t_reduced = time.perf_counter() - start
+            diff = max(np.nanmax(np.abs(rebuilt - other) / np.maximum(1.0, np.abs(rebuilt)))
+                       for other in (parametric, reduced))
+            print(f"{form} {scenario_name}: rebuild {t_rebuild:7.2f}s  parametric {t_param:7.2f}s  "
+                  f"presolved {t_reduced:7.2f}s  max rel. objective difference {diff:.2e}")
@@ -0,0 +1,39 @@
+import time
+
+import numpy as np
+
+import plant_data
+from model_builder import FORM1, FORM2
+from parametric import ParametricModel
+from priority_list import priority_start
+
+# ===========================================================
+# PRIORITY-LIST HEURISTIC vs. EXACT MIP
+# ===========================================================
+# For every scenario (alpha = 0.5, lambda = 10) the heuristic schedule is
+# built and costed, then the MIP is solved cold and with the heuristic as MIP
+# start. Reported are the heuristic's time and gap to the optimum and both
+# MIP solve times.
+
+alpha, lam = 0.5, 10
+
+
+if __name__ == "__main__":
+    params = plant_data.plant_params()
+    print(f"{'model':6} {'scenario':11} {'heuristic':>12} {'optimum':>12} {'gap %':>6} {'heur ms':>8} "
+          f"{'cold s':>7} {'start s':>7}")
+    for form in (FORM1, FORM2):
+        for scenario_name, p_RE in plant_data.scenario_dict.items():
+            pm = ParametricModel(form, params, plant_data.d, p_RE, alpha=alpha, lam=lam)
+            start = time.perf_counter()
+            z, heuristic = priority_start(pm)
+            t_heuristic = time.perf_counter() - start
+            optimum = pm.solve()
+            t_cold = pm.model.runtime
+            warm = pm.solve(z)
+            t_warm = pm.model.runtime
+            pm.dispose()
+            assert np.isclose(optimum, warm)
+            print(f"{form:6} {scenario_name:11} {heuristic:12.0f} {optimum:12.0f} "
+                  f"{100 * (heuristic - optimum) / optimum:6.2f} {t_heuristic * 1e3:8.1f} "
+                  f"{t_cold:7.2f} {t_warm:7.2f}")
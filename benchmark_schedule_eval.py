@@ -0,0 +1,44 @@
+import time
+
+import numpy as np
+
+import plant_data
+from model_builder import FORM2
+from parametric import ParametricModel
+from schedule_eval import ScheduleChecker, validate
+
+# ===========================================================
+# SCHEDULE CHECKER: SOLVER VALIDATION AND THROUGHPUT
+# ===========================================================
+# Every scenario's MIP solution is validated independently (feasible, and the
+# evaluated cost equals the objective). Then a batch of perturbed copies of
+# its commitment is checked and costed at once; reported are schedules per
+# second and the share that is still feasible.
+
+alpha, lam = 0.5, 10
+batch = 5000
+
+
+if __name__ == "__main__":
+    params = plant_data.plant_params()
+    rng = np.random.default_rng(0)
+    print(f"{'scenario':11} {'valid':>6} {'cost diff':>10} {'schedules/s':>12} {'feasible':>9}")
+    for scenario_name, p_RE in plant_data.scenario_dict.items():
+        pm = ParametricModel(FORM2, params, plant_data.d, p_RE, alpha=alpha, lam=lam)
+        obj = pm.solve()
+        values = pm.values()
+        net = pm.d - alpha * pm.p_RE
+        report = validate(values, params, net, lam, pm.data.trivial)
+        checker = ScheduleChecker(params, pm.data.trivial)
+        pm.dispose()
+
+        u = np.rint(values["u"])
+        T, n = u.shape
+        schedules = np.repeat(u[None], batch, axis=0)
+        k, i, t = np.arange(batch), rng.integers(n, size=batch), rng.integers(T, size=batch)
+        schedules[k, t, i] = 1 - schedules[k, t, i]
+        start = time.perf_counter()
+        result = checker.evaluate(schedules, net, lam)
+        rate = batch / (time.perf_counter() - start)
+        print(f"{scenario_name:11} {str(bool(report['feasible'])):>6} {abs(report['cost'] - obj):10.2e} "
+              f"{rate:12.0f} {result['feasible'].mean():9.1%}")
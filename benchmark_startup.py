@@ -0,0 +1,62 @@
+import subprocess
+import sys
+import time
+
+import plant_data
+from model_builder import build_form2
+
+# ===========================================================
+# SCRIPT STARTUP AND MODEL CREATION: EAGER vs. LAZY / SHARED ENV
+# ===========================================================
+# 1. Import time in a fresh interpreter: the old script header (gurobipy,
+#    pandas, seaborn, matplotlib) against the modules a sweep needs now.
+# 2. Creating and loading a model N times in gurobipy's default environment
+#    (a new gp.Env per model, as Logistics Case.py did) against the shared
+#    environment of solver_env.py.
+
+EAGER = "import numpy, gurobipy, pandas, seaborn, matplotlib.pyplot"
+LAZY = "import numpy, parametric"
+N = 20
+
+
+def import_seconds(statement, repeats=5):
+    """Best wall time over `repeats` fresh interpreters for running `statement`."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def creation_seconds(data, shared):
+    import gurobipy as gp
+    from model_builder import to_gurobi
+    from solver_env import get_env
+
+    start = time.perf_counter()
+    for _ in range(N):
+        if shared:
+            model, _, _ = to_gurobi(data, get_env())
+            model.dispose()
+        else:
+            env = gp.Env(empty=True)
+            env.setParam("OutputFlag", 0)
+            env.start()
+            model, _, _ = to_gurobi(data, env)
+            model.dispose()
+            env.dispose()
+    return (time.perf_counter() - start) / N
+
+
+if __name__ == "__main__":
+    eager = import_seconds(EAGER)
+    lazy = import_seconds(LAZY)
+    print(f"startup: eager imports {eager:.2f}s, lazy imports {lazy:.2f}s ({eager - lazy:.2f}s saved)")
+
+    data = build_form2(plant_data.plant_params(), plant_data.d, plant_data.scenario1, alpha=0.5)
+    creation_seconds(data, shared=True)  # start the shared environment outside the timing
+    separate = creation_seconds(data, shared=False)
+    shared = creation_seconds(data, shared=True)
+    print(f"model creation: own env {separate*1000:.1f} ms, shared env {shared*1000:.1f} ms "
+          f"({(separate - shared)*1000:.1f} ms saved per model)")
@@ -0,0 +1,42 @@
+import time
+
+import numpy as np
+
+import plant_data
+from model_builder import FORM2
+from parametric import sweep
+from surrogate import active_sweep
+
+# ===========================================================
+# FULL GRID vs. ACTIVE-LEARNING SURROGATE
+# ===========================================================
+# The 5 scenarios x 10 alpha x 3 lambda grid is solved exactly point by point
+# and with active_sweep() under a budget of solves. Reported are the solve
+# counts and times, the relative error of the predicted objective at the
+# points that were not solved, and the share of those within 2 std.
+
+alpha_vec = np.linspace(0, 1, 10).tolist()
+lambda_vec = [1, 10, 100]
+budget = 45
+
+
+if __name__ == "__main__":
+    params = plant_data.plant_params()
+    scenarios = {name: (plant_data.d, p_RE) for name, p_RE in plant_data.scenario_dict.items()}
+    start = time.perf_counter()
+    exact = {name: sweep(FORM2, params, d, p_RE, alpha_vec, lambda_vec) for name, (d, p_RE) in scenarios.items()}
+    t_exact = time.perf_counter() - start
+    start = time.perf_counter()
+    result = active_sweep(FORM2, params, scenarios, alpha_vec, lambda_vec, budget=budget)
+    t_active = time.perf_counter() - start
+
+    rel_err, z = [], []
+    for name in scenarios:
+        predicted = ~result.solved[name]
+        err = result.mean["objective"][name][predicted] - exact[name][predicted]
+        rel_err.extend(np.abs(err) / np.maximum(1.0, np.abs(exact[name][predicted])))
+        z.extend(np.abs(err) / np.maximum(result.std["objective"][name][predicted], 1e-9))
+    print(f"exact:  {sum(m.size for m in exact.values())} solves, {t_exact:.1f} s")
+    print(f"active: {result.solves} solves, {t_active:.1f} s")
+    print(f"predicted points: median rel. error {np.nanmedian(rel_err):.2e}, max {np.nanmax(rel_err):.2e}, "
+          f"within 2 std {np.mean(np.array(z) < 2):.0%}")
@@ -0,0 +1,38 @@
+import time
+
+import numpy as np
+
+import plant_data
+from model_builder import FORM1
+from parametric import sweep
+from sweep import run_sweep, thread_budget
+
+# ===========================================================
+# SERIAL vs. PROCESS-POOL SWEEP
+# ===========================================================
+# The 5 scenarios x 10 alphas x 3 lambdas grid of Form1alphasTest.py, solved
+# by the serial build-once loop and by sweep.run_sweep with 1..16 workers.
+
+alpha_vec = np.linspace(0, 1, 10).tolist()
+lambda_vec = [1, 10, 100]
+worker_counts = (1, 2, 4, 8, 16)
+
+
+if __name__ == "__main__":
+    params = plant_data.plant_params()
+    scenarios = {name: (plant_data.d, p_RE) for name, p_RE in plant_data.scenario_dict.items()}
+
+    start = time.perf_counter()
+    serial = {name: sweep(FORM1, params, d, p_RE, alpha_vec, lambda_vec)
+              for name, (d, p_RE) in scenarios.items()}
+    t_serial = time.perf_counter() - start
+    print(f"serial loop: {t_serial:.2f}s")
+
+    for workers in worker_counts:
+        start = time.perf_counter()
+        parallel = run_sweep(FORM1, params, scenarios, alpha_vec, lambda_vec, workers=workers)
+        elapsed = time.perf_counter() - start
+        diff = max(np.nanmax(np.abs(serial[name] - parallel[name]) / np.maximum(1.0, np.abs(serial[name])))
+                   for name in scenarios)
+        print(f"{workers:2d} workers x {thread_budget(workers):2d} threads: {elapsed:7.2f}s  "
+              f"speedup {t_serial / elapsed:5.2f}  max rel. objective difference {diff:.2e}")
@@ -0,0 +1,166 @@
+import numpy as np
+
+from plant_data import as_series, initial_state
+from model_builder import _Assembler, _add_excess, _window
+
+# ===========================================================
+# CLUSTERED FORMULATION FOR FLEETS OF IDENTICAL UNITS
+# ===========================================================
+# Units with the same (q, Q, L, l, c_SU, c_NL, c_var) are interchangeable, so
+# a group g of N_g such units is described by integer counts instead of one
+# binary per unit and period:
+#   u[t,g]  units on, v[t,g] units started, w[t,g] units stopped  (0..N_g)
+#   x[t,g]  total output of the group
+# The rows are the Form2 rows written for counts:
+#   (1) Demand:   sum_g x[t,g] + alpha*p_RE[t] >= d[t]
+#   (2) MinProd:  x[t,g] >= q_g*u[t,g]    (3) MaxProd: x[t,g] <= Q_g*u[t,g]
+#   (4) Dynamic:  u[t,g] - u[t-1,g] - v[t,g] + w[t,g] = 0, u[0,g] = units on at t=0
+#   (6) UpTime:   sum_{j=t-L+1}^{t} v[j,g] + F1[t,g] <= u[t,g]
+#   (7) DownTime: sum_{j=t-l+1}^{t} w[j,g] + F0[t,g] <= N_g - u[t,g]
+#   (8) Excess as in Form2
+# F1[t,g] (F0[t,g]) is the number of units of g that are still forced on (off)
+# at t by their own U1/U0 history, so units with different histories can share
+# a group. disaggregate() turns a clustered solution into a per-unit schedule.
+#
+# Model size depends on the number of distinct unit types only.
+
+PARAM_KEYS = ("q", "Q", "L", "l", "c_SU", "c_NL", "c_var")
+
+
+def cluster_units(params):
+    """Group plant indices with identical parameters; returns a list of index arrays."""
+    groups = {}
+    for i in range(len(params["q"])):
+        key = tuple(params[k][i] for k in PARAM_KEYS)
+        groups.setdefault(key, []).append(i)
+    return [np.array(members) for members in groups.values()]
+
+
+def _forced_counts(params, groups, T):
+    """(T, G) arrays F1 and F0: units of each group still forced on / off by their history."""
+    u0, T_init = initial_state(params)
+    periods = np.arange(1, T+1)
+    F1 = np.zeros((T, len(groups)))
+    F0 = np.zeros((T, len(groups)))
+    for g, members in enumerate(groups):
+        for i in members:
+            forced = periods <= T_init[i]
+            if u0[i] == 1:
+                F1[:, g] += forced
+            else:
+                F0[:, g] += forced
+    return F1, F0
+
+
+def build_clustered(params, d, p_RE=None, alpha=0.0, lam=10, names=False, groups=None):
+    """Assemble the clustered model (integer u, v, w and continuous x per group) as a ModelData.
+
+    Arguments as in model_builder.build_form1; groups defaults to cluster_units(params).
+    var_blocks hold (T, G) arrays, and data.groups the plant indices of each group.
+    """
+    groups = cluster_units(params) if groups is None else groups
+    G = len(groups)
+    d_arr = as_series(d, len(d))
+    T = len(d_arr)
+    p_arr = as_series(p_RE, T)
+    u0, _ = initial_state(params)
+    first = [members[0] for members in groups]
+    size = np.array([len(members) for members in groups], dtype=float)
+    q, Q, L, l, c_SU, c_NL, c_var = (np.array([params[k][i] for i in first], dtype=float)
+                                     for k in PARAM_KEYS)
+    on0 = np.array([sum(u0[i] for i in members) for members in groups], dtype=float)
+    F1, F0 = _forced_counts(params, groups, T)
+
+    asm = _Assembler("PlantScheduling_Clustered", T, G, names)
+    u = asm.add_vars("u", (T, G), "I", np.broadcast_to(c_NL, (T, G)), ub=size)
+    v = asm.add_vars("v", (T, G), "I", np.broadcast_to(c_SU, (T, G)), ub=size)
+    w = asm.add_vars("w", (T, G), "I", 0.0, ub=size)
+    x = asm.add_vars("x", (T, G), "C", np.broadcast_to(c_var, (T, G)))
+    s = asm.add_vars("s", (T,), "C", lam)
+
+    tt = np.arange(T)
+    # (1) Demand
+    asm.add_rows("Demand", T, np.repeat(tt, G), x.ravel(), 1.0, ">", d_arr - alpha * p_arr,
+                 lambda: [f"Demand_t{t}" for t in range(1, T+1)])
+    # (2) MinProd and (3) MaxProd
+    rows = np.arange(T * G)
+    for block, bound, sense in (("MinProd", q, ">"), ("MaxProd", Q, "<")):
+        asm.add_rows(block, T * G,
+                     np.concatenate([rows, rows]), np.concatenate([x.ravel(), u.ravel()]),
+                     np.concatenate([np.ones(T * G), -np.broadcast_to(bound, (T, G)).ravel()]),
+                     sense, 0.0,
+                     lambda block=block: [f"{block}_t{t}_g{g}" for t in range(1, T+1) for g in range(G)])
+    # (4) Dynamic
+    gg = np.tile(np.arange(G), T)
+    has_prev = np.repeat(tt, G) > 0
+    prev_col = np.where(has_prev, u[np.maximum(np.repeat(tt, G) - 1, 0), gg], -1)
+    asm.add_rows("Dynamic", T * G,
+                 np.concatenate([rows, rows, rows, rows[has_prev]]),
+                 np.concatenate([u.ravel(), v.ravel(), w.ravel(), prev_col[has_prev]]),
+                 np.concatenate([np.ones(T * G), -np.ones(T * G), np.ones(T * G),
+                                 -np.ones(int(has_prev.sum()))]),
+                 "=", on0[gg] * (~has_prev),
+                 lambda: [f"Dynamic_t{t}_g{g}" for t in range(1, T+1) for g in range(G)])
+
+    for g in range(G):
+        # (6) UpTime and (7) DownTime
+        for block, width, z, u_coef, rhs in (("UpTime", L[g], v, -1.0, -F1[:, g]),
+                                             ("DownTime", l[g], w, 1.0, size[g] - F0[:, g])):
+            wrows, j = _window(tt, 0, max(int(width), 1))
+            asm.add_rows(block, T,
+                         np.concatenate([wrows, tt]), np.concatenate([z[j, g], u[:, g]]),
+                         np.concatenate([np.ones(len(wrows)), np.full(T, u_coef)]),
+                         "<", rhs, lambda block=block, g=g: [f"{block}_t{t}_g{g}" for t in range(1, T+1)])
+
+    _add_excess(asm, T, G, x, s, d_arr, p_arr, alpha)
+    data = asm.finish()
+    data.groups = groups
+    return data
+
+
+def disaggregate(params, groups, values):
+    """Per-unit schedule {"u", "v", "w", "x"} ((T, n) arrays) and "s" from a clustered solution.
+
+    Units are switched in the order of how long they have been in their state
+    (longest first), which keeps every unit within its own min up/down times
+    and U1/U0 history whenever the clustered rows hold.
+    """
+    L, l = params["L"], params["l"]
+    u0, _ = initial_state(params)
+    T = values["u"].shape[0]
+    n = len(params["q"])
+    counts = np.rint(values["u"]).astype(int)
+    sched = {family: np.zeros((T, n)) for family in ("u", "v", "w", "x")}
+    for g, members in enumerate(groups):
+        state = np.array([u0[i] for i in members])
+        # periods in the current state, counted from the U1/U0 history
+        age = np.array([params["U1"][i] if u0[i] else params["U0"][i] for i in members])
+        min_on = np.array([L[i] for i in members])
+        min_off = np.array([l[i] for i in members])
+        for t in range(T):
+            change = counts[t, g] - int(state.sum())
+            if change != 0:
+                turning_on = change > 0
+                ready = (state == (0 if turning_on else 1)) & \
+                        (age >= (min_off if turning_on else min_on))
+                candidates = np.flatnonzero(ready)
+                if len(candidates) < abs(change):
+                    raise ValueError(f"Group {g} cannot switch {abs(change)} units at t={t+1}.")
+                chosen = candidates[np.argsort(-age[candidates], kind="stable")[:abs(change)]]
+                state[chosen] = 1 if turning_on else 0
+                age[chosen] = 0
+                sched["v" if turning_on else "w"][t, members[chosen]] = 1
+            age += 1
+            sched["u"][t, members] = state
+            on = int(state.sum())
+            if on:
+                sched["x"][t, members] = state * values["x"][t, g] / on
+    sched["s"] = values["s"]
+    return sched
+
+
+def replicate_fleet(params, copies):
+    """Plant parameter dicts for `copies` copies of every plant (with the same history)."""
+    n = len(params["q"])
+    return {key: {k * n + i: values[i] for k in range(copies) for i in range(n)}
+            for key, values in params.items()}
@@ -0,0 +1,77 @@
+import numpy as np
+
+from plant_data import initial_state
+
+# ===========================================================
+# MERIT-ORDER ECONOMIC DISPATCH FOR A FIXED COMMITMENT
+# ===========================================================
+# With u fixed, the remaining problem of every formulation is, hour by hour,
+#   min sum_i c_var[i] x[t,i] + lam * s[t]
+#   s.t. sum_i x[t,i] - s[t] = net[t] = d[t] - alpha * p_RE[t],
+#        q[i] u[t,i] <= x[t,i] <= Q[i] u[t,i],  s[t] >= 0.
+# Since c_var >= 0 and lam >= 0 its optimum is closed-form: every committed
+# unit produces q[i]; the rest of net[t] is filled in ascending c_var order up
+# to Q[i]; anything above net[t] is excess s[t]. If the committed capacity is
+# below net[t] the schedule is infeasible and the missing amount is returned
+# as shortfall.
+#
+# All arrays may carry leading batch axes: u is (..., T, n) and net is (T,) or
+# (..., T); the loop runs over the n plants only, every step covering all
+# hours and schedules at once. Trivial plants (model_builder.trivial_units)
+# have no commitment logic and may produce up to Q[i] whatever u says.
+
+FEASIBILITY_TOL = 1e-6
+
+
+class MeritOrder:
+    """Closed-form dispatch and cost of commitment schedules for one set of plants."""
+
+    def __init__(self, params, trivial=None):
+        n = len(params["q"])
+        self.n = n
+        self.q, self.Q, self.c_var, self.c_NL, self.c_SU = (
+            np.array([params[key][i] for i in range(n)], dtype=float)
+            for key in ("q", "Q", "c_var", "c_NL", "c_SU"))
+        self.trivial = np.zeros(n, dtype=bool) if trivial is None else np.asarray(trivial, dtype=bool)
+        u0, _ = initial_state(params)
+        self.u0 = np.array([u0[i] for i in range(n)], dtype=float)
+        self.order = np.argsort(self.c_var, kind="stable")
+
+    def dispatch(self, u, net):
+        """(x, s, shortfall) for commitment u (..., T, n) and net demand net (T,) or (..., T)."""
+        u = np.asarray(u, dtype=float)
+        x = self.q * u
+        room = np.where(self.trivial, self.Q, self.Q * u) - x
+        need = np.broadcast_to(np.asarray(net, dtype=float), u.shape[:-1]) - x.sum(axis=-1)
+        for i in self.order:
+            add = np.clip(need, 0.0, room[..., i])
+            x[..., i] += add
+            need = need - add
+        s = np.maximum(-need, 0.0)
+        return x, s, np.maximum(need, 0.0)
+
+    def startups(self, u):
+        """Startup indicators (..., T, n) of u, with the initial state before t=1."""
+        u = np.asarray(u, dtype=float)
+        prev = np.concatenate([np.broadcast_to(self.u0, u.shape[:-2] + (1, self.n)), u[..., :-1, :]], axis=-2)
+        return np.maximum(u - prev, 0.0)
+
+    def cost(self, u, x, s, lam):
+        """Objective of the formulations for given u, x and s, per schedule (...)."""
+        u = np.asarray(u, dtype=float)
+        return (x @ self.c_var + u @ self.c_NL + self.startups(u) @ self.c_SU).sum(axis=-1) \
+            + lam * np.asarray(s).sum(axis=-1)
+
+    def evaluate(self, u, net, lam):
+        """(x, s, cost) of commitment u; cost is inf for schedules that cannot cover net demand."""
+        x, s, shortfall = self.dispatch(u, net)
+        cost = self.cost(u, x, s, lam)
+        return x, s, np.where(shortfall.max(axis=-1) > FEASIBILITY_TOL, np.inf, cost)
+
+
+def merit_order_dispatch(u, net, params, trivial=None):
+    """Cheapest x (T, n) for commitment u covering net demand, or None if u lacks the capacity."""
+    x, _, shortfall = MeritOrder(params, trivial).dispatch(u, net)
+    if np.any(shortfall > FEASIBILITY_TOL):
+        return None
+    return x
@@ -0,0 +1,279 @@
+import json
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+
+import numpy as np
+
+from parametric import ParametricModel
+from plant_data import as_series
+
+# ===========================================================
+# RESUMABLE SQLITE JOB QUEUE FOR LONG SWEEPS
+# ===========================================================
+# plan_sweep() writes the full problem description (formulation, plant dicts,
+# scenario series, options) and one job row per (scenario, alpha, lambda)
+# into a SQLite file. Workers, in any number of processes on one machine or
+# on several machines that share the file, then:
+#   - claim a pending job inside BEGIN IMMEDIATE, so no two workers get the
+#     same job (jobs of the scenario a worker already has a model for are
+#     preferred, keeping the build-once ParametricModel useful),
+#   - write the objective and solve time back as soon as the job is solved.
+# Planning the same sweep again only adds missing jobs; planning it with a
+# different configuration is refused unless reset=True, which drops its old
+# jobs and results. While a job is solved, a heartbeat thread (with its own
+# connection) refreshes its claimed_at every HEARTBEAT seconds. Before every
+# claim, running jobs without a heartbeat for stale_after seconds (their
+# worker has died) go back to pending, so a sweep resumes where it stopped,
+# and long solves are never handed out twice. Failed jobs stay failed until retry_failed() puts
+# them back; a worker that cannot build its model stops instead of failing
+# every job.
+#
+# The rollback journal (not WAL) is used, because WAL needs shared memory and
+# does not work for a database on a network filesystem.
+#
+#   python job_queue.py worker sweep.db NAME [STALE_AFTER]   run a worker until no job is left
+#   python job_queue.py progress sweep.db NAME                print progress and ETA
+#   python job_queue.py retry sweep.db NAME                   put failed jobs back to pending
+
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+HEARTBEAT = 30.0        # seconds between claimed_at refreshes of a running job
+STALE_AFTER = 300.0     # seconds without a heartbeat after which a running job is requeued
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sweeps (
+    name TEXT PRIMARY KEY,
+    formulation TEXT NOT NULL,
+    config TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    sweep TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    i_lambda INTEGER NOT NULL,
+    i_alpha INTEGER NOT NULL,
+    lam REAL NOT NULL,
+    alpha REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    claimed_at REAL,
+    finished_at REAL,
+    objective REAL,
+    runtime REAL,
+    error TEXT,
+    UNIQUE (sweep, scenario, i_lambda, i_alpha)
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (sweep, status);
+"""
+
+
+def connect(db_path):
+    """Autocommit connection (transactions are opened explicitly) with the schema in place."""
+    conn = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def plan_sweep(db_path, name, formulation, params, scenarios, alpha_vec, lambda_vec, reset=False, **options):
+    """Register a sweep and its jobs; scenarios maps a name to (d, p_RE).
+
+    Safe to call again with the same configuration. A different configuration
+    raises ValueError, or with reset=True replaces the sweep and drops its jobs.
+    """
+    T = len(next(iter(scenarios.values()))[0])
+    config = {"params": {key: {str(i): v for i, v in values.items()} for key, values in params.items()},
+              "scenarios": {s: [as_series(d, T).tolist(), as_series(p_RE, T).tolist()]
+                            for s, (d, p_RE) in scenarios.items()},
+              "options": options}
+    jobs = [(name, s, i_lambda, i_alpha, float(lam), float(a))
+            for s in scenarios for i_lambda, lam in enumerate(lambda_vec) for i_alpha, a in enumerate(alpha_vec)]
+    conn = connect(db_path)
+    config = json.dumps(config)
+    conn.execute("BEGIN IMMEDIATE")
+    old = conn.execute("SELECT formulation, config FROM sweeps WHERE name = ?", (name,)).fetchone()
+    if old is not None and (old[0] != formulation or json.loads(old[1]) != json.loads(config)):
+        if not reset:
+            conn.execute("ROLLBACK")
+            conn.close()
+            raise ValueError(f"Sweep {name!r} is already planned with a different configuration; "
+                             "pass reset=True to replace it")
+        conn.execute("DELETE FROM jobs WHERE sweep = ?", (name,))
+    conn.execute("INSERT OR REPLACE INTO sweeps VALUES (?, ?, ?)", (name, formulation, config))
+    conn.executemany("INSERT OR IGNORE INTO jobs (sweep, scenario, i_lambda, i_alpha, lam, alpha) "
+                     "VALUES (?, ?, ?, ?, ?, ?)", jobs)
+    conn.execute("COMMIT")
+    conn.close()
+
+
+def load_sweep(conn, name):
+    """(formulation, params, scenarios, options) of a planned sweep."""
+    formulation, config = conn.execute("SELECT formulation, config FROM sweeps WHERE name = ?",
+                                       (name,)).fetchone()
+    config = json.loads(config)
+    params = {key: {int(i): v for i, v in values.items()} for key, values in config["params"].items()}
+    scenarios = {s: (np.array(d), np.array(p_RE)) for s, (d, p_RE) in config["scenarios"].items()}
+    return formulation, params, scenarios, config["options"]
+
+
+def requeue_stale(conn, name, stale_after):
+    """Put running jobs without a heartbeat for more than stale_after seconds back to pending; returns the count."""
+    cur = conn.execute("UPDATE jobs SET status = ?, worker = NULL WHERE sweep = ? AND status = ? "
+                       "AND claimed_at < ?", (PENDING, name, RUNNING, time.time() - stale_after))
+    return cur.rowcount
+
+
+def retry_failed(conn, name):
+    """Put failed jobs back to pending; returns the count."""
+    cur = conn.execute("UPDATE jobs SET status = ?, worker = NULL, error = NULL WHERE sweep = ? AND status = ?",
+                       (PENDING, name, FAILED))
+    return cur.rowcount
+
+
+def release(conn, job_id):
+    """Give a claimed job back to the queue unsolved."""
+    conn.execute("UPDATE jobs SET status = ?, worker = NULL WHERE id = ?", (PENDING, job_id))
+
+
+def claim(conn, name, worker, prefer_scenario=None):
+    """Atomically claim one pending job; returns (id, scenario, lam, alpha) or None when none is left."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT id, scenario, lam, alpha FROM jobs WHERE sweep = ? AND status = ? "
+                           "ORDER BY scenario = ? DESC, id LIMIT 1",
+                           (name, PENDING, prefer_scenario or "")).fetchone()
+        if row is not None:
+            conn.execute("UPDATE jobs SET status = ?, worker = ?, claimed_at = ? WHERE id = ?",
+                         (RUNNING, worker, time.time(), row[0]))
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return row
+
+
+class Heartbeat:
+    """Context manager that refreshes claimed_at of a running job every `interval` seconds."""
+
+    def __init__(self, db_path, job_id, worker, interval=HEARTBEAT):
+        self.db_path = db_path
+        self.job_id = job_id
+        self.worker = worker
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        conn = sqlite3.connect(self.db_path, timeout=60, isolation_level=None)
+        try:
+            while not self._stop.wait(self.interval):
+                conn.execute("UPDATE jobs SET claimed_at = ? WHERE id = ? AND status = ? AND worker = ?",
+                             (time.time(), self.job_id, RUNNING, self.worker))
+        finally:
+            conn.close()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def complete(conn, job_id, objective, runtime):
+    conn.execute("UPDATE jobs SET status = ?, objective = ?, runtime = ?, finished_at = ? WHERE id = ?",
+                 (DONE, None if np.isnan(objective) else objective, runtime, time.time(), job_id))
+
+
+def fail(conn, job_id, error):
+    conn.execute("UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                 (FAILED, error, time.time(), job_id))
+
+
+def run_worker(db_path, name, worker=None, stale_after=STALE_AFTER):
+    """Claim and solve jobs of sweep `name` until none is pending; returns the number solved.
+
+    An error while building a scenario's model releases the job and is raised.
+    """
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    conn = connect(db_path)
+    formulation, params, scenarios, options = load_sweep(conn, name)
+    models = {}
+    current = None
+    solved = 0
+    while True:
+        requeue_stale(conn, name, stale_after)
+        job = claim(conn, name, worker, current)
+        if job is None:
+            break
+        job_id, current, lam, alpha = job
+        if current not in models:
+            try:
+                d, p_RE = scenarios[current]
+                models[current] = ParametricModel(formulation, params, d, p_RE, **options)
+            except Exception:  # a broken setup (licence, options) would fail every job; stop instead
+                release(conn, job_id)
+                for model in models.values():
+                    model.dispose()
+                conn.close()
+                raise
+        try:
+            model = models[current]
+            model.set_alpha(alpha)
+            model.set_lambda(lam)
+            start = time.perf_counter()
+            with Heartbeat(db_path, job_id, worker):
+                obj = model.solve()
+            complete(conn, job_id, obj, time.perf_counter() - start)
+            solved += 1
+        except Exception as e:  # keep the worker alive; retry_failed() puts the job back
+            fail(conn, job_id, repr(e))
+    for model in models.values():
+        model.dispose()
+    conn.close()
+    return solved
+
+
+def progress(conn, name):
+    """Job counts per status, throughput over the finished jobs and an ETA in seconds."""
+    counts = dict(conn.execute("SELECT status, COUNT(*) FROM jobs WHERE sweep = ? GROUP BY status",
+                               (name,)).fetchall())
+    first, last, done = conn.execute("SELECT MIN(claimed_at), MAX(finished_at), COUNT(*) FROM jobs "
+                                     "WHERE sweep = ? AND status = ?", (name, DONE)).fetchone()
+    remaining = counts.get(PENDING, 0) + counts.get(RUNNING, 0)
+    rate = done / (last - first) if done and last > first else float('nan')
+    return {"counts": {status: counts.get(status, 0) for status in (PENDING, RUNNING, DONE, FAILED)},
+            "total": sum(counts.values()),
+            "jobs_per_second": rate,
+            "eta_seconds": remaining / rate if rate > 0 else float('nan')}
+
+
+def results(conn, name):
+    """Objective matrices {scenario: (len(lambda_vec) x len(alpha_vec))}; unfinished points are NaN."""
+    shape = conn.execute("SELECT MAX(i_lambda) + 1, MAX(i_alpha) + 1 FROM jobs WHERE sweep = ?",
+                         (name,)).fetchone()
+    matrices = {}
+    for scenario, i_lambda, i_alpha, obj in conn.execute(
+            "SELECT scenario, i_lambda, i_alpha, objective FROM jobs WHERE sweep = ? AND status = ?",
+            (name, DONE)):
+        matrix = matrices.setdefault(scenario, np.full(shape, np.nan))
+        matrix[i_lambda, i_alpha] = np.nan if obj is None else obj
+    return matrices
+
+
+if __name__ == "__main__":
+    command, db_path, name = sys.argv[1:4]
+    if command == "worker":
+        stale_after = float(sys.argv[4]) if len(sys.argv) > 4 else STALE_AFTER
+        print(f"solved {run_worker(db_path, name, stale_after=stale_after)} jobs")
+    elif command == "retry":
+        print(f"requeued {retry_failed(connect(db_path), name)} failed jobs")
+    elif command == "progress":
+        status = progress(connect(db_path), name)
+        print(", ".join(f"{k} {v}" for k, v in status["counts"].items()),
+              f"| {status['jobs_per_second']:.2f} jobs/s | ETA {status['eta_seconds'] / 60:.1f} min")
+    else:
+        raise SystemExit(f"Unknown command: {command}")
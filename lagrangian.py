@@ -0,0 +1,96 @@
+import numpy as np
+
+from model_builder import trivial_units
+from plant_data import as_series
+from priority_list import priority_schedule
+from unit_dp import unit_dp
+
+# ===========================================================
+# LAGRANGIAN RELAXATION OF THE DEMAND/EXCESS BALANCE
+# ===========================================================
+# The plants of Form1/Form2 are coupled only by the hourly balance
+#   sum_i x[t,i] - s[t] = net[t] = d[t] - alpha * p_RE[t]   (Demand_t/Excess_t)
+# Dualising it with multipliers pi[t] gives the dual function
+#   D(pi) = pi . net + sum_i DP_i(pi) + sum_t min_{s >= 0} (lam + pi[t]) s[t],
+# where DP_i is the exact single-unit problem of unit_dp.py against prices pi
+# (all plants in one batched call). The last term is 0 for pi >= -lam and
+# -inf below, so pi is kept in that range. Every D(pi) is a certified lower
+# bound on the MIP optimum.
+#
+# pi is moved along the subgradient net - sum_i x_i + s with Polyak steps
+# theta * (UB - D) / |g|^2; theta is halved after `patience` iterations
+# without a better bound. Every primal_every iterations (and at the end)
+# the DP commitment is turned into a feasible schedule: priority_list.py
+# tops it up where it cannot cover net demand, repairs min up/down, drops
+# unprofitable runs and dispatches in merit order. The best schedule is the
+# upper bound; the run stops when (UB - LB) / UB <= gap_tol.
+#
+# Starting multipliers are the marginal c_var of the priority-list dispatch.
+
+
+class LagrangianResult:
+    """Bounds, multipliers and best feasible schedule of a lagrangian() run."""
+
+    def __init__(self, lower_bound, upper_bound, multipliers, u, x, s, iterations, history):
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+        self.multipliers = multipliers
+        self.u = u
+        self.x = x
+        self.s = s
+        self.iterations = iterations
+        self.history = history    # (lower bound, upper bound) per iteration
+
+    @property
+    def gap(self):
+        """Relative duality gap (UB - LB) / |UB| of the certified bounds."""
+        return (self.upper_bound - self.lower_bound) / max(abs(self.upper_bound), 1e-9)
+
+
+def dual_value(params, net, lam, pi):
+    """(D(pi), subgradient, u) of the dual function at multipliers pi >= -lam; u is (T, n)."""
+    u, x, cost = unit_dp(params, pi)
+    total = x.sum(axis=0)
+    s = np.where(pi <= -lam, np.maximum(total - net, 0.0), 0.0)
+    return float(pi @ net + cost.sum()), net - total + s, u.T
+
+
+def lagrangian(params, d, p_RE=None, alpha=0.0, lam=10, max_iter=300, gap_tol=1e-3, theta=1.0,
+               patience=10, primal_every=10, trivial=None):
+    """Lagrangian relaxation of the unit commitment at one (alpha, lambda) point."""
+    T = len(d)
+    net = as_series(d, T) - alpha * as_series(p_RE, T)
+    trivial = trivial_units(params) if trivial is None else trivial
+    c_var = np.array([params["c_var"][i] for i in range(len(params["q"]))], dtype=float)
+
+    u_best, x_best, s_best, upper = priority_schedule(params, net, lam, trivial)
+    pi = np.where(x_best > 1e-6, c_var, 0.0).max(axis=1)
+    lower = -np.inf
+    pi_best = pi.copy()
+    history = []
+    since_improved = 0
+    it = 0
+    for it in range(1, max_iter + 1):
+        value, g, u = dual_value(params, net, lam, pi)
+        if value > lower + 1e-9 * max(1.0, abs(value)):
+            lower, pi_best, since_improved = value, pi.copy(), 0
+        else:
+            since_improved += 1
+            if since_improved >= patience:
+                theta, since_improved = theta / 2, 0
+        if it % primal_every == 0:
+            candidate = priority_schedule(params, net, lam, trivial, initial=u)
+            if candidate[3] < upper:
+                u_best, x_best, s_best, upper = candidate
+        history.append((lower, upper))
+        norm = g @ g
+        if (upper - lower) <= gap_tol * abs(upper) or norm < 1e-12 or theta < 1e-6:
+            break
+        target = upper if np.isfinite(upper) else value + 0.05 * abs(value)
+        pi = np.maximum(pi + theta * (target - value) / norm * g, -lam)
+
+    _, _, u = dual_value(params, net, lam, pi_best)
+    candidate = priority_schedule(params, net, lam, trivial, initial=u)
+    if candidate[3] < upper:
+        u_best, x_best, s_best, upper = candidate
+    return LagrangianResult(lower, upper, pi_best, u_best, x_best, s_best, it, history)
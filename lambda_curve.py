@@ -0,0 +1,116 @@
+import numpy as np
+
+from parametric import ParametricModel
+
+# ===========================================================
+# EXACT COST-VERSUS-LAMBDA CURVE FOR ONE (SCENARIO, ALPHA)
+# ===========================================================
+# lambda only enters the objective (lam * s[t]), so every schedule z is
+# feasible for every lambda and costs the line
+#     cost_z(lam) = C0_z + lam * S_z,   S_z = sum_t s[t],
+# and the optimal cost f(lam) = min_z cost_z(lam) is concave and piecewise
+# linear. The schedules found so far (optima and the solver's pool of
+# near-optimal solutions) give an upper envelope of f. On an interval [lo, hi]
+# whose end values are exact, the envelope lines a (optimal at lo) and b
+# (optimal at hi) are intersected at lam*, and one MIP is solved there:
+#   - if f(lam*) equals the envelope, f is the envelope on [lo, hi]
+#     (concavity keeps f above the chords through the three exact points);
+#   - otherwise the new schedule adds a line and both halves are examined.
+# Each solve either confirms a breakpoint or adds a line, so the curve costs
+# about two solves per linear piece.
+
+
+class LambdaCurve:
+    """Piecewise-linear optimal cost over [lam_min, lam_max] and the schedules behind it."""
+
+    def __init__(self, lam_min, lam_max):
+        self.lam_min = lam_min
+        self.lam_max = lam_max
+        self.C0 = np.zeros(0)
+        self.S = np.zeros(0)
+        self.solutions = []
+        self.breakpoints = []
+        self.solves = 0
+
+    def add(self, z, cost, lam, S):
+        self.C0 = np.append(self.C0, cost - lam * S)
+        self.S = np.append(self.S, S)
+        self.solutions.append(z)
+
+    def evaluate(self, lams):
+        """Optimal cost at each lambda in lams (within [lam_min, lam_max])."""
+        lams = np.atleast_1d(np.asarray(lams, dtype=float))
+        return np.min(self.C0[:, None] + self.S[:, None] * lams[None, :], axis=0)
+
+    def line_at(self, lam, right=True):
+        """Index of the optimal line at lam; ties go to the line that stays optimal to the right (left)."""
+        cost = self.C0 + self.S * lam
+        ties = np.flatnonzero(cost <= cost.min() + 1e-9 * max(1.0, abs(cost.min())))
+        return ties[np.argmin(self.S[ties])] if right else ties[np.argmax(self.S[ties])]
+
+    def schedule(self, lam):
+        """Solution vector (columns of the model's ModelData) that is optimal at lam."""
+        return self.solutions[self.line_at(lam)]
+
+    def pieces(self):
+        """[(lam_from, lam_to, C0, S)] of the optimal cost over [lam_min, lam_max]."""
+        edges = [self.lam_min] + sorted(self.breakpoints) + [self.lam_max]
+        result = []
+        for lo, hi in zip(edges[:-1], edges[1:]):
+            k = self.line_at(0.5 * (lo + hi))
+            result.append((lo, hi, self.C0[k], self.S[k]))
+        return result
+
+
+def _solve_at(pm, curve, lam):
+    pm.set_lambda(lam)
+    cost = pm.solve()
+    curve.solves += 1
+    if np.isnan(cost):
+        raise RuntimeError(f"No optimal solution at lambda={lam}.")
+    s_cols = pm.data.var_blocks["s"]
+    for z in pm.pool():
+        curve.add(z, float(pm.data.obj @ z + pm.data.obj_const), lam, float(z[s_cols].sum()))
+    return cost
+
+
+def lambda_curve(pm, lam_min, lam_max, rtol=1e-9):
+    """Exact LambdaCurve of a ParametricModel over [lam_min, lam_max] at its current alpha and p_RE."""
+    curve = LambdaCurve(lam_min, lam_max)
+    _solve_at(pm, curve, lam_min)
+    if lam_max > lam_min:
+        _solve_at(pm, curve, lam_max)
+    intervals = [(lam_min, lam_max)] if lam_max > lam_min else []
+    while intervals:
+        lo, hi = intervals.pop()
+        a, b = curve.line_at(lo, right=True), curve.line_at(hi, right=False)
+        if abs(curve.S[a] - curve.S[b]) <= rtol * max(1.0, abs(curve.S[a])):
+            continue
+        lam = (curve.C0[b] - curve.C0[a]) / (curve.S[a] - curve.S[b])
+        if not lo < lam < hi:
+            continue
+        envelope = curve.C0[a] + curve.S[a] * lam
+        cost = _solve_at(pm, curve, lam)
+        if cost >= envelope - rtol * max(1.0, abs(envelope)):
+            curve.breakpoints.append(lam)
+        else:
+            intervals += [(lo, lam), (lam, hi)]
+    return curve
+
+
+def lambda_sweep(formulation, params, d, p_RE, alpha_vec, lambda_vec, env=None, **options):
+    """Objective matrix (len(lambda_vec) x len(alpha_vec)) from one LambdaCurve per alpha.
+
+    Same result as parametric.sweep, with solves only where breakpoints have to be found.
+    Returns (matrix, curves) where curves[i_alpha] is the LambdaCurve of alpha_vec[i_alpha].
+    """
+    pm = ParametricModel(formulation, params, d, p_RE, env=env, **options)
+    obj_values_matrix = np.zeros((len(lambda_vec), len(alpha_vec)))
+    curves = []
+    for i_alpha, a in enumerate(alpha_vec):
+        pm.set_alpha(a)
+        curve = lambda_curve(pm, min(lambda_vec), max(lambda_vec))
+        obj_values_matrix[:, i_alpha] = curve.evaluate(lambda_vec)
+        curves.append(curve)
+    pm.dispose()
+    return obj_values_matrix, curves
@@ -0,0 +1,452 @@
+import numpy as np
+import scipy.sparse as sp
+
+from plant_data import as_series, initial_state
+from propagation import propagate_initial_state, apply_fixings
+
+# ===========================================================
+# MATRIX-FORM MODEL ASSEMBLY FOR FORM1 AND FORM2
+# ===========================================================
+# The scripts build every row with model.addConstr inside nested t/i loops.
+# Here the same rows are generated as whole blocks from NumPy index arrays and
+# stored as one sparse matrix, so a model description costs a handful of array
+# operations and can be handed to the solver in a single addMConstr call.
+#
+# Variables are stored in one vector. var_blocks maps a family name ("u", "o",
+# "v", "w", "x", "s") to the positions of its entries: shape (T, n) for plant
+# variables and (T,) for s, where row k of the block is time period t = k+1.
+
+FORM1 = "Form1"
+FORM2 = "Form2"
+
+# Form1 min up/down modes for rows (5) and (7)
+PAIRWISE = "pairwise"
+AGGREGATED = "aggregated"
+
+
+class ModelData:
+    """Solver-independent MIP: min obj @ z + obj_const  s.t.  A z (sense) rhs,  lb <= z <= ub."""
+
+    def __init__(self, name, T, n):
+        self.name = name
+        self.T = T
+        self.n = n
+        self.var_blocks = {}
+        self.obj = np.zeros(0)
+        self.lb = np.zeros(0)
+        self.ub = np.zeros(0)
+        self.vtype = np.zeros(0, dtype="<U1")
+        self.var_names = None
+        self.A = sp.csr_matrix((0, 0))
+        self.sense = np.zeros(0, dtype="<U1")
+        self.rhs = np.zeros(0)
+        self.row_blocks = {}
+        self.row_names = None
+        self.obj_const = 0.0
+        self.trivial = np.zeros(n, dtype=bool)
+
+    @property
+    def num_vars(self):
+        return len(self.obj)
+
+    @property
+    def num_rows(self):
+        return self.A.shape[0]
+
+    @property
+    def nnz(self):
+        return self.A.nnz
+
+    def stats(self):
+        """Return a dict with the size of the model (variables, binaries, rows, nonzeros)."""
+        return {"vars": self.num_vars,
+                "binaries": int(np.count_nonzero(self.vtype == "B")),
+                "integers": int(np.count_nonzero(self.vtype == "I")),
+                "rows": self.num_rows,
+                "nnz": self.nnz}
+
+
+class _Assembler:
+    """Collects variable blocks and COO row blocks, then emits a ModelData."""
+
+    def __init__(self, name, T, n, names):
+        self.data = ModelData(name, T, n)
+        self.names = names
+        self.num_vars = 0
+        self.num_rows = 0
+        self._obj, self._lb, self._ub, self._vtype, self._var_names = [], [], [], [], []
+        self._rows, self._cols, self._vals = [], [], []
+        self._sense, self._rhs, self._row_names = [], [], []
+
+    def add_vars(self, family, shape, vtype, obj, lb=0.0, ub=np.inf):
+        size = int(np.prod(shape))
+        idx = np.arange(self.num_vars, self.num_vars + size).reshape(shape)
+        self.num_vars += size
+        self._obj.append(np.broadcast_to(np.asarray(obj, dtype=float), shape).ravel())
+        self._lb.append(np.broadcast_to(np.asarray(lb, dtype=float), shape).ravel())
+        self._ub.append(np.broadcast_to(np.asarray(ub, dtype=float), shape).ravel())
+        self._vtype.append(np.full(size, vtype, dtype="<U1"))
+        if self.names:
+            if len(shape) == 1:
+                self._var_names += [f"{family}[{k+1}]" for k in range(shape[0])]
+            else:
+                self._var_names += [f"{family}[{k+1},{i}]" for k in range(shape[0]) for i in range(shape[1])]
+        self.data.var_blocks[family] = idx
+        return idx
+
+    def add_rows(self, block, num, rows, cols, vals, sense, rhs, labels=None):
+        """Add `num` rows; rows/cols/vals are COO triplets with rows numbered 0..num-1.
+
+        labels is a callable returning the row names, only evaluated when names are requested.
+        """
+        if num == 0:
+            return
+        vals = np.broadcast_to(np.asarray(vals, dtype=float), np.shape(rows))
+        keep = vals != 0
+        self._rows.append(np.asarray(rows)[keep] + self.num_rows)
+        self._cols.append(np.asarray(cols)[keep])
+        self._vals.append(vals[keep])
+        self._sense.append(np.broadcast_to(np.asarray(sense, dtype="<U1"), (num,)))
+        self._rhs.append(np.broadcast_to(np.asarray(rhs, dtype=float), (num,)))
+        if self.names:
+            self._row_names += list(labels())
+        prev = self.data.row_blocks.get(block)
+        new = np.arange(self.num_rows, self.num_rows + num)
+        self.data.row_blocks[block] = new if prev is None else np.concatenate([prev, new])
+        self.num_rows += num
+
+    def finish(self):
+        data = self.data
+        data.obj = np.concatenate(self._obj)
+        data.lb = np.concatenate(self._lb)
+        data.ub = np.concatenate(self._ub)
+        data.vtype = np.concatenate(self._vtype)
+        rows = np.concatenate(self._rows)
+        cols = np.concatenate(self._cols)
+        vals = np.concatenate(self._vals)
+        data.A = sp.csr_matrix((vals, (rows, cols)), shape=(self.num_rows, self.num_vars))
+        data.sense = np.concatenate(self._sense)
+        data.rhs = np.concatenate(self._rhs)
+        if self.names:
+            data.var_names = self._var_names
+            data.row_names = self._row_names
+        return data
+
+
+def _prev_state(u, u0, t_idx, i):
+    """Column of u[t-1,i] for the 0-based period indices t_idx; -1 where the previous state is u0."""
+    return np.where(t_idx > 0, u[np.maximum(t_idx - 1, 0), i], -1)
+
+
+def trivial_units(params):
+    """Boolean array marking plants without commitment logic.
+
+    A plant with no minimum output, no fixed or startup cost, minimum up/down
+    times of at most one period and no forced initial state is the same as a
+    continuous capacity 0 <= x <= Q, so its u/start/stop columns are fixed at 0
+    and left out of every row (presolve.py then drops them).
+    """
+    _, T_init = initial_state(params)
+    return np.array([params["q"][i] == 0 and params["c_SU"][i] == 0 and params["c_NL"][i] == 0
+                     and params["L"][i] <= 1 and params["l"][i] <= 1 and T_init[i] == 0
+                     for i in range(len(params["q"]))], dtype=bool)
+
+
+def commitment_from_output(values, params, trivial, tol=1e-6):
+    """Fill in u and the startup/shutdown values of trivial plants in a values dict (on = producing)."""
+    if not trivial.any():
+        return values
+    u0, _ = initial_state(params)
+    on = values["x"][:, trivial] > tol
+    prev = np.vstack([[u0[i] == 1 for i in np.flatnonzero(trivial)], on[:-1]])
+    values["u"][:, trivial] = on
+    for family, indicator in (("o", on & ~prev), ("v", on & ~prev), ("w", ~on & prev)):
+        if family in values:
+            values[family][:, trivial] = indicator
+    return values
+
+
+def _committed_pairs(T, committed):
+    """0-based (t, i) index arrays of all periods of the plants that keep their commitment logic."""
+    return np.nonzero(np.broadcast_to(committed, (T, len(committed))))
+
+
+def _add_common(asm, T, n, params, d_arr, p_arr, alpha, lam, commit_families, trivial):
+    """Add x, s, the objective and the Demand/MinProd/MaxProd rows shared by both formulations."""
+    q = np.array([params["q"][i] for i in range(n)], dtype=float)
+    Q = np.array([params["Q"][i] for i in range(n)], dtype=float)
+    c_var = np.array([params["c_var"][i] for i in range(n)], dtype=float)
+    c_NL = np.array([params["c_NL"][i] for i in range(n)], dtype=float)
+    c_SU = np.array([params["c_SU"][i] for i in range(n)], dtype=float)
+
+    binary_ub = np.where(trivial, 0.0, 1.0)
+    u = asm.add_vars("u", (T, n), "B", np.broadcast_to(c_NL, (T, n)), ub=binary_ub)
+    start = asm.add_vars(commit_families[0], (T, n), "B", np.broadcast_to(c_SU, (T, n)), ub=binary_ub)
+    stop = None
+    if len(commit_families) > 1:
+        stop = asm.add_vars(commit_families[1], (T, n), "B", 0.0, ub=binary_ub)
+    x = asm.add_vars("x", (T, n), "C", np.broadcast_to(c_var, (T, n)), ub=np.where(trivial, Q, np.inf))
+    s = asm.add_vars("s", (T,), "C", lam)
+
+    tt = np.arange(T)
+    # (1) Demand: sum_i x[t,i] + alpha*p_RE[t] >= d[t]
+    asm.add_rows("Demand", T, np.repeat(tt, n), x.ravel(), 1.0, ">", d_arr - alpha * p_arr,
+                 lambda: [f"Demand_t{t}" for t in range(1, T+1)])
+    # (2) MinProd: x[t,i] - q[i]*u[t,i] >= 0 and (3) MaxProd: x[t,i] - Q[i]*u[t,i] <= 0
+    # (trivial plants only keep the bound x[t,i] <= Q[i])
+    tc, ic = _committed_pairs(T, ~trivial)
+    m = len(tc)
+    rows = np.arange(m)
+    for block, bound, sense in (("MinProd", q, ">"), ("MaxProd", Q, "<")):
+        asm.add_rows(block, m,
+                     np.concatenate([rows, rows]), np.concatenate([x[tc, ic], u[tc, ic]]),
+                     np.concatenate([np.ones(m), -bound[ic]]),
+                     sense, 0.0,
+                     lambda block=block: [f"{block}_t{t+1}_p{i}" for t, i in zip(tc, ic)])
+    return u, start, stop, x, s
+
+
+def _add_excess(asm, T, n, x, s, d_arr, p_arr, alpha):
+    # (8) Excess: s[t] - sum_i x[t,i] = alpha*p_RE[t] - d[t]
+    tt = np.arange(T)
+    asm.add_rows("Excess", T,
+                 np.concatenate([tt, np.repeat(tt, n)]), np.concatenate([s, x.ravel()]),
+                 np.concatenate([np.ones(T), -np.ones(T * n)]),
+                 "=", alpha * p_arr - d_arr,
+                 lambda: [f"Excess_t{t}" for t in range(1, T+1)])
+
+
+def _add_form1_pairwise(asm, T, i, u, L, l, U1, U0, u0):
+    """Rows (5) and (7) of Form1.py for plant i: one row per (t, tau)."""
+    # (5) MinUp: u[t,i] - u[t-1,i] - u[tau,i] <= 0 for tau in t+1..t-1+L
+    start_t = max(l[i] - U0[i], 0) + 1
+    t_grid, off = np.meshgrid(np.arange(start_t - 1, T), np.arange(1, max(L[i], 1)), indexing="ij")
+    keep = t_grid + off < T
+    tk, tauk = t_grid[keep], (t_grid + off)[keep]
+    _add_pair_rows(asm, "MinUp", i, u, u0, tk, tauk, cur=1.0, prev=-1.0, tau=-1.0, const=0.0,
+                   label=lambda: [f"MinUp_p{i}_t{t+1}_tau{tau+1}" for t, tau in zip(tk, tauk)])
+    # (7) MinDown: u[t-1,i] - u[t,i] + u[tau,i] <= 1 for tau in t+1..t-1+l
+    start_t = max(L[i] - U1[i], 0) + 1
+    t_grid, off = np.meshgrid(np.arange(start_t - 1, T), np.arange(1, max(l[i], 1)), indexing="ij")
+    keep = t_grid + off < T
+    tk2, tauk2 = t_grid[keep], (t_grid + off)[keep]
+    _add_pair_rows(asm, "MinDown", i, u, u0, tk2, tauk2, cur=-1.0, prev=1.0, tau=1.0, const=1.0,
+                   label=lambda: [f"MinDown_p{i}_t{t+1}_tau{tau+1}" for t, tau in zip(tk2, tauk2)])
+
+
+def _add_pair_rows(asm, block, i, u, u0, tk, tauk, cur, prev, tau, const, label):
+    """cur*u[t] + prev*u[t-1] + tau*u[tau] <= const, with u[0] replaced by the constant u0."""
+    m = len(tk)
+    if m == 0:
+        return
+    rows = np.arange(m)
+    prev_col = _prev_state(u, u0, tk, i)
+    has_prev = prev_col >= 0
+    rhs = const - prev * u0[i] * (~has_prev)
+    asm.add_rows(block, m,
+                 np.concatenate([rows, rows, rows[has_prev]]),
+                 np.concatenate([u[tk, i], u[tauk, i], prev_col[has_prev]]),
+                 np.concatenate([np.full(m, cur), np.full(m, tau), np.full(int(has_prev.sum()), prev)]),
+                 "<", rhs, label)
+
+
+def _add_form1_aggregated(asm, T, i, u, o, L, l, U1, U0, u0):
+    """Rows (5) and (7) of Form1 for plant i as one row per t, written with the startup variable o.
+
+    (5) MinUpAgg:   sum_{j=a}^{t} o[j,i] - u[t,i] <= 0,   a = max(first, t-L+1)
+    (7) MinDownAgg: sum_{j=a}^{t} o[j,i] + u[a-1,i] <= 1, a = max(first, t-l+1)
+    (7) is sum_{j=a}^{t} (shutdown at j) <= 1 - u[t,i] with the shutdown indicator
+    o[j,i] - u[j,i] + u[j-1,i] summed out. Windows start at the same first period
+    as the pairwise rows, so both modes admit the same schedules.
+    """
+    if L[i] > 1:
+        first = max(l[i] - U0[i], 0)
+        tk = np.arange(first, T)
+        rows, j = _window(tk, first, L[i])
+        m = len(tk)
+        asm.add_rows("MinUpAgg", m,
+                     np.concatenate([rows, np.arange(m)]), np.concatenate([o[j, i], u[tk, i]]),
+                     np.concatenate([np.ones(len(rows)), -np.ones(m)]), "<", 0.0,
+                     lambda: [f"MinUpAgg_p{i}_t{t+1}" for t in tk])
+    if l[i] > 1:
+        first = max(L[i] - U1[i], 0)
+        tk = np.arange(first, T)
+        rows, j = _window(tk, first, l[i])
+        m = len(tk)
+        prev_col = _prev_state(u, u0, np.maximum(first, tk - l[i] + 1), i)
+        has_prev = prev_col >= 0
+        asm.add_rows("MinDownAgg", m,
+                     np.concatenate([rows, np.arange(m)[has_prev]]),
+                     np.concatenate([o[j, i], prev_col[has_prev]]),
+                     1.0, "<", 1.0 - u0[i] * (~has_prev),
+                     lambda: [f"MinDownAgg_p{i}_t{t+1}" for t in tk])
+
+
+def _window(tk, first, width):
+    """COO (row, j) pairs for the windows j = max(first, t-width+1)..t of each t in tk."""
+    t_grid, off = np.meshgrid(tk, np.arange(width), indexing="ij")
+    keep = t_grid - off >= first
+    rows = np.broadcast_to(np.arange(len(tk))[:, None], t_grid.shape)[keep]
+    return rows, (t_grid - off)[keep]
+
+
+def build_form1(params, d, p_RE=None, alpha=0.0, lam=10, names=False, min_updown=PAIRWISE,
+                fix_initial=False, detect_trivial=True):
+    """Assemble Form1 (u, o, x, s) as a ModelData.
+
+    params holds the plant dicts q, Q, L, l, c_SU, c_NL, c_var, U1, U0 keyed by plant index.
+    d and p_RE are dicts indexed 1..T (or arrays of length T); p_RE=None means no renewables.
+    min_updown selects rows (5)/(7): PAIRWISE (one row per (i, t, tau), as in Form1.py)
+    or AGGREGATED (one row per (i, t)).
+    fix_initial=True fixes the u/o values forced by the initial state (propagation.py)
+    through lb = ub; presolve.py then removes those columns.
+    detect_trivial=True models the plants marked by trivial_units() as continuous capacity
+    (use commitment_from_output() to fill in their u values afterwards).
+    """
+    if min_updown not in (PAIRWISE, AGGREGATED):
+        raise ValueError(f"Unknown min_updown mode: {min_updown}")
+    n = len(params["q"])
+    d_arr = as_series(d, len(d))
+    T = len(d_arr)
+    p_arr = as_series(p_RE, T)
+    L, l, U1, U0 = params["L"], params["l"], params["U1"], params["U0"]
+    u0, _ = initial_state(params)
+    trivial = trivial_units(params) if detect_trivial else np.zeros(n, dtype=bool)
+
+    asm = _Assembler("PlantScheduling_Form1", T, n, names)
+    u, o, _, x, s = _add_common(asm, T, n, params, d_arr, p_arr, alpha, lam, ("o",), trivial)
+
+    for i in np.flatnonzero(~trivial):
+        # (4) MinUpInit: u[tau,i] >= u0[i] for tau = 1..L-U1
+        taus = np.arange(min(max(L[i] - U1[i], 0), T))
+        asm.add_rows("MinUpInit", len(taus), np.arange(len(taus)), u[taus, i], 1.0, ">", u0[i],
+                     lambda: [f"MinUpInit_p{i}_tau{tau+1}" for tau in taus])
+        # (6) MinDownInit: u[tau,i] <= u0[i] for tau = 1..l-U0
+        taus_d = np.arange(min(max(l[i] - U0[i], 0), T))
+        asm.add_rows("MinDownInit", len(taus_d), np.arange(len(taus_d)), u[taus_d, i], 1.0, "<", u0[i],
+                     lambda: [f"MinDownInit_p{i}_tau{tau+1}" for tau in taus_d])
+        # (5) MinUp and (7) MinDown
+        if min_updown == PAIRWISE:
+            _add_form1_pairwise(asm, T, i, u, L, l, U1, U0, u0)
+        else:
+            _add_form1_aggregated(asm, T, i, u, o, L, l, U1, U0, u0)
+
+    _add_excess(asm, T, n, x, s, d_arr, p_arr, alpha)
+
+    tt, ii = _committed_pairs(T, ~trivial)
+    m = len(tt)
+    rows = np.arange(m)
+    prev_col = _prev_state(u, u0, tt, ii)
+    has_prev = prev_col >= 0
+    u0_arr = np.array([u0[i] for i in range(n)], dtype=float)[ii]
+    # (9) StartupLogic1: o[t,i] + u[t-1,i] - u[t,i] >= 0
+    asm.add_rows("StartupLogic1", m,
+                 np.concatenate([rows, rows, rows[has_prev]]),
+                 np.concatenate([o[tt, ii], u[tt, ii], prev_col[has_prev]]),
+                 np.concatenate([np.ones(m), -np.ones(m), np.ones(int(has_prev.sum()))]),
+                 ">", -u0_arr * (~has_prev),
+                 lambda: [f"StartupLogic1_t{t+1}_p{i}" for t, i in zip(tt, ii)])
+    # (10) StartupLogic2: o[t,i] - u[t,i] <= 0
+    asm.add_rows("StartupLogic2", m,
+                 np.concatenate([rows, rows]), np.concatenate([o[tt, ii], u[tt, ii]]),
+                 np.concatenate([np.ones(m), -np.ones(m)]), "<", 0.0,
+                 lambda: [f"StartupLogic2_t{t+1}_p{i}" for t, i in zip(tt, ii)])
+    # (11) StartupLogic3: o[t,i] + u[t-1,i] <= 1
+    asm.add_rows("StartupLogic3", m,
+                 np.concatenate([rows, rows[has_prev]]), np.concatenate([o[tt, ii], prev_col[has_prev]]),
+                 1.0, "<", 1.0 - u0_arr * (~has_prev),
+                 lambda: [f"StartupLogic3_t{t+1}_p{i}" for t, i in zip(tt, ii)])
+    return _finish(asm, params, T, fix_initial, trivial)
+
+
+def build_form2(params, d, p_RE=None, alpha=0.0, lam=10, names=False, fix_initial=False,
+                detect_trivial=True):
+    """Assemble Form2 (u, v, w, x, s) as a ModelData; arguments as in build_form1."""
+    n = len(params["q"])
+    d_arr = as_series(d, len(d))
+    T = len(d_arr)
+    p_arr = as_series(p_RE, T)
+    L, l, U1, U0 = params["L"], params["l"], params["U1"], params["U0"]
+    u0, T_init = initial_state(params)
+    trivial = trivial_units(params) if detect_trivial else np.zeros(n, dtype=bool)
+    committed = np.flatnonzero(~trivial)
+
+    asm = _Assembler("PlantScheduling_Form2", T, n, names)
+    u, v, w, x, s = _add_common(asm, T, n, params, d_arr, p_arr, alpha, lam, ("v", "w"), trivial)
+
+    # (4) Dynamic: u[t,i] - u[t-1,i] - v[t,i] + w[t,i] = 0
+    tt, ii = _committed_pairs(T, ~trivial)
+    m = len(tt)
+    rows = np.arange(m)
+    prev_col = _prev_state(u, u0, tt, ii)
+    has_prev = prev_col >= 0
+    u0_arr = np.array([u0[i] for i in range(n)], dtype=float)[ii]
+    asm.add_rows("Dynamic", m,
+                 np.concatenate([rows, rows, rows, rows[has_prev]]),
+                 np.concatenate([u[tt, ii], v[tt, ii], w[tt, ii], prev_col[has_prev]]),
+                 np.concatenate([np.ones(m), -np.ones(m), np.ones(m), -np.ones(int(has_prev.sum()))]),
+                 "=", u0_arr * (~has_prev),
+                 lambda: [f"Dynamic_t{t+1}_Plant{i}" for t, i in zip(tt, ii)])
+
+    for i in committed:
+        # (5) InitStatus: u[t,i] = u0[i] for t = 1..T_init[i]
+        tk = np.arange(min(T_init[i], T))
+        asm.add_rows("InitStatus", len(tk), np.arange(len(tk)), u[tk, i], 1.0, "=", u0[i],
+                     lambda: [f"InitStatus_t{t+1}_Plant{i}" for t in tk])
+
+    for i in committed:
+        # (6) UpTime: sum_{j=t-L+1}^{t} v[j,i] - u[t,i] <= 0
+        first = min(T, max((L[i] - U1[i]) * u0[i], 0) + 1) - 1
+        _add_window_rows(asm, "UpTime", i, T, first, L[i], v, u, -1.0, 0.0,
+                         lambda t: f"UpTime_t{t}_Plant{i}")
+    for i in committed:
+        # (7) DownTime: sum_{j=t-l+1}^{t} w[j,i] + u[t,i] <= 1
+        first = min(T, max((l[i] - U0[i]) * (1 - u0[i]), 0) + 1) - 1
+        _add_window_rows(asm, "DownTime", i, T, first, l[i], w, u, 1.0, 1.0,
+                         lambda t: f"DownTime_t{t}_Plant{i}")
+
+    _add_excess(asm, T, n, x, s, d_arr, p_arr, alpha)
+    return _finish(asm, params, T, fix_initial, trivial)
+
+
+def _finish(asm, params, T, fix_initial, trivial):
+    data = asm.finish()
+    data.trivial = trivial
+    if fix_initial:
+        apply_fixings(data, propagate_initial_state(params, T))
+    return data
+
+
+def _add_window_rows(asm, block, i, T, first, width, z, u, u_coef, rhs, label):
+    """sum_{j=max(1,t-width+1)}^{t} z[j,i] + u_coef*u[t,i] <= rhs for t = first+1..T."""
+    tk = np.arange(first, T)
+    m = len(tk)
+    if m == 0:
+        return
+    rows, j = _window(tk, 0, width)
+    asm.add_rows(block, m,
+                 np.concatenate([rows, np.arange(m)]),
+                 np.concatenate([z[j, i], u[tk, i]]),
+                 np.concatenate([np.ones(len(rows)), np.full(m, u_coef)]),
+                 "<", rhs, lambda: [label(t + 1) for t in tk])
+
+
+BUILDERS = {FORM1: build_form1, FORM2: build_form2}
+
+
+def to_gurobi(data, env=None):
+    """Load a ModelData into a new gurobipy model; returns (model, z, constrs).
+
+    z is the MVar holding every variable, so data.var_blocks indexes z.X directly.
+    """
+    import gurobipy as gp
+
+    model = gp.Model(data.name, env=env) if env is not None else gp.Model(data.name)
+    z = model.addMVar(data.num_vars, lb=data.lb, ub=data.ub, obj=data.obj, vtype=data.vtype)
+    constrs = model.addMConstr(data.A, z, data.sense, data.rhs)
+    model.ObjCon = data.obj_const
+    if data.var_names is not None:
+        model.setAttr("VarName", z.tolist(), data.var_names)
+    if data.row_names is not None:
+        model.setAttr("ConstrName", constrs.tolist(), data.row_names)
+    return model, z, constrs
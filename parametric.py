@@ -0,0 +1,232 @@
+import copy
+
+import numpy as np
+
+from plant_data import as_series
+from model_builder import BUILDERS, commitment_from_output
+from backends import load
+from dispatch import merit_order_dispatch
+from presolve import presolve as run_presolve
+
+# ===========================================================
+# BUILD-ONCE PARAMETRIC MODEL FOR THE ALPHA x LAMBDA SWEEP
+# ===========================================================
+# Between two sweep points only three things change:
+#   - alpha and p_RE, through the RHS of Demand_t (d - a*p_RE) and Excess_t (a*p_RE - d)
+#   - lambda, through the objective coefficient of s[t]
+# so the model is assembled and loaded once and these values are overwritten
+# in place before each re-solve.
+#
+# With presolve=True the solver gets the reduced model from presolve.py; the
+# full obj/rhs are then kept here and re-mapped through the Reduction (which
+# also moves lambda into the x costs) on every change. Passing fix_initial=True
+# through to the builder lets presolve also remove the commitment variables
+# forced by the initial state (propagation.py).
+#
+# The model is held by a backends.py handle, so the same sweep runs on Gurobi
+# or on HiGHS (backend=GUROBI / HIGHS; default: Gurobi if it is installed).
+#
+# relax=True loads the continuous relaxation instead (all columns continuous);
+# Gurobi then re-solves from the previous basis after every in-place change.
+#
+# Warm starts: with sweep(..., warm_start=True) every solve gets the previous
+# grid point's solution as a MIP start. The commitment (u and startup/shutdown)
+# is kept and x is re-dispatched in merit order for the new net demand; if the
+# kept commitment cannot cover it, only the commitment is passed (a partial
+# start the solver completes or discards). The grid is walked lambda by lambda
+# with alpha alternating direction, so consecutive points differ in one value.
+#
+# Batch solves: solve_batch() hands all (alpha, lambda) points of the grid to
+# the backend at once (backends.py: one Gurobi multi-scenario solve, or
+# in-place sequential re-solves); batch_sweep() is sweep() built on it.
+
+
+class ParametricModel:
+    """Form1/Form2 model that is built once and re-solved for new alpha, lambda and p_RE."""
+
+    def __init__(self, formulation, params, d, p_RE=None, alpha=0.0, lam=10,
+                 env=None, solver_params=None, presolve=False, backend=None, relax=False,
+                 **build_options):
+        self.formulation = formulation
+        self.params = params
+        self.data = BUILDERS[formulation](params, d, p_RE, alpha=alpha, lam=lam, **build_options)
+        self.d = as_series(d, self.data.T)
+        self.p_RE = as_series(p_RE, self.data.T)
+        self.alpha = alpha
+        self.lam = lam
+        varying = np.r_[self.data.row_blocks["Demand"], self.data.row_blocks["Excess"]]
+        self.reduction = run_presolve(self.data, varying) if presolve else None
+
+        loaded = self.data if self.reduction is None else self.reduction.reduced
+        if relax:
+            loaded = copy.copy(loaded)
+            loaded.vtype = np.full(loaded.num_vars, "C", dtype="<U1")
+        self.model = load(loaded, backend, env, solver_params)
+        self._all_cols = np.arange(loaded.num_vars)
+        self._all_rows = np.arange(loaded.num_rows)
+        self._last = None
+        self._solved_rhs = None     # full rhs of the last solve, for postsolving its solutions
+
+    def set_alpha(self, alpha):
+        """Change the renewable penetration factor (RHS of Demand_t and Excess_t)."""
+        self.alpha = alpha
+        self._update_rhs()
+
+    def set_renewables(self, p_RE):
+        """Replace the renewable production series (dict indexed 1..T or array)."""
+        self.p_RE = as_series(p_RE, self.data.T)
+        self._update_rhs()
+
+    def set_lambda(self, lam):
+        """Change the excess-production penalty (objective coefficient of s[t])."""
+        self.lam = lam
+        self.data.obj[self.data.var_blocks["s"]] = lam
+        if self.reduction is None:
+            self.model.set_obj(self.data.var_blocks["s"], np.full(self.data.T, float(lam)))
+        else:
+            self._push_reduced()
+
+    def _update_rhs(self):
+        net = self.d - self.alpha * self.p_RE
+        self.data.rhs[self.data.row_blocks["Demand"]] = net
+        self.data.rhs[self.data.row_blocks["Excess"]] = -net
+        if self.reduction is None:
+            self.model.set_rhs(self.data.row_blocks["Demand"], net)
+            self.model.set_rhs(self.data.row_blocks["Excess"], -net)
+        else:
+            self._push_reduced()
+
+    def _push_reduced(self):
+        obj, rhs, obj_const = self.reduction.reduce(self.data.obj, self.data.rhs, self.data.obj_const)
+        self.model.set_obj(self._all_cols, obj)
+        self.model.set_rhs(self._all_rows, rhs)
+        self.model.set_obj_const(obj_const)
+
+    def solve(self, start=None):
+        """Optimize with the current alpha/lambda/p_RE; returns the objective or NaN if not optimal.
+
+        start is an optional MIP start over all columns of self.data (NaN = no value).
+        """
+        if start is not None:
+            self.model.set_start(start if self.reduction is None else start[self.reduction.keep_cols])
+        obj = self.model.solve()
+        self._solved_rhs = self.data.rhs.copy()
+        self._last = self._full_solution()
+        return obj
+
+    def _full_solution(self):
+        return self._postsolve(self.model.x, self._solved_rhs)
+
+    def _postsolve(self, z, rhs):
+        if z is None or self.reduction is None:
+            return z
+        return self.reduction.postsolve(z, rhs)
+
+    def _variant(self, alpha, lam):
+        """Full (obj, rhs) of self.data at (alpha, lam) for the current p_RE."""
+        obj = self.data.obj.copy()
+        obj[self.data.var_blocks["s"]] = lam
+        rhs = self.data.rhs.copy()
+        net = self.d - alpha * self.p_RE
+        rhs[self.data.row_blocks["Demand"]] = net
+        rhs[self.data.row_blocks["Excess"]] = -net
+        return obj, rhs
+
+    def solve_batch(self, points, multi_scenario=True):
+        """Solve many (alpha, lambda) points together; returns [(objective, values())].
+
+        The model's own alpha and lambda are left unchanged.
+        """
+        full = [self._variant(a, lam) for a, lam in points]
+        if self.reduction is None:
+            variants = [(obj, rhs, self.data.obj_const) for obj, rhs in full]
+        else:
+            variants = [self.reduction.reduce(obj, rhs, self.data.obj_const) for obj, rhs in full]
+        results = self.model.solve_batch(variants, multi_scenario)
+        return [(obj, self._values(self._postsolve(z, rhs))) for (obj, z), (_, rhs) in zip(results, full)]
+
+    def pool(self):
+        """All solutions kept by the last solve, as vectors over the columns of self.data."""
+        if self.reduction is None:
+            return self.model.pool()
+        return [self.reduction.postsolve(z, self._solved_rhs) for z in self.model.pool()]
+
+    def repaired_start(self):
+        """MIP start for the current alpha/p_RE from the last solution (None before the first solve)."""
+        if self._last is None:
+            return None
+        z = self._last.copy()
+        blocks = self.data.var_blocks
+        net = self.d - self.alpha * self.p_RE
+        x = merit_order_dispatch(np.rint(z[blocks["u"]]), net, self.params, self.data.trivial)
+        if x is None:
+            z[blocks["x"]] = np.nan
+            z[blocks["s"]] = np.nan
+        else:
+            z[blocks["x"]] = x
+            z[blocks["s"]] = x.sum(axis=1) - net
+        return z
+
+    def values(self):
+        """Return the solution as {family: array} with (T, n) arrays for plant variables and (T,) for s.
+
+        Without a solution every entry is NaN.
+        """
+        return self._values(self._full_solution())
+
+    def _values(self, z):
+        if z is None:
+            z = np.full(self.data.num_vars, np.nan)
+        values = {family: z[idx] for family, idx in self.data.var_blocks.items()}
+        return commitment_from_output(values, self.params, self.data.trivial)
+
+    def dispose(self):
+        self.model.dispose()
+
+
+def grid_order(n_lambda, n_alpha, serpentine=False):
+    """(i_lambda, i_alpha) visiting order: alpha-major, or lambda rows with alternating alpha direction."""
+    if not serpentine:
+        return [(i_lambda, i_alpha) for i_alpha in range(n_alpha) for i_lambda in range(n_lambda)]
+    return [(i_lambda, i_alpha if i_lambda % 2 == 0 else n_alpha - 1 - i_alpha)
+            for i_lambda in range(n_lambda) for i_alpha in range(n_alpha)]
+
+
+def sweep(formulation, params, d, p_RE, alpha_vec, lambda_vec, env=None, warm_start=False,
+          stats=False, **options):
+    """Objective matrix (len(lambda_vec) x len(alpha_vec)) from a single parametric model.
+
+    warm_start=True chains MIP starts along a serpentine grid order. With stats=True
+    the node-count and solve-time matrices are returned as well.
+    """
+    pm = ParametricModel(formulation, params, d, p_RE, env=env, **options)
+    obj_values_matrix = np.zeros((len(lambda_vec), len(alpha_vec)))
+    nodes_matrix = np.zeros((len(lambda_vec), len(alpha_vec)), dtype=int)
+    runtime_matrix = np.zeros((len(lambda_vec), len(alpha_vec)))
+    for i_lambda, i_alpha in grid_order(len(lambda_vec), len(alpha_vec), serpentine=warm_start):
+        if alpha_vec[i_alpha] != pm.alpha:
+            pm.set_alpha(alpha_vec[i_alpha])
+        if lambda_vec[i_lambda] != pm.lam:
+            pm.set_lambda(lambda_vec[i_lambda])
+        start = pm.repaired_start() if warm_start else None
+        obj_values_matrix[i_lambda, i_alpha] = pm.solve(start)
+        nodes_matrix[i_lambda, i_alpha] = pm.model.node_count
+        runtime_matrix[i_lambda, i_alpha] = pm.model.runtime
+    pm.dispose()
+    if stats:
+        return obj_values_matrix, nodes_matrix, runtime_matrix
+    return obj_values_matrix
+
+
+def batch_sweep(formulation, params, d, p_RE, alpha_vec, lambda_vec, env=None, multi_scenario=True,
+                **options):
+    """sweep() with the whole grid solved in one ParametricModel.solve_batch() call."""
+    pm = ParametricModel(formulation, params, d, p_RE, env=env, **options)
+    order = grid_order(len(lambda_vec), len(alpha_vec), serpentine=True)
+    results = pm.solve_batch([(alpha_vec[i_alpha], lambda_vec[i_lambda]) for i_lambda, i_alpha in order],
+                             multi_scenario)
+    pm.dispose()
+    obj_values_matrix = np.zeros((len(lambda_vec), len(alpha_vec)))
+    for (i_lambda, i_alpha), (obj, _) in zip(order, results):
+        obj_values_matrix[i_lambda, i_alpha] = obj
+    return obj_values_matrix
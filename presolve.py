@@ -0,0 +1,217 @@
+import numpy as np
+
+from model_builder import ModelData
+
+# ===========================================================
+# FORMULATION-LEVEL REDUCTION PASS
+# ===========================================================
+# Runs on a ModelData before it reaches the solver:
+#
+# 0. Fixed columns (lb == ub, e.g. commitments fixed by propagation.py) are
+#    replaced by their value in the rhs and the objective constant.
+# 1. Definitional equalities. An equality row that contains a continuous
+#    column appearing in no other row (e.g. Excess_t: s[t] - sum_i x[t,i] =
+#    a*p_RE[t] - d[t]) defines that column. The column is substituted into the
+#    objective (lambda*s[t] becomes a shift of the x costs plus a constant) and
+#    the row is replaced by the column's bound (s[t] >= 0 gives
+#    sum_i x[t,i] >= d[t] - a*p_RE[t]).
+# 2. Singleton rows (MinUpInit, MinDownInit, InitStatus) become bounds on
+#    their column. Definitional rows and the rows listed as varying_rows
+#    (Demand_t/Excess_t, whose rhs changes with alpha) stay rows even with a
+#    single column left (one plant).
+# 3. Dominated rows. Inequalities with proportional coefficients are merged
+#    into the tightest one (the bound row above duplicates Demand_t), and empty
+#    rows are dropped after checking them.
+#
+# The pass only depends on the sparsity pattern and coefficients of A, so a
+# Reduction can re-map new obj/rhs vectors (a new alpha or lambda) without
+# repeating the analysis, and maps reduced solutions back to all columns.
+# Only the rhs of rows that were not turned into bounds may change.
+
+
+class Reduction:
+    """Result of presolve(): the reduced ModelData plus the maps to and from the original."""
+
+    def __init__(self, original, reduced, keep_cols, sub_rows, sub_cols, sub_coef, sub_lb,
+                 sub_bound, row_of_member, member_rows, member_factor, kept_factor,
+                 bound_rows, fixed_cols, fixed_vals):
+        self.original = original
+        self.reduced = reduced
+        self.keep_cols = keep_cols          # original column of each reduced column
+        self.sub_rows = sub_rows            # definitional rows ...
+        self.sub_cols = sub_cols            # ... and the column each one defines
+        self.sub_coef = sub_coef            # coefficient of the defined column in its row
+        self.sub_lb = sub_lb                # lower bound of the defined column
+        self.sub_bound = sub_bound          # True if the row is kept as the column's bound
+        self.row_of_member = row_of_member  # reduced row each surviving original row merges into
+        self.member_rows = member_rows
+        self.member_factor = member_factor  # scales a member's rhs to its normalised '<=' form
+        self.kept_factor = kept_factor      # scales the normalised rhs back for the reduced row
+        self.bound_rows = bound_rows        # singleton rows folded into column bounds
+        self.fixed_cols = fixed_cols        # columns removed at a fixed value
+        self.fixed_vals = fixed_vals
+        self._A_fixed = original.A[:, fixed_cols]
+        self._A_sub = original.A[sub_rows][:, keep_cols]
+        self._A_def = original.A[sub_rows]
+        self._bound_rhs = original.rhs[bound_rows].copy()
+
+    def stats(self):
+        removed = np.setdiff1d(np.arange(self.original.num_vars), self.keep_cols)
+        return {"removed_vars": len(removed),
+                "removed_binaries": int(np.count_nonzero(self.original.vtype[removed] == "B")),
+                "removed_rows": self.original.num_rows - self.reduced.num_rows}
+
+    def reduce(self, obj, rhs, obj_const=0.0):
+        """Map an original (obj, rhs) pair to (obj, rhs, obj_const) of the reduced model (no side effects)."""
+        rhs = np.asarray(rhs, dtype=float)
+        if not np.array_equal(rhs[self.bound_rows], self._bound_rhs):
+            raise ValueError("The rhs of a row folded into a bound changed; run presolve() again.")
+        rhs = rhs - self._A_fixed @ self.fixed_vals
+        obj_const = obj_const + float(obj[self.fixed_cols] @ self.fixed_vals)
+        weight = obj[self.sub_cols] / self.sub_coef
+        red_obj = obj[self.keep_cols] - self._A_sub.T @ weight
+        red_const = obj_const + float(weight @ rhs[self.sub_rows])
+
+        row_rhs = rhs.copy()
+        row_rhs[self.sub_rows] = rhs[self.sub_rows] - self.sub_coef * self.sub_lb
+        normalised = self.member_factor * row_rhs[self.member_rows]
+        tightest = np.full(self.reduced.num_rows, np.inf)
+        np.minimum.at(tightest, self.row_of_member, normalised)
+        return red_obj, tightest * self.kept_factor, red_const
+
+    def postsolve(self, z, rhs):
+        """Expand a reduced solution vector to all original columns; rhs is the original rhs it was solved with."""
+        full = np.zeros(self.original.num_vars)
+        full[self.keep_cols] = z
+        full[self.fixed_cols] = self.fixed_vals
+        # definitional column: x_j = (b_r - sum_{k != j} a_rk x_k) / a_rj
+        rest = self._A_def @ full
+        full[self.sub_cols] = (rhs[self.sub_rows] - rest) / self.sub_coef
+        return full
+
+    def values(self, z, rhs):
+        """Postsolved solution as {family: array} in the shapes of original.var_blocks."""
+        full = self.postsolve(z, rhs)
+        return {family: full[idx] for family, idx in self.original.var_blocks.items()}
+
+
+def _find_definitions(A, sense, vtype, ub):
+    """Equality rows with a continuous column singleton that is free above; one column per row."""
+    col_count = np.diff(A.tocsc().indptr)
+    candidate = (col_count == 1) & (vtype == "C") & np.isinf(ub)
+    rows, cols, coefs = [], [], []
+    for r in np.flatnonzero(sense == "="):
+        start, end = A.indptr[r], A.indptr[r+1]
+        for j, a in zip(A.indices[start:end], A.data[start:end]):
+            if candidate[j]:
+                rows.append(r)
+                cols.append(j)
+                coefs.append(a)
+                break
+    return np.array(rows, dtype=int), np.array(cols, dtype=int), np.array(coefs, dtype=float)
+
+
+def presolve(data, varying_rows=()):
+    """Reduce a ModelData; returns a Reduction whose .reduced is handed to the solver.
+
+    varying_rows are rows whose rhs may change later; they are never folded into bounds.
+    """
+    fixed_cols = np.flatnonzero(data.lb == data.ub)
+    fixed_vals = data.lb[fixed_cols]
+    free_cols = np.setdiff1d(np.arange(data.num_vars), fixed_cols)
+    rhs = data.rhs - data.A[:, fixed_cols] @ fixed_vals
+
+    A_free = data.A[:, free_cols].tocsr()
+    sub_rows, sub_free, sub_coef = _find_definitions(A_free, data.sense, data.vtype[free_cols],
+                                                     data.ub[free_cols])
+    sub_cols = free_cols[sub_free]
+    sub_lb = data.lb[sub_cols]
+    sub_bound = np.isfinite(sub_lb)
+    keep_cols = np.setdiff1d(free_cols, sub_cols)
+
+    # rows after substitution: the defined column is removed and a definitional
+    # row either becomes that column's lower bound or disappears (free column)
+    A = data.A[:, keep_cols].tocsr()
+    sense = data.sense.copy()
+    sense[sub_rows] = np.where(sub_coef > 0, "<", ">")
+    rhs[sub_rows] = rhs[sub_rows] - sub_coef * np.where(sub_bound, sub_lb, 0.0)
+    alive = np.ones(data.num_rows, dtype=bool)
+    alive[sub_rows[~sub_bound]] = False
+    varying = np.zeros(data.num_rows, dtype=bool)
+    varying[sub_rows] = True
+    varying[np.asarray(varying_rows, dtype=int)] = True
+
+    # singleton rows: fold into the column bounds
+    lb = data.lb[keep_cols].copy()
+    ub = data.ub[keep_cols].copy()
+    row_nnz = np.diff(A.indptr)
+    bound_rows = np.flatnonzero(alive & (row_nnz == 1) & ~varying)
+    for r in bound_rows:
+        j, a = A.indices[A.indptr[r]], A.data[A.indptr[r]]
+        bound = rhs[r] / a
+        row_sense = sense[r] if a > 0 else {"<": ">", ">": "<", "=": "="}[sense[r]]
+        if row_sense in "<=":
+            ub[j] = min(ub[j], bound)
+        if row_sense in ">=":
+            lb[j] = max(lb[j], bound)
+    alive[bound_rows] = False
+    integral = data.vtype[keep_cols] != "C"
+    lb[integral] = np.ceil(lb[integral] - 1e-9)
+    ub[integral] = np.floor(ub[integral] + 1e-9)
+    if np.any(lb > ub + 1e-9):
+        raise ValueError("Bounds from singleton rows are infeasible.")
+
+    # empty rows: check and drop
+    for r in np.flatnonzero(alive & (row_nnz == 0) & ~varying):
+        ok = {"<": 0 <= rhs[r] + 1e-9, ">": 0 >= rhs[r] - 1e-9, "=": abs(rhs[r]) <= 1e-9}[sense[r]]
+        if not ok:
+            raise ValueError(f"Row {r} is empty and infeasible (0 {sense[r]} {rhs[r]}).")
+        alive[r] = False
+
+    # normalise inequalities to '<=' with the first coefficient scaled to +-1 and merge duplicates
+    factor = np.ones(data.num_rows)
+    groups = {}
+    owner = np.full(data.num_rows, -1)
+    for r in np.flatnonzero(alive):
+        start, end = A.indptr[r], A.indptr[r+1]
+        idx, vals = A.indices[start:end], A.data[start:end]
+        if sense[r] == "=":
+            owner[r] = r
+            continue
+        f = (1.0 if sense[r] == "<" else -1.0) / abs(vals[0])
+        factor[r] = f
+        key = (idx.tobytes(), np.round(vals * f, 12).tobytes())
+        owner[r] = groups.setdefault(key, r)
+
+    kept = np.flatnonzero(alive & (owner == np.arange(data.num_rows)))
+    new_index = np.full(data.num_rows, -1)
+    new_index[kept] = np.arange(len(kept))
+    member_rows = np.flatnonzero(alive)
+    row_of_member = new_index[owner[member_rows]]
+    member_factor = factor[member_rows]
+    kept_factor = 1.0 / factor[kept]
+
+    reduced = ModelData(data.name + "_presolved", data.T, data.n)
+    reduced.A = A[kept]
+    reduced.sense = sense[kept]
+    reduced.lb = lb
+    reduced.ub = ub
+    reduced.vtype = data.vtype[keep_cols]
+    reduced.trivial = data.trivial
+    col_index = np.full(data.num_vars, -1)
+    col_index[keep_cols] = np.arange(len(keep_cols))
+    reduced.var_blocks = {family: col_index[idx] for family, idx in data.var_blocks.items()
+                          if np.all(col_index[idx] >= 0)}
+    reduced.row_blocks = {block: new_index[rows][new_index[rows] >= 0]
+                          for block, rows in data.row_blocks.items()}
+    if data.var_names is not None:
+        reduced.var_names = [data.var_names[j] for j in keep_cols]
+    if data.row_names is not None:
+        reduced.row_names = [data.row_names[r] for r in kept]
+
+    reduction = Reduction(data, reduced, keep_cols, sub_rows, sub_cols, sub_coef,
+                          np.where(sub_bound, sub_lb, 0.0), sub_bound,
+                          row_of_member, member_rows, member_factor, kept_factor, bound_rows,
+                          fixed_cols, fixed_vals)
+    reduced.obj, reduced.rhs, reduced.obj_const = reduction.reduce(data.obj, data.rhs, data.obj_const)
+    return reduction
@@ -0,0 +1,138 @@
+import numpy as np
+
+from model_builder import FORM1, FORM2
+from schedule_eval import ScheduleChecker, run_lengths
+
+# ===========================================================
+# PRIORITY-LIST COMMITMENT HEURISTIC
+# ===========================================================
+# A feasible schedule without a MIP, in four steps:
+#   1. Priority order by full-load average cost c_var + c_NL / Q. Every hour,
+#      units are committed in that order until their capacity covers net
+#      demand d - alpha * p_RE (units held off by their initial state are
+#      skipped). A given initial commitment is kept and only topped up.
+#   2. The T_init periods get the initial state.
+#   3. Min up/down repair: on-runs shorter than L after a startup are
+#      extended forward, and off-runs shorter than l after a shutdown are
+#      filled (kept on). Both only add on-periods, so demand stays covered;
+#      this is repeated until schedule_eval reports no violation.
+#   4. Improvement (improve=True): every on-run is a candidate for removal.
+#      All candidates are checked and costed at once with schedule_eval, and
+#      the cheapest feasible one is applied, until no removal lowers the cost.
+# x and s come from the merit-order dispatch (dispatch.py). Trivial plants
+# produce without commitment; their u is set to x > 0 at the end, as in
+# model_builder.commitment_from_output.
+#
+# The schedule can be used on its own or as a MIP start: mip_start() maps it
+# onto the columns of a Form1/Form2 ModelData.
+
+
+def priority_order(params):
+    """Plant indices by increasing full-load average cost c_var + c_NL / Q."""
+    n = len(params["q"])
+    c = np.array([params["c_var"][i] + params["c_NL"][i] / params["Q"][i] for i in range(n)])
+    return np.argsort(c, kind="stable")
+
+
+def _commit_by_priority(checker, order, net, initial=None):
+    """Step 1 and 2: add the cheapest available units to `initial` until net demand is covered."""
+    T, n = len(net), checker.n
+    t = np.arange(1, T + 1)[:, None]
+    forced = t <= checker.T_init
+    available = ~(forced & (checker.u0 == 0))
+    committed = np.zeros((T, n), dtype=bool) if initial is None else (np.asarray(initial) > 0.5) & available
+    missing = net - (committed * checker.merit.Q).sum(axis=1)
+    capacity = np.where(available & ~committed, checker.merit.Q, 0.0)[:, order]
+    before = np.cumsum(capacity, axis=1) - capacity
+    u = committed.astype(float)
+    u[:, order] += (available & ~committed)[:, order] & (before < missing[:, None])
+    return np.where(forced, checker.u0, u)
+
+
+def _repair(checker, u):
+    """Step 3: extend short on-runs and fill short off-runs until min up/down hold."""
+    T = u.shape[0]
+    while True:
+        rows = u.T.astype(np.int8)
+        row, start, length, value = run_lengths(rows)
+        switched = (start > 0) | (value != checker.u0[row])
+        required = np.where(value == 1, checker.L[row], checker.l[row])
+        short = switched & (start + length < T) & (length < required) & ~checker.trivial[row]
+        if not short.any():
+            return u
+        for i, s, k, v in zip(row[short], start[short], length[short], value[short]):
+            if v == 1:
+                u[s:min(s + checker.L[i], T), i] = 1
+            else:
+                u[s:s + k, i] = 1
+
+
+def _improve(checker, u, net, lam, max_iter=200):
+    """Step 4: remove whole on-runs while that keeps the schedule feasible and lowers the cost."""
+    cost = checker.evaluate(u, net, lam)["cost"]
+    for _ in range(max_iter):
+        row, start, length, value = run_lengths(u.T.astype(np.int8))
+        keep = (value == 1) & ~checker.trivial[row]
+        if not keep.any():
+            break
+        candidates = np.repeat(u[None], keep.sum(), axis=0)
+        for k, (i, s, n_on) in enumerate(zip(row[keep], start[keep], length[keep])):
+            candidates[k, s:s + n_on, i] = 0
+        report = checker.evaluate(candidates, net, lam)
+        costs = np.where(report["feasible"], report["cost"], np.inf)
+        best = int(np.argmin(costs))
+        if costs[best] >= cost - 1e-6:
+            break
+        u, cost = candidates[best], costs[best]
+    return u
+
+
+def priority_schedule(params, net, lam, trivial=None, improve=True, initial=None):
+    """Heuristic (u, x, s, cost) for net demand net (T,) and excess penalty lam.
+
+    initial is an optional (T, n) commitment to start from (e.g. from lagrangian.py);
+    units are then only added where it cannot cover net demand.
+    """
+    checker = ScheduleChecker(params, trivial)
+    net = np.asarray(net, dtype=float)
+    u = _repair(checker, _commit_by_priority(checker, priority_order(params), net, initial))
+    if improve:
+        u = _improve(checker, u, net, lam)
+    report = checker.evaluate(u, net, lam)
+    x, s = report["x"], report["s"]
+    u[:, checker.trivial] = x[:, checker.trivial] > 1e-6
+    cost = checker.evaluate(u, net, lam)["cost"] if report["feasible"] else np.inf
+    return u, x, s, cost
+
+
+def schedule_values(params, u, x, s, formulation):
+    """values()-style dict {u, o or v/w, x, s} of a schedule for the given formulation."""
+    checker = ScheduleChecker(params)
+    prev = np.vstack([checker.u0, u[:-1]])
+    values = {"u": u.astype(float), "x": x, "s": s}
+    if formulation == FORM1:
+        values["o"] = np.maximum(u - prev, 0.0)
+    elif formulation == FORM2:
+        values["v"] = np.maximum(u - prev, 0.0)
+        values["w"] = np.maximum(prev - u, 0.0)
+    else:
+        raise ValueError(f"Unknown formulation: {formulation}")
+    return values
+
+
+def mip_start(data, values):
+    """Start vector over the columns of a ModelData (NaN where a family is missing)."""
+    z = np.full(data.num_vars, np.nan)
+    for family, idx in data.var_blocks.items():
+        if family in values:
+            z[idx] = values[family]
+    return z
+
+
+def priority_start(pm, improve=True):
+    """(MIP start vector, heuristic cost) for the current point of a ParametricModel."""
+    net = pm.d - pm.alpha * pm.p_RE
+    u, x, s, cost = priority_schedule(pm.params, net, pm.lam, pm.data.trivial, improve)
+    if not np.isfinite(cost):
+        return None, cost
+    return mip_start(pm.data, schedule_values(pm.params, u, x, s, pm.formulation)), cost
@@ -0,0 +1,104 @@
+import numpy as np
+
+from plant_data import initial_state
+
+# ===========================================================
+# INITIAL-CONDITION PROPAGATION
+# ===========================================================
+# U1, U0, L and l fix a large part of the commitment schedule before any
+# decision is made:
+#   - for t <= T_init[i] plant i keeps its initial state u0[i] and neither
+#     starts up nor shuts down (InitStatus / MinUpInit / MinDownInit);
+#   - a plant that is on at t=0 can shut down at T_init+1 at the earliest and
+#     then has to stay off for l periods, so it cannot start up before
+#     T_init + max(l, 1) + 1;
+#   - symmetrically a plant that is off at t=0 cannot shut down before
+#     T_init + max(L, 1) + 1.
+# These values hold in every feasible schedule of Form1 and Form2. They are
+# written into the column bounds (lb = ub) and presolve.py removes the columns.
+#
+# Fixings are int8 arrays of shape (T, n): -1 means free, 0/1 the forced value.
+# Form1 has no shutdown variable and calls its startup variable "o".
+
+FAMILY_OF = {"u": "u", "v": "v", "o": "v", "w": "w"}
+
+
+def propagate_initial_state(params, T):
+    """Return {"u", "v", "w"} fixings (T, n) implied by the initial state and min up/down times."""
+    n = len(params["q"])
+    L, l = params["L"], params["l"]
+    u0, T_init = initial_state(params)
+    fixed = {family: np.full((T, n), -1, dtype=np.int8) for family in ("u", "v", "w")}
+    for i in range(n):
+        k = min(T_init[i], T)
+        fixed["u"][:k, i] = u0[i]
+        fixed["v"][:k, i] = 0
+        fixed["w"][:k, i] = 0
+        if u0[i] == 1:
+            fixed["v"][:min(T_init[i] + max(l[i], 1), T), i] = 0
+        else:
+            fixed["w"][:min(T_init[i] + max(L[i], 1), T), i] = 0
+    return fixed
+
+
+def apply_fixings(data, fixed):
+    """Set lb = ub on every column of data with a forced value; returns the number of binaries fixed."""
+    count = 0
+    for family, idx in data.var_blocks.items():
+        if FAMILY_OF.get(family) not in fixed:
+            continue
+        values = fixed[FAMILY_OF[family]]
+        mask = values >= 0
+        cols = idx[mask]
+        data.lb[cols] = values[mask]
+        data.ub[cols] = values[mask]
+        count += int(np.count_nonzero(data.vtype[cols] == "B"))
+    return count
+
+
+def fixing_report(fixed, plant_names=None):
+    """Number of forced values per family and per plant, as {family: {plant: count}}."""
+    n = next(iter(fixed.values())).shape[1]
+    names = plant_names if plant_names is not None else {i: i for i in range(n)}
+    return {family: {names[i]: int(np.count_nonzero(values[:, i] >= 0)) for i in range(n)}
+            for family, values in fixed.items()}
+
+
+def roll_history(params, u_executed):
+    """Copy of params with U1/U0 updated after executing the (k, n) schedule u_executed.
+
+    Used between rolling-horizon windows: the next window is built (and
+    propagated) from the state at the end of the executed periods.
+    """
+    u_executed = np.asarray(u_executed).round().astype(int)
+    k, n = u_executed.shape
+    rolled = dict(params)
+    U1, U0 = dict(params["U1"]), dict(params["U0"])
+    for i in range(n):
+        last = u_executed[-1, i]
+        changes = np.flatnonzero(u_executed[:, i] != last)
+        run = k - 1 - changes[-1] if len(changes) else k
+        if last == 1:
+            U1[i] = run + (U1[i] if len(changes) == 0 else 0)
+            U0[i] = 0
+        else:
+            U0[i] = run + (U0[i] if len(changes) == 0 else 0)
+            U1[i] = 0
+    rolled["U1"], rolled["U0"] = U1, U0
+    return rolled
+
+
+if __name__ == "__main__":
+    import plant_data
+    from model_builder import FORM1, FORM2, BUILDERS
+    from presolve import presolve
+
+    params = plant_data.plant_params()
+    fixed = propagate_initial_state(params, plant_data.T)
+    for family, counts in fixing_report(fixed, plant_data.plant_names).items():
+        print(f"{family}: " + ", ".join(f"{name} {count}" for name, count in counts.items()))
+    for form in (FORM1, FORM2):
+        data = BUILDERS[form](params, plant_data.d, plant_data.scenario1, fix_initial=True)
+        stats = presolve(data).stats()
+        print(f"{form}: {data.stats()['binaries']} binaries, {stats['removed_binaries']} removed, "
+              f"{stats['removed_rows']} rows removed")
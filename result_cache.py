@@ -0,0 +1,233 @@
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from backends import DEFAULT_PARAMS, default_backend
+from parametric import ParametricModel
+from plant_data import as_series
+
+# ===========================================================
+# CONTENT-ADDRESSED CACHE OF SOLVED INSTANCES
+# ===========================================================
+# A solved point is stored under the sha256 of everything that determines its
+# result: formulation and MODEL_VERSION, the plant parameter dicts, the demand
+# and renewable series, alpha, lambda, the backend with its solver parameters
+# and the build/presolve options. Reruns with the same inputs read the
+# objective, the solution arrays and the solve statistics from disk; changing
+# one scenario changes only the keys of that scenario's points.
+#
+# Only points with a solution are cached: a NaN objective (infeasible, time
+# limit) may not be the final answer, so it is solved again next time (and
+# NaN entries of older caches are ignored).
+#
+# Entries are .npz files in one directory. Reading an entry touches its
+# modification time. The cache keeps a running total of its size (scanned
+# once, then updated on every put) and only when it passes max_bytes lists
+# the directory and deletes the least recently used entries, down to
+# EVICT_TO * max_bytes.
+#
+# The settings in the key are resolved first (solve_settings): the backend
+# default_backend() picks and, with solver_params=None, that backend's
+# DEFAULT_PARAMS, so a change of the defaults also changes the keys. Handles
+# that do not affect the result (env) are left out; any other option must be
+# JSON-serialisable.
+#
+# Bump MODEL_VERSION whenever a change to the builders changes solutions.
+
+MODEL_VERSION = 1
+DEFAULT_CACHE_DIR = ".solve_cache"
+UNHASHED_OPTIONS = ("env",)
+EVICT_TO = 0.9    # fraction of max_bytes left after an eviction
+
+
+def _canonical(value):
+    """JSON-serialisable form with sorted keys; arrays and series become lists of floats."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (np.integer, np.floating)):
+        return value.item()
+    return value
+
+
+def solve_settings(options):
+    """ParametricModel options as they enter a cache key: backend and solver_params resolved."""
+    settings = {k: v for k, v in options.items() if k not in UNHASHED_OPTIONS}
+    settings["backend"] = settings.get("backend") or default_backend()
+    if settings.get("solver_params") is None:
+        settings["solver_params"] = DEFAULT_PARAMS[settings["backend"]]
+    for key, value in settings.items():
+        try:
+            json.dumps(_canonical(value))
+        except TypeError:
+            raise TypeError(f"Option {key!r} cannot be part of a cache key: {value!r}") from None
+    return settings
+
+
+def cache_key(formulation, params, d, p_RE, alpha, lam, settings=None):
+    """sha256 hex digest identifying one (instance, alpha, lambda, solver settings) point."""
+    T = len(d)
+    payload = {"formulation": formulation, "version": MODEL_VERSION,
+               "params": _canonical(params), "alpha": float(alpha), "lam": float(lam),
+               "settings": _canonical(settings or {})}
+    h = hashlib.sha256(json.dumps(payload, sort_keys=True).encode())
+    h.update(as_series(d, T).tobytes())
+    h.update(as_series(p_RE, T).tobytes())
+    return h.hexdigest()
+
+
+def sweep_key(formulation, params, scenarios, settings=None):
+    """sha256 hex digest of a whole sweep's inputs; scenarios maps a name to (d, p_RE)."""
+    payload = {"formulation": formulation, "version": MODEL_VERSION, "params": _canonical(params),
+               "scenarios": sorted(scenarios), "settings": _canonical(settings or {})}
+    h = hashlib.sha256(json.dumps(payload, sort_keys=True).encode())
+    for name in sorted(scenarios):
+        d, p_RE = scenarios[name]
+        T = len(d)
+        h.update(as_series(d, T).tobytes())
+        h.update(as_series(p_RE, T).tobytes())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Directory of .npz entries {objective, solution arrays, stats} with LRU eviction."""
+
+    def __init__(self, path=DEFAULT_CACHE_DIR, max_bytes=500 * 2**20):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._size = None
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, key):
+        return os.path.join(self.path, key + ".npz")
+
+    def get(self, key):
+        """Return (objective, values, stats) or None if the key is not cached."""
+        file = self._file(key)
+        try:
+            with np.load(file) as entry:
+                obj = float(entry["objective"])
+                if np.isnan(obj):
+                    return None
+                values = {k[4:]: entry[k] for k in entry.files if k.startswith("val_")}
+                stats = {k[5:]: entry[k].item() for k in entry.files if k.startswith("stat_")}
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+        os.utime(file)
+        return obj, values, stats
+
+    def put(self, key, obj, values=None, stats=None):
+        """Store a solved point; points without a solution (NaN objective) are not cached."""
+        if np.isnan(obj):
+            return
+        arrays = {"objective": np.float64(obj)}
+        arrays.update({"val_" + k: np.asarray(v) for k, v in (values or {}).items()})
+        arrays.update({"stat_" + k: np.asarray(v) for k, v in (stats or {}).items()})
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        if self._size is None:
+            self._size = self._scan_size()
+        try:
+            self._size -= os.path.getsize(self._file(key))
+        except OSError:
+            pass
+        self._size += os.path.getsize(tmp)
+        os.replace(tmp, self._file(key))
+        if self._size > self.max_bytes:
+            self.evict(EVICT_TO * self.max_bytes)    # headroom, so the next puts do not rescan
+
+    def _scan_size(self):
+        return sum(os.path.getsize(os.path.join(self.path, name))
+                   for name in os.listdir(self.path) if name.endswith(".npz"))
+
+    def evict(self, target=None):
+        """Delete least recently used entries until the cache fits in target (default max_bytes)."""
+        target = self.max_bytes if target is None else target
+        entries = []
+        for name in os.listdir(self.path):
+            if name.endswith(".npz"):
+                st = os.stat(os.path.join(self.path, name))
+                entries.append((st.st_mtime, st.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= target:
+                break
+            os.remove(os.path.join(self.path, name))
+            total -= size
+        self._size = total
+
+    def clear(self):
+        for name in os.listdir(self.path):
+            if name.endswith(".npz"):
+                os.remove(os.path.join(self.path, name))
+        self._size = 0
+
+
+class CachedModel:
+    """ParametricModel interface (set_alpha/set_lambda/solve/values) backed by a ResultCache.
+
+    The underlying ParametricModel is only built when a point is not cached.
+    """
+
+    def __init__(self, formulation, params, d, p_RE=None, alpha=0.0, lam=10, cache=None, **options):
+        self.formulation = formulation
+        self.params = params
+        self.d = d
+        self.p_RE = p_RE
+        self.alpha = alpha
+        self.lam = lam
+        self.cache = ResultCache() if cache is None else cache
+        self.options = options
+        self.settings = solve_settings(options)
+        self.model = None
+        self._values = None
+        self.stats = {}
+        self.hits = 0
+        self.misses = 0
+
+    def set_alpha(self, alpha):
+        self.alpha = alpha
+
+    def set_lambda(self, lam):
+        self.lam = lam
+
+    def set_renewables(self, p_RE):
+        self.p_RE = p_RE
+        if self.model is not None:
+            self.model.set_renewables(p_RE)
+
+    def solve(self):
+        """Cached objective of the current point, solving and storing it on a miss."""
+        key = cache_key(self.formulation, self.params, self.d, self.p_RE, self.alpha, self.lam,
+                        self.settings)
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.hits += 1
+            obj, self._values, self.stats = entry
+            return obj
+        self.misses += 1
+        if self.model is None:
+            self.model = ParametricModel(self.formulation, self.params, self.d, self.p_RE,
+                                         alpha=self.alpha, lam=self.lam, **self.options)
+        if self.model.alpha != self.alpha:
+            self.model.set_alpha(self.alpha)
+        if self.model.lam != self.lam:
+            self.model.set_lambda(self.lam)
+        obj = self.model.solve()
+        self._values = self.model.values()
+        self.stats = {"runtime": self.model.model.runtime, "node_count": self.model.model.node_count}
+        self.cache.put(key, obj, self._values, self.stats)
+        return obj
+
+    def values(self):
+        """Solution arrays of the last solve() (NaN if it had no solution)."""
+        return self._values
+
+    def dispose(self):
+        if self.model is not None:
+            self.model.dispose()
@@ -0,0 +1,180 @@
+import json
+import os
+
+import numpy as np
+
+# ===========================================================
+# COLUMNAR STORE OF SWEEP RESULTS
+# ===========================================================
+# Sweep results as dense typed arrays instead of object matrices of lists:
+#   - x, s                 float32, (alpha, lambda, plant, t) and (alpha, lambda, t)
+#   - u, v, w (or o)       int8, (alpha, lambda, plant, t); -1 where there is no solution
+#   - objective            float64, (alpha, lambda); NaN if infeasible or not solved
+#   - runtime, node_count  float32 / int32 solve statistics, (alpha, lambda)
+#   - solved               int8 mask of the points written with a solution; points
+#                          without one (NaN objective) are solved again on a rerun
+# Every scenario is one chunk of .npy files created with open_memmap, so
+# results are written in place as points finish, adding a scenario appends a
+# chunk without rewriting the others, and readers memory-map only the arrays
+# they slice. (.npz archives are zip files and cannot be memory-mapped.)
+# meta.json holds the alpha/lambda grids, the sizes, the scenario order and an
+# optional key of the inputs the results were computed from (e.g.
+# result_cache.sweep_key); open_or_create() refuses a store whose key differs,
+# so results of an older model or data are never reused silently.
+# stack() gives the full (scenario, alpha, lambda, ...) tensor of one field.
+#
+# to_parquet() exports the scalar tables with pandas (and pyarrow) if installed.
+
+META_FILE = "meta.json"
+MISSING = -1
+SCALARS = {"objective": np.float64, "runtime": np.float32, "node_count": np.int32, "solved": np.int8}
+
+
+class ResultStore:
+    """Directory of per-scenario chunks of memory-mapped result arrays."""
+
+    def __init__(self, path, meta, mode="r"):
+        self.path = path
+        self.meta = meta
+        self.mode = mode
+        self._chunks = {}
+
+    @classmethod
+    def create(cls, path, alpha_vec, lambda_vec, n, T, binaries=("u", "v", "w"), scenarios=(), key=None):
+        """New empty store; scenarios can be given now or appended with add_scenario()."""
+        if os.path.exists(os.path.join(path, META_FILE)):
+            raise FileExistsError(f"A result store already exists in {path}")
+        os.makedirs(path, exist_ok=True)
+        meta = {"alpha": [float(a) for a in alpha_vec], "lambda": [float(lam) for lam in lambda_vec],
+                "n": int(n), "T": int(T), "binaries": list(binaries), "scenarios": [],
+                "key": key}
+        store = cls(path, meta, mode="r+")
+        for name in scenarios:
+            store.add_scenario(name)
+        store._save_meta()
+        return store
+
+    @classmethod
+    def open(cls, path, mode="r"):
+        """Existing store; mode "r" memory-maps read-only, "r+" allows writing."""
+        with open(os.path.join(path, META_FILE)) as f:
+            return cls(path, json.load(f), mode)
+
+    @classmethod
+    def open_or_create(cls, path, alpha_vec, lambda_vec, n, T, binaries=("u", "v", "w"), key=None):
+        """Open the store in path for writing, creating it if needed; the grids and the key must match."""
+        if not os.path.exists(os.path.join(path, META_FILE)):
+            return cls.create(path, alpha_vec, lambda_vec, n, T, binaries, key=key)
+        store = cls.open(path, mode="r+")
+        if (not np.allclose(store.alpha_vec, alpha_vec) or not np.allclose(store.lambda_vec, lambda_vec)
+                or (store.meta["n"], store.meta["T"]) != (n, T) or store.meta["binaries"] != list(binaries)):
+            raise ValueError(f"The result store in {path} was created for a different grid")
+        if store.meta.get("key") != key:
+            raise ValueError(f"The result store in {path} was created from different inputs "
+                             f"(key {store.meta.get('key')}, expected {key})")
+        return store
+
+    # -------------------------------
+    # layout
+    # -------------------------------
+    @property
+    def alpha_vec(self):
+        return self.meta["alpha"]
+
+    @property
+    def lambda_vec(self):
+        return self.meta["lambda"]
+
+    @property
+    def scenarios(self):
+        return list(self.meta["scenarios"])
+
+    def _shapes(self):
+        A, L = len(self.alpha_vec), len(self.lambda_vec)
+        n, T = self.meta["n"], self.meta["T"]
+        shapes = {"x": ((A, L, n, T), np.float32), "s": ((A, L, T), np.float32)}
+        shapes.update({family: ((A, L, n, T), np.int8) for family in self.meta["binaries"]})
+        shapes.update({field: ((A, L), dtype) for field, dtype in SCALARS.items()})
+        return shapes
+
+    def _file(self, k, field):
+        return os.path.join(self.path, f"{k:03d}_{field}.npy")
+
+    def _save_meta(self):
+        tmp = os.path.join(self.path, META_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.meta, f, indent=1)
+        os.replace(tmp, os.path.join(self.path, META_FILE))
+
+    def add_scenario(self, name):
+        """Append an empty chunk for scenario `name`; returns its index."""
+        if name in self.meta["scenarios"]:
+            raise ValueError(f"Scenario {name!r} is already in the store")
+        k = len(self.meta["scenarios"])
+        for field, (shape, dtype) in self._shapes().items():
+            arr = np.lib.format.open_memmap(self._file(k, field), mode="w+", dtype=dtype, shape=shape)
+            if field != "solved":
+                arr[...] = np.nan if np.issubdtype(dtype, np.floating) else MISSING
+            arr.flush()
+        self.meta["scenarios"].append(name)
+        self._save_meta()
+        return k
+
+    def scenario(self, name):
+        """{field: memory-mapped array} of one scenario, indexed (alpha, lambda, ...)."""
+        if name not in self._chunks:
+            k = self.meta["scenarios"].index(name)
+            self._chunks[name] = {field: np.load(self._file(k, field), mmap_mode=self.mode)
+                                  for field in self._shapes()}
+        return self._chunks[name]
+
+    # -------------------------------
+    # writing
+    # -------------------------------
+    def write(self, scenario, i_alpha, i_lambda, obj, values, stats=None):
+        """Store one solved point; values is the {family: (T, n) array, s: (T,)} dict of values()."""
+        chunk = self.scenario(scenario)
+        chunk["objective"][i_alpha, i_lambda] = obj
+        chunk["x"][i_alpha, i_lambda] = values["x"].T
+        chunk["s"][i_alpha, i_lambda] = values["s"]
+        for family in self.meta["binaries"]:
+            b = values[family].T
+            chunk[family][i_alpha, i_lambda] = np.where(np.isnan(b), MISSING, np.rint(np.nan_to_num(b)))
+        stats = stats or {}
+        if "runtime" in stats:
+            chunk["runtime"][i_alpha, i_lambda] = stats["runtime"]
+        if "node_count" in stats:
+            chunk["node_count"][i_alpha, i_lambda] = stats["node_count"]
+        chunk["solved"][i_alpha, i_lambda] = np.isfinite(obj)
+
+    def is_solved(self, scenario, i_alpha, i_lambda):
+        """True if the point was written with a solution (a finite objective)."""
+        chunk = self.scenario(scenario)
+        return bool(chunk["solved"][i_alpha, i_lambda] and np.isfinite(chunk["objective"][i_alpha, i_lambda]))
+
+    def flush(self):
+        for chunk in self._chunks.values():
+            for arr in chunk.values():
+                if isinstance(arr, np.memmap):
+                    arr.flush()
+
+    # -------------------------------
+    # reading
+    # -------------------------------
+    def stack(self, field, scenarios=None):
+        """Array of one field over scenarios, indexed (scenario, alpha, lambda, ...)."""
+        return np.stack([self.scenario(s)[field] for s in (scenarios or self.scenarios)])
+
+    def table(self):
+        """Scalar results as flat columns, one row per (scenario, alpha, lambda)."""
+        S, A, L = len(self.scenarios), len(self.alpha_vec), len(self.lambda_vec)
+        i_s, i_a, i_l = np.unravel_index(np.arange(S * A * L), (S, A, L))
+        columns = {"scenario": np.array(self.scenarios, dtype=object)[i_s],
+                   "alpha": np.array(self.alpha_vec)[i_a], "lam": np.array(self.lambda_vec)[i_l]}
+        columns.update({field: self.stack(field).ravel() for field in SCALARS})
+        return columns
+
+    def to_parquet(self, file):
+        """Write table() to a Parquet file (needs pandas with pyarrow or fastparquet)."""
+        import pandas as pd
+        pd.DataFrame(self.table()).to_parquet(file, index=False)
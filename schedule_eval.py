@@ -0,0 +1,130 @@
+import numpy as np
+
+from dispatch import FEASIBILITY_TOL, MeritOrder
+from plant_data import initial_state
+
+# ===========================================================
+# VECTORISED SCHEDULE EVALUATION AND FEASIBILITY CHECKS
+# ===========================================================
+# Checks commitment matrices u (..., T, n) against the rules of the
+# formulations without building a model:
+#   - forced:   periods t <= T_init[i] in which u differs from the initial
+#               state u0[i] (the T_init periods of plant_data.initial_state),
+#   - min_up:   every on-run that starts with a startup inside the horizon
+#               lasts at least L[i] periods, or until T,
+#   - min_down: the same for off-runs after a shutdown, with l[i].
+# The runs come from a run-length encoding of all (schedule, plant) rows at
+# once. Runs that continue the initial state are covered by `forced`, so
+# every violation is counted once. Violations are the missing periods per
+# plant (0 = feasible).
+#
+# With x, the bounds q[i] u <= x <= Q[i] u are checked (total violation per
+# plant; trivial plants only need x <= Q). With net demand, x and s come
+# from the merit-order dispatch (dispatch.py) unless x is given, and the
+# startup, no-load and dispatch costs are returned; s must then match
+# x.sum - net (the Demand/Excess rows). validate() applies all checks to a
+# solver's values() dict.
+
+
+def run_lengths(u):
+    """Run-length encoding of the rows of a 0/1 array (M, T).
+
+    Returns (row, start, length, value) arrays with one entry per run.
+    """
+    M, T = u.shape
+    starts = np.ones((M, T), dtype=bool)
+    starts[:, 1:] = u[:, 1:] != u[:, :-1]
+    flat = np.flatnonzero(starts)
+    length = np.diff(np.r_[flat, M * T])
+    row, start = np.divmod(flat, T)   # every row starts a run, so runs end at row ends
+    return row, start, length, u.reshape(-1)[flat]
+
+
+class ScheduleChecker:
+    """Feasibility checks and costs of commitment schedules for one set of plants."""
+
+    def __init__(self, params, trivial=None):
+        n = len(params["q"])
+        self.n = n
+        self.L, self.l = (np.array([params[key][i] for i in range(n)], dtype=int) for key in ("L", "l"))
+        u0, T_init = initial_state(params)
+        self.u0 = np.array([u0[i] for i in range(n)], dtype=np.int8)
+        self.T_init = np.array([T_init[i] for i in range(n)], dtype=int)
+        self.merit = MeritOrder(params, trivial)
+        self.trivial = self.merit.trivial
+
+    def transitions(self, u):
+        """(startups, shutdowns) per plant, (..., n)."""
+        u = np.asarray(u, dtype=np.int8)
+        prev = np.concatenate([np.broadcast_to(self.u0, u.shape[:-2] + (1, self.n)), u[..., :-1, :]], axis=-2)
+        return (u > prev).sum(axis=-2), (u < prev).sum(axis=-2)
+
+    def violations(self, u):
+        """{"forced", "min_up", "min_down"}: missing periods per plant, (..., n)."""
+        u = np.rint(np.asarray(u)).astype(np.int8)
+        T = u.shape[-2]
+        batch = u.shape[:-2]
+        t = np.arange(1, T + 1)[:, None]
+        forced = ((t <= self.T_init) & (u != self.u0)).sum(axis=-2)
+
+        rows = np.moveaxis(u, -1, -2).reshape(-1, T)           # (... * n, T)
+        plant = np.arange(rows.shape[0]) % self.n
+        row, start, length, value = run_lengths(rows)
+        p = plant[row]
+        switched = (start > 0) | (value != self.u0[p])         # the run begins with a startup/shutdown
+        required = np.where(value == 1, self.L[p], self.l[p])
+        deficit = np.where(switched & (start + length < T), np.maximum(required - length, 0), 0)
+        deficit[self.trivial[p]] = 0
+        min_up = np.bincount(row, weights=deficit * (value == 1), minlength=rows.shape[0])
+        min_down = np.bincount(row, weights=deficit * (value == 0), minlength=rows.shape[0])
+        return {"forced": forced,
+                "min_up": min_up.reshape(batch + (self.n,)).astype(int),
+                "min_down": min_down.reshape(batch + (self.n,)).astype(int)}
+
+    def bound_violations(self, u, x):
+        """Total violation of q u <= x <= Q u per plant, (..., n)."""
+        u = np.asarray(u, dtype=float)
+        merit = self.merit
+        upper = np.where(self.trivial, merit.Q, merit.Q * u)
+        lower = np.where(self.trivial, 0.0, merit.q * u)
+        return (np.maximum(x - upper, 0.0) + np.maximum(lower - x, 0.0)).sum(axis=-2)
+
+    def evaluate(self, u, net=None, lam=None, x=None, s=None, tol=FEASIBILITY_TOL):
+        """Counts, violations and (with net and lam) costs of schedules u (..., T, n).
+
+        Without x the dispatch is the merit order; with x (and s) they are checked as given.
+        "feasible" is True where every check passes.
+        """
+        u = np.rint(np.asarray(u, dtype=float))
+        report = self.violations(u)
+        report["startups"], report["shutdowns"] = self.transitions(u)
+        feasible = np.all([report[key] == 0 for key in ("forced", "min_up", "min_down")], axis=(0, -1))
+        if x is None and net is not None:
+            x, s, shortfall = self.merit.dispatch(u, net)
+            report["shortfall"] = shortfall.sum(axis=-1)
+            feasible &= report["shortfall"] <= tol
+        if x is not None and s is None and net is not None:
+            s = x.sum(axis=-1) - net
+        if x is not None:
+            report["bounds"] = self.bound_violations(u, x)
+            feasible &= np.all(report["bounds"] <= tol, axis=-1)
+            if net is not None and s is not None:
+                report["balance"] = np.abs(x.sum(axis=-1) - s - net).max(axis=-1)
+                feasible &= (report["balance"] <= tol) & np.all(np.asarray(s) >= -tol, axis=-1)
+        if net is not None and lam is not None:
+            merit = self.merit
+            report["startup_cost"] = merit.startups(u).sum(axis=-2) @ merit.c_SU
+            report["no_load_cost"] = u.sum(axis=-2) @ merit.c_NL
+            report["dispatch_cost"] = (x @ merit.c_var).sum(axis=-1) + lam * np.asarray(s).sum(axis=-1)
+            report["cost"] = report["startup_cost"] + report["no_load_cost"] + report["dispatch_cost"]
+        report["x"], report["s"] = x, s
+        report["feasible"] = feasible
+        return report
+
+
+def validate(values, params, net, lam, trivial=None, tol=1e-5):
+    """Independent check of a solver's values() dict; returns the evaluate() report."""
+    x, s = values["x"], values["s"]
+    report = ScheduleChecker(params, trivial).evaluate(values["u"], net, lam, x, s, tol)
+    report["feasible"] &= np.all(np.abs(values["u"] - np.rint(values["u"])) <= tol)
+    return report
@@ -0,0 +1,66 @@
+import numpy as np
+
+from backends import GUROBI, default_backend
+from model_builder import FORM2
+from parametric import ParametricModel, grid_order
+
+# ===========================================================
+# LP-RELAXATION SCREENING OF THE SWEEP GRID
+# ===========================================================
+# The continuous relaxation of Form2 (the tighter of the two formulations)
+# gives a lower bound on the MIP cost at every (alpha, lambda) point. One
+# relaxed ParametricModel per scenario walks the grid in serpentine order, so
+# with Gurobi each point is a few dual simplex iterations from the previous
+# basis. The bound matrices have the shape of obj_values_matrix and serve as
+# approximate heatmaps.
+#
+# screened_sweep() uses them to order the exact MIP solves per lambda by
+# increasing bound and, with skip=True, leaves out points whose bound already
+# exceeds the best MIP cost found for that lambda: they cannot be the
+# cheapest alpha.
+
+LP_PARAMS = {GUROBI: {"OutputFlag": 0, "Method": 1}}
+
+
+def lp_bounds(params, d, p_RE, alpha_vec, lambda_vec, formulation=FORM2, env=None, **options):
+    """Lower-bound matrix (len(lambda_vec) x len(alpha_vec)) from the LP relaxation."""
+    backend = options.pop("backend", None) or default_backend()
+    pm = ParametricModel(formulation, params, d, p_RE, env=env, backend=backend, relax=True,
+                         solver_params=LP_PARAMS.get(backend), **options)
+    bounds = np.zeros((len(lambda_vec), len(alpha_vec)))
+    for i_lambda, i_alpha in grid_order(len(lambda_vec), len(alpha_vec), serpentine=True):
+        if alpha_vec[i_alpha] != pm.alpha:
+            pm.set_alpha(alpha_vec[i_alpha])
+        if lambda_vec[i_lambda] != pm.lam:
+            pm.set_lambda(lambda_vec[i_lambda])
+        bounds[i_lambda, i_alpha] = pm.solve()
+    pm.dispose()
+    return bounds
+
+
+def screened_sweep(formulation, params, d, p_RE, alpha_vec, lambda_vec, bounds=None, skip=True,
+                   env=None, **options):
+    """MIP objective matrix solved in order of increasing LP bound per lambda.
+
+    With skip=True, points whose bound is above the best objective of their lambda row are
+    not solved and stay NaN; the row minimum (cheapest alpha) is still exact.
+    Returns (obj_values_matrix, bounds, number of MIP solves).
+    """
+    if bounds is None:
+        bounds = lp_bounds(params, d, p_RE, alpha_vec, lambda_vec, env=env,
+                           backend=options.get("backend"))
+    pm = ParametricModel(formulation, params, d, p_RE, env=env, **options)
+    obj_values_matrix = np.full((len(lambda_vec), len(alpha_vec)), np.nan)
+    solves = 0
+    for i_lambda, lam in enumerate(lambda_vec):
+        pm.set_lambda(lam)
+        best = np.inf
+        for i_alpha in np.argsort(bounds[i_lambda], kind="stable"):
+            if skip and bounds[i_lambda, i_alpha] > best * (1 + 1e-9):
+                break
+            pm.set_alpha(alpha_vec[i_alpha])
+            obj_values_matrix[i_lambda, i_alpha] = pm.solve()
+            solves += 1
+            best = min(best, obj_values_matrix[i_lambda, i_alpha])
+    pm.dispose()
+    return obj_values_matrix, bounds, solves
@@ -0,0 +1,73 @@
+import numpy as np
+
+# ===========================================================
+# SOLUTION ARRAYS AND VECTORISED KPIs
+# ===========================================================
+# A Solution holds the values of one solve as arrays: (T, n) for the plant
+# families (u, o/v, w, x) and (T,) for s. They come from a single bulk read of
+# the solution vector (ParametricModel.values() slices it by var_blocks), so no
+# per-variable attribute is read.
+#
+# The KPIs are NumPy reductions over the time axis, so the same code works on
+# a batch: arrays with leading axes, e.g. (alpha, lambda, T, n) from a
+# ResultStore chunk (from_store), give KPI arrays with those leading axes.
+# A point without a solution (NaN objective) has zero KPIs, as in the scripts.
+
+
+class Solution:
+    """Objective and solution arrays of one solve (or a batch) with KPI reductions."""
+
+    def __init__(self, objective, values):
+        self.objective = np.asarray(objective, dtype=float)
+        self.values = values
+        self.solved = ~np.isnan(self.objective)
+
+    @classmethod
+    def from_model(cls, model, objective):
+        """Solution of the last solve of a ParametricModel (or CachedModel)."""
+        return cls(objective, model.values())
+
+    @classmethod
+    def from_store(cls, store, scenario):
+        """Batch Solution of a ResultStore scenario, indexed (alpha, lambda, T, n)."""
+        chunk = store.scenario(scenario)
+        values = {family: np.swapaxes(chunk[family], -1, -2) for family in ["x"] + store.meta["binaries"]}
+        values["s"] = chunk["s"]
+        return cls(chunk["objective"], values)
+
+    def _mask(self, kpi, axes):
+        """Zero the KPI of unsolved points; axes is the number of trailing per-point axes."""
+        return np.where(self.solved.reshape(self.solved.shape + (1,) * axes), kpi, 0)
+
+    @property
+    def startup_family(self):
+        return "v" if "v" in self.values else "o"
+
+    @property
+    def on(self):
+        """Boolean (..., T, n) commitment (u >= 0.5)."""
+        return np.nan_to_num(self.values["u"]) >= 0.5
+
+    def total_excess(self):
+        return self._mask(np.nan_to_num(self.values["s"]).sum(axis=-1), 0)
+
+    def periods_on(self):
+        """Periods on per plant, (..., n)."""
+        return self._mask(self.on.sum(axis=-2), 1)
+
+    def production(self):
+        """Total production per plant over the periods it is on, (..., n)."""
+        return self._mask(np.where(self.on, np.nan_to_num(self.values["x"]), 0.0).sum(axis=-2), 1)
+
+    def startup_counts(self):
+        """Number of startups per plant, (..., n)."""
+        return self._mask((np.nan_to_num(self.values[self.startup_family]) >= 0.5).sum(axis=-2), 1)
+
+    def series(self, plant, family="x"):
+        """Time series of one plant, (..., T); NaN of unsolved points become 0."""
+        return np.nan_to_num(self.values[family][..., plant])
+
+    def kpis(self):
+        return {"objective": self.objective, "total_excess": self.total_excess(),
+                "periods_on": self.periods_on(), "production": self.production(),
+                "startup_counts": self.startup_counts()}
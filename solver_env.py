@@ -0,0 +1,72 @@
+# ===========================================================
+# SHARED GUROBI ENVIRONMENT
+# ===========================================================
+# gp.Model(...) without an env argument uses gurobipy's implicit default
+# environment, and scripts that create a gp.Env() of their own pay for a
+# second licence check. Here one environment per process is started on first
+# use, with the output and thread settings in one place, and handed to every
+# model (backends.GurobiModel uses it unless an env is passed explicitly).
+#
+# gurobipy itself is only imported when an environment is first requested, so
+# importing this module (or the model builders) stays cheap. licence_status()
+# also catches the size-limited licence of the pip wheel, with which the env
+# starts fine but every full-size model fails.
+
+ENV_PARAMS = {"OutputFlag": 0, "Threads": 0}
+SIZE_PROBE = 2001    # one variable above the size limit of the restricted licence
+
+_env = None
+_licence = None
+
+
+def get_env(**params):
+    """Return the process-wide gp.Env, starting it on first use with ENV_PARAMS updated by params.
+
+    Parameters passed after the environment has been started are applied to it.
+    """
+    global _env
+    import gurobipy as gp
+
+    if _env is None:
+        env = gp.Env(empty=True)
+        for key, value in {**ENV_PARAMS, **params}.items():
+            env.setParam(key, value)
+        env.start()
+        _env = env
+    else:
+        for key, value in params.items():
+            _env.setParam(key, value)
+    return _env
+
+
+def dispose_env():
+    """Release the shared environment (and its licence token)."""
+    global _env
+    if _env is not None:
+        _env.dispose()
+        _env = None
+
+
+def licence_status():
+    """Return (ok, message) for the Gurobi installation and licence, without raising.
+
+    A size-limited licence (the one shipped with the pip wheel) is reported as not ok:
+    a model with SIZE_PROBE variables is optimised once per process to detect it.
+    """
+    global _licence
+    if _licence is not None:
+        return _licence
+    try:
+        import gurobipy as gp
+    except ImportError:
+        return False, "gurobipy is not installed"
+    try:
+        probe = gp.Model(env=get_env())
+        probe.addVars(SIZE_PROBE)
+        probe.optimize()
+        probe.dispose()
+    except gp.GurobiError as e:
+        _licence = False, f"License issue {e}"
+    else:
+        _licence = True, "Gurobi version: {}.{}.{}; license is valid".format(*gp.gurobi.version())
+    return _licence
@@ -0,0 +1,243 @@
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+from scipy.optimize import minimize
+
+from parametric import ParametricModel
+from plant_data import as_series
+from solution import Solution
+
+# ===========================================================
+# GAUSSIAN-PROCESS SURROGATE OF THE SWEEP WITH ACTIVE LEARNING
+# ===========================================================
+# Solved points of the (scenario, alpha, lambda) grid train one Gaussian
+# process per target: the objective, total excess and the production of every
+# plant (Solution KPIs). The inputs are log10(lambda), alpha and summary
+# statistics of the scenario's net demand d - alpha * p_RE (mean, std, min,
+# max, mean shortfall below zero, mean absolute hour-to-hour change) and of
+# p_RE itself, so a GP fitted on some renewable profiles also predicts others.
+#
+# The GP uses an anisotropic squared-exponential kernel with a noise term on
+# standardised inputs and targets; its hyperparameters maximise the log
+# marginal likelihood (L-BFGS-B from a few starts; a refit starts from the
+# previous hyperparameters). Predictions come with a standard deviation.
+#
+# active_sweep() starts from a small space-filling design, then repeatedly
+# solves the grid point whose predicted objective is most uncertain (relative
+# to the objective's scale) until the budget is spent or the largest
+# standard deviation drops below std_tol. Points without a solution (NaN
+# objective: infeasible or a time limit) count against the budget but are
+# recorded as failed and never enter the training targets. The result fills
+# every grid point: exact values where solved (std 0), NaN where the solve
+# failed, GP predictions with error bars elsewhere.
+
+FEATURES = ("log_lambda", "alpha", "net_mean", "net_std", "net_min", "net_max",
+            "surplus_mean", "net_ramp", "re_mean", "re_std")
+
+
+def features(alpha, lam, d, p_RE):
+    """Feature vector of one (alpha, lambda) point of a scenario, in the order of FEATURES."""
+    d = np.asarray(d, dtype=float)
+    p_RE = np.asarray(p_RE, dtype=float)
+    net = d - alpha * p_RE
+    return np.array([np.log10(lam), alpha, net.mean(), net.std(), net.min(), net.max(),
+                     np.maximum(-net, 0.0).mean(), np.abs(np.diff(net)).mean() if len(net) > 1 else 0.0,
+                     p_RE.mean(), p_RE.std()])
+
+
+class GaussianProcess:
+    """Single-output GP regression with an anisotropic RBF kernel and learned noise."""
+
+    def __init__(self, restarts=3, seed=0):
+        self.restarts = restarts
+        self.rng = np.random.default_rng(seed)
+
+    def _kernel(self, A, B, log_ell, log_sf):
+        diff = (A[:, None, :] - B[None, :, :]) / np.exp(log_ell)
+        return np.exp(2 * log_sf - 0.5 * np.sum(diff**2, axis=-1))
+
+    def _nll(self, theta, X, y):
+        k = X.shape[1]
+        log_ell, log_sf, log_sn = theta[:k], theta[k], theta[k + 1]
+        K = self._kernel(X, X, log_ell, log_sf) + (np.exp(2 * log_sn) + 1e-8) * np.eye(len(X))
+        try:
+            c = cho_factor(K, lower=True)
+        except np.linalg.LinAlgError:
+            return 1e25
+        a = cho_solve(c, y)
+        return 0.5 * y @ a + np.sum(np.log(np.diag(c[0]))) + 0.5 * len(X) * np.log(2 * np.pi)
+
+    def fit(self, X, y, theta0=None):
+        """Fit to (X, y); theta0 (e.g. a previous fit's theta) replaces the random restarts."""
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.x_mean, self.x_std = X.mean(axis=0), X.std(axis=0)
+        self.x_std[self.x_std == 0] = 1.0
+        self.y_mean, self.y_std = y.mean(), y.std() or 1.0
+        self.X = (X - self.x_mean) / self.x_std
+        y = (y - self.y_mean) / self.y_std
+        k = X.shape[1]
+        bounds = [(-3.0, 4.0)] * k + [(-3.0, 3.0), (-8.0, 1.0)]
+        best = None
+        starts = [theta0] if theta0 is not None else (
+            [np.r_[np.zeros(k), 0.0, -3.0]]
+            + [np.array([self.rng.uniform(lo, hi) for lo, hi in bounds]) for _ in range(self.restarts - 1)])
+        for start in starts:
+            result = minimize(self._nll, start, args=(self.X, y), method="L-BFGS-B", bounds=bounds)
+            if best is None or result.fun < best.fun:
+                best = result
+        self.theta = best.x
+        self.log_ell, self.log_sf, self.log_sn = best.x[:k], best.x[k], best.x[k + 1]
+        K = self._kernel(self.X, self.X, self.log_ell, self.log_sf) \
+            + (np.exp(2 * self.log_sn) + 1e-8) * np.eye(len(self.X))
+        self._chol = cho_factor(K, lower=True)
+        self._alpha = cho_solve(self._chol, y)
+        return self
+
+    def predict(self, X):
+        """(mean, std) at the rows of X, in the units of the training targets."""
+        Xs = (np.asarray(X, dtype=float) - self.x_mean) / self.x_std
+        Ks = self._kernel(Xs, self.X, self.log_ell, self.log_sf)
+        mean = Ks @ self._alpha
+        v = cho_solve(self._chol, Ks.T)
+        var = np.maximum(np.exp(2 * self.log_sf) - np.sum(Ks * v.T, axis=1), 0.0)
+        return self.y_mean + self.y_std * mean, self.y_std * np.sqrt(var)
+
+
+class Surrogate:
+    """One GaussianProcess per target (objective, total_excess, production_<i>)."""
+
+    def __init__(self, restarts=3, seed=0):
+        self.restarts = restarts
+        self.seed = seed
+        self.models = {}
+
+    def fit(self, X, targets):
+        """targets maps a name to an array over the rows of X; NaN rows (no solution) are left out."""
+        for name, y in targets.items():
+            y = np.asarray(y, dtype=float)
+            ok = ~np.isnan(y)
+            previous = self.models.get(name)
+            self.models[name] = GaussianProcess(self.restarts, self.seed).fit(
+                X[ok], y[ok], None if previous is None else previous.theta)
+        return self
+
+    def predict(self, X, target="objective"):
+        return self.models[target].predict(X)
+
+
+class SurrogateSweep:
+    """Grid result of active_sweep(): per scenario (len(lambda_vec) x len(alpha_vec)) matrices."""
+
+    def __init__(self, mean, std, solved, failed, targets, surrogate):
+        self.mean = mean          # {target: {scenario: matrix}}, NaN at failed points
+        self.std = std            # {target: {scenario: matrix}}, 0 at solved and failed points
+        self.solved = solved      # {scenario: bool matrix}
+        self.failed = failed      # {scenario: bool matrix} of solves without a solution
+        self.targets = targets    # exact target values of the solved points
+        self.surrogate = surrogate
+
+    @property
+    def solves(self):
+        """Number of MIP solves, failed ones included."""
+        return int(sum(self.solved[s].sum() + self.failed[s].sum() for s in self.solved))
+
+
+def _initial_design(candidates, X, k, rng):
+    """k grid points by greedy maximin distance in standardised feature space."""
+    Z = (X - X.mean(axis=0)) / np.where(X.std(axis=0) > 0, X.std(axis=0), 1.0)
+    chosen = [int(rng.integers(len(candidates)))]
+    dist = np.linalg.norm(Z - Z[chosen[0]], axis=1)
+    while len(chosen) < min(k, len(candidates)):
+        j = int(np.argmax(dist))
+        chosen.append(j)
+        dist = np.minimum(dist, np.linalg.norm(Z - Z[j], axis=1))
+    return chosen
+
+
+def active_sweep(formulation, params, scenarios, alpha_vec, lambda_vec, budget=40, initial=12,
+                 std_tol=1e-3, refit_every=1, restarts=3, seed=0, env=None, **options):
+    """Solve at most `budget` grid points chosen by active learning and predict the rest.
+
+    scenarios maps a name to (d, p_RE). Points are chosen by the largest predicted objective
+    std relative to the mean absolute objective of the solved points; the loop stops early
+    once that ratio is below std_tol. options go to ParametricModel.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(params["q"])
+    series = {s: (as_series(d, len(d)), as_series(p_RE, len(d))) for s, (d, p_RE) in scenarios.items()}
+    candidates = [(s, i_lambda, i_alpha) for s in scenarios
+                  for i_lambda in range(len(lambda_vec)) for i_alpha in range(len(alpha_vec))]
+    X = np.array([features(alpha_vec[i_alpha], lambda_vec[i_lambda], *series[s])
+                  for s, i_lambda, i_alpha in candidates])
+    names = ["objective", "total_excess"] + [f"production_{i}" for i in range(n)]
+    exact = {}
+    failed = set()
+    models = {}
+
+    def solve(j):
+        s, i_lambda, i_alpha = candidates[j]
+        if s not in models:
+            models[s] = ParametricModel(formulation, params, *series[s], env=env, **options)
+        pm = models[s]
+        pm.set_alpha(alpha_vec[i_alpha])
+        pm.set_lambda(lambda_vec[i_lambda])
+        obj = pm.solve()
+        if np.isnan(obj):
+            failed.add(j)
+            return
+        solution = Solution.from_model(pm, obj)
+        exact[j] = np.r_[solution.objective, solution.total_excess(), solution.production()]
+
+    for j in _initial_design(candidates, X, min(initial, budget, len(candidates)), rng):
+        solve(j)
+    surrogate = Surrogate(restarts, seed)
+    fitted_at = None
+    while True:
+        rows = sorted(exact)
+        attempted = rows + sorted(failed)
+        if len(attempted) >= min(budget, len(candidates)):
+            break
+        if not rows:    # nothing to fit yet: try further random points
+            solve(int(rng.choice(np.setdiff1d(np.arange(len(candidates)), attempted))))
+            continue
+        if fitted_at is None or len(rows) - fitted_at >= refit_every:
+            Y = np.array([exact[j] for j in rows])
+            surrogate.fit(X[rows], {"objective": Y[:, 0]})
+            fitted_at = len(rows)
+        _, std = surrogate.predict(X)
+        std[attempted] = 0.0
+        scale = np.mean(np.abs([exact[j][0] for j in rows]))
+        j = int(np.argmax(std))
+        if std[j] / (scale if scale > 0 else 1.0) < std_tol:
+            break
+        solve(j)
+    for pm in models.values():
+        pm.dispose()
+
+    rows = sorted(exact)
+    if not rows:
+        raise RuntimeError(f"None of the {len(failed)} solved grid points has a solution")
+    Y = np.array([exact[j] for j in rows])
+    surrogate.fit(X[rows], {name: Y[:, k] for k, name in enumerate(names)})
+    shape = (len(lambda_vec), len(alpha_vec))
+    mean = {name: {s: np.zeros(shape) for s in scenarios} for name in names}
+    std = {name: {s: np.zeros(shape) for s in scenarios} for name in names}
+    solved = {s: np.zeros(shape, dtype=bool) for s in scenarios}
+    no_solution = {s: np.zeros(shape, dtype=bool) for s in scenarios}
+    for k, name in enumerate(names):
+        m, sd = surrogate.predict(X, name)
+        for j, (s, i_lambda, i_alpha) in enumerate(candidates):
+            if j in exact:
+                mean[name][s][i_lambda, i_alpha], std[name][s][i_lambda, i_alpha] = exact[j][k], 0.0
+            elif j in failed:
+                mean[name][s][i_lambda, i_alpha], std[name][s][i_lambda, i_alpha] = np.nan, 0.0
+            else:
+                mean[name][s][i_lambda, i_alpha], std[name][s][i_lambda, i_alpha] = m[j], sd[j]
+    for j in exact:
+        s, i_lambda, i_alpha = candidates[j]
+        solved[s][i_lambda, i_alpha] = True
+    for j in failed:
+        s, i_lambda, i_alpha = candidates[j]
+        no_solution[s][i_lambda, i_alpha] = True
+    return SurrogateSweep(mean, std, solved, no_solution, {candidates[j]: dict(zip(names, exact[j])) for j in rows},
+                          surrogate)
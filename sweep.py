@@ -0,0 +1,81 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from backends import GUROBI, default_backend
+from parametric import ParametricModel
+
+# ===========================================================
+# PROCESS-POOL SWEEP OVER (SCENARIO, ALPHA, LAMBDA)
+# ===========================================================
+# One task is one (scenario, alpha) pair with all lambda values, so each
+# worker keeps the build-once ParametricModel of every scenario it has seen
+# and only updates its RHS/objective between tasks. Results are yielded as
+# soon as a task finishes.
+#
+# The solver thread count of each worker is cpu_count // workers (at least 1),
+# so workers * threads never exceeds the machine. For Gurobi this is set on
+# the worker's shared environment; HiGHS through scipy solves single-threaded.
+#
+# scenarios maps a name to a (d, p_RE) pair.
+
+_worker = {}
+
+
+def thread_budget(workers):
+    """Solver threads per worker so that workers * threads <= cpu_count."""
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def _init_worker(formulation, params, scenarios, options, threads):
+    _worker.update(formulation=formulation, params=params, scenarios=scenarios,
+                   options=options, models={})
+    if (options.get("backend") or default_backend()) == GUROBI:
+        from solver_env import get_env
+        get_env(Threads=threads)
+
+
+def _solve_point(scenario_name, i_alpha, a, lambda_vec):
+    models = _worker["models"]
+    if scenario_name not in models:
+        d, p_RE = _worker["scenarios"][scenario_name]
+        models[scenario_name] = ParametricModel(_worker["formulation"], _worker["params"], d, p_RE,
+                                                **_worker["options"])
+    model = models[scenario_name]
+    model.set_alpha(a)
+    objectives = []
+    for lam in lambda_vec:
+        model.set_lambda(lam)
+        objectives.append(model.solve())
+    return scenario_name, i_alpha, objectives
+
+
+def iter_sweep(formulation, params, scenarios, alpha_vec, lambda_vec, workers=None, **options):
+    """Yield (scenario_name, i_alpha, [objective per lambda]) in completion order.
+
+    options are passed to ParametricModel (backend, presolve, min_updown, ...).
+    """
+    workers = workers or os.cpu_count() or 1
+    initargs = (formulation, params, scenarios, options, thread_budget(workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        futures = [pool.submit(_solve_point, name, i_alpha, a, list(lambda_vec))
+                   for name in scenarios for i_alpha, a in enumerate(alpha_vec)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_sweep(formulation, params, scenarios, alpha_vec, lambda_vec, workers=None, progress=None,
+              **options):
+    """Objective matrices {scenario_name: (len(lambda_vec) x len(alpha_vec))} from a parallel sweep.
+
+    progress, if given, is called as progress(done, total) after every finished task.
+    """
+    matrices = {name: np.zeros((len(lambda_vec), len(alpha_vec))) for name in scenarios}
+    total = len(scenarios) * len(alpha_vec)
+    for done, (name, i_alpha, objectives) in enumerate(
+            iter_sweep(formulation, params, scenarios, alpha_vec, lambda_vec, workers, **options), 1):
+        matrices[name][:, i_alpha] = objectives
+        if progress is not None:
+            progress(done, total)
+    return matrices
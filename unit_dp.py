@@ -0,0 +1,106 @@
+import numpy as np
+
+from plant_data import initial_state
+
+# ===========================================================
+# EXACT SINGLE-UNIT COMMITMENT BY DYNAMIC PROGRAMMING
+# ===========================================================
+# For hourly prices pi[t] (e.g. demand multipliers), every plant's own problem
+#   min sum_t u[t] (c_NL + (c_var - pi[t]) x[t]) + c_SU * startup[t]
+#   s.t. q u[t] <= x[t] <= Q u[t], min up L / min down l, initial state
+# separates into a choice of x (Q if pi[t] > c_var, else q) and a shortest
+# path over the states (on, k) / (off, k): k periods in that state, capped at
+# L' = max(L, 1) / l' = max(l, 1). A unit may only shut down from (on, L')
+# and start up from (off, l'); during the T_init periods of
+# plant_data.initial_state it has to keep its initial state. Runs may end at
+# the horizon, as in the formulations. The DP is O(T * (L + l)) per unit.
+#
+# Everything is batched: prices (..., T) give results for all plants and all
+# leading price vectors at once, (..., n, T). Each hour is one array step
+# over (batch, states); the trajectory is recovered by a backward pass over
+# stored predecessor flags.
+
+
+def _plant_arrays(params, plants):
+    u0, T_init = initial_state(params)
+    keys = ("q", "Q", "L", "l", "c_SU", "c_NL", "c_var", "U0", "U1")
+    arrays = {key: np.array([params[key][i] for i in plants], dtype=float) for key in keys}
+    arrays["u0"] = np.array([u0[i] for i in plants], dtype=bool)
+    arrays["T_init"] = np.array([T_init[i] for i in plants], dtype=int)
+    return arrays
+
+
+def unit_dp(params, prices, plants=None):
+    """Optimal single-unit schedules; returns (u, x, cost) with shapes (..., n, T), (..., n, T), (..., n).
+
+    prices has shape (T,) or (..., T); plants selects plant indices (default all).
+    cost is the DP objective sum u (c_NL + (c_var - pi) x) + c_SU * startups.
+    """
+    plants = list(range(len(params["q"]))) if plants is None else list(plants)
+    p = _plant_arrays(params, plants)
+    prices = np.asarray(prices, dtype=float)
+    lead, T = prices.shape[:-1], prices.shape[-1]
+    n = len(plants)
+    B = int(np.prod(lead, dtype=int)) * n
+    tile = lambda a: np.tile(a, B // n)                      # per-plant array -> per batch row
+    pi = np.repeat(prices.reshape(-1, T), n, axis=0)       # (B, T)
+
+    margin = tile(p["c_var"])[:, None] - pi
+    x_on = np.where(margin < 0, tile(p["Q"])[:, None], tile(p["q"])[:, None])
+    g = tile(p["c_NL"])[:, None] + margin * x_on           # cost of being on in hour t
+    c_SU = tile(p["c_SU"])
+    Lc = np.maximum(tile(p["L"]), 1).astype(int)
+    lc = np.maximum(tile(p["l"]), 1).astype(int)
+    T_init, u0 = tile(p["T_init"]), tile(p["u0"])
+    cap_on, cap_off = Lc - 1, lc - 1
+    rows = np.arange(B)
+    on_valid = np.arange(Lc.max()) <= cap_on[:, None]
+    off_valid = np.arange(lc.max()) <= cap_off[:, None]
+
+    on = np.full((B, Lc.max()), np.inf)
+    off = np.full((B, lc.max()), np.inf)
+    k_on = np.minimum(np.maximum(tile(p["U1"]), 1), Lc).astype(int) - 1
+    k_off = np.minimum(np.maximum(tile(p["U0"]), 1), lc).astype(int) - 1
+    on[rows[u0], k_on[u0]] = 0.0
+    off[rows[~u0], k_off[~u0]] = 0.0
+
+    stay_on = np.zeros((T, B), dtype=bool)      # capped on-state reached by staying (not by shifting/starting)
+    stay_off = np.zeros((T, B), dtype=bool)
+    for t in range(T):
+        start = off[rows, cap_off] + c_SU
+        stop = on[rows, cap_on]
+        new_on = np.empty_like(on)
+        new_on[:, 0] = start
+        new_on[:, 1:] = on[:, :-1]
+        stay = on[rows, cap_on] <= new_on[rows, cap_on]
+        new_on[rows, cap_on] = np.minimum(new_on[rows, cap_on], on[rows, cap_on])
+        new_off = np.empty_like(off)
+        new_off[:, 0] = stop
+        new_off[:, 1:] = off[:, :-1]
+        stay_f = off[rows, cap_off] <= new_off[rows, cap_off]
+        new_off[rows, cap_off] = np.minimum(new_off[rows, cap_off], off[rows, cap_off])
+        new_on[~on_valid] = np.inf
+        new_off[~off_valid] = np.inf
+        forced = t < T_init
+        new_on[forced & ~u0] = np.inf
+        new_off[forced & u0] = np.inf
+        on, off = new_on + g[:, t:t+1], new_off
+        stay_on[t], stay_off[t] = stay, stay_f
+
+    # backward pass from the cheapest final state
+    best_on, best_off = on.min(axis=1), off.min(axis=1)
+    cost = np.minimum(best_on, best_off)
+    is_on = best_on <= best_off
+    k = np.where(is_on, on.argmin(axis=1), off.argmin(axis=1))
+    u = np.zeros((B, T), dtype=bool)
+    for t in range(T - 1, -1, -1):
+        u[:, t] = is_on
+        cap = np.where(is_on, cap_on, cap_off)
+        stayed = np.where(is_on, stay_on[t], stay_off[t]) & (k == cap)
+        switched = (k == 0) & ~stayed
+        k = np.where(stayed, k, np.where(switched, np.where(is_on, cap_off, cap_on), k - 1))
+        is_on = np.where(switched, ~is_on, is_on)
+
+    shape = lead + (n, T)
+    x = np.where(u, x_on, 0.0)
+    return u.reshape(shape), x.reshape(shape), cost.reshape(lead + (n,))